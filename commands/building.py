@@ -0,0 +1,51 @@
+from evennia import default_cmds
+from gamerules.find import contents_changed
+
+
+class CmdSetAttribute(default_cmds.CmdSetAttribute):
+  # default @set, but tells the object when one of its attributes is
+  # changed or removed, so it can refresh anything derived from it
+  # (keep the default help text)
+  __doc__ = default_cmds.CmdSetAttribute.__doc__
+
+  def _attribute_changed(self, obj, attr):
+    if hasattr(obj, "at_attribute_changed"):
+      # drop any nested key, e.g. magnitudes[8] => magnitudes
+      obj.at_attribute_changed(attr.split("[", 1)[0].strip())
+
+  def set_attr(self, obj, attr, *args, **kwargs):
+    result = super().set_attr(obj, attr, *args, **kwargs)
+    self._attribute_changed(obj, attr)
+    return result
+
+  def rm_attr(self, obj, attr, *args, **kwargs):
+    result = super().rm_attr(obj, attr, *args, **kwargs)
+    self._attribute_changed(obj, attr)
+    return result
+
+
+class _ReindexAfter:
+  # a default command that renames or (un)aliases the object named on
+  # its left-hand side; afterwards, let the object's location reindex
+  # its contents, since names don't change through move_to
+
+  def target_name(self):
+    return self.lhs
+
+  def func(self):
+    name = self.target_name()
+    objs = self.caller.search(name, quiet=True) if name else []
+    super().func()
+    if len(objs) == 1:
+      contents_changed(objs[0].location)
+
+
+class CmdRename(_ReindexAfter, default_cmds.CmdName):
+  __doc__ = default_cmds.CmdName.__doc__
+
+  def target_name(self):
+    return self.lhs_objs[0]["name"] if self.lhs_objs else None
+
+
+class CmdSetObjAlias(_ReindexAfter, default_cmds.CmdSetObjAlias):
+  __doc__ = default_cmds.CmdSetObjAlias.__doc__
@@ -1,6 +1,8 @@
 from commands.command import QueuedCommand
 from evennia.utils import utils
 from gamerules.character_classes import is_valid_character_name
+from gamerules.find import contents_changed
+from world.who_list import who_changed
 
 
 class CmdName(QueuedCommand):
@@ -19,6 +21,8 @@ class CmdName(QueuedCommand):
       self.caller.msg(f"{new_name} is not a valid name.")
       return
     self.account.character.name = new_name
+    contents_changed(self.account.character.location)
+    who_changed(self.account.character)
     self.caller.msg(f"You are now known as {self.account.character.name}.")
 
 
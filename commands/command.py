@@ -291,6 +291,11 @@ def do_next_queued_command(target):
   if target.ndb.command_queue and not target.is_frozen:
     # commands are in queue, so do the next one (FIFO)
     next_command = target.ndb.command_queue.pop()
-    cmdhandler.cmdhandler(target.sessions.get()[0], next_command.raw_string)
+    sessions = target.sessions.get()
+    if sessions:
+      cmdhandler.cmdhandler(sessions[0], next_command.raw_string)
+    else:
+      # no one connected, e.g. a replay (utils/benchmarks/replay.py)
+      target.execute_cmd(next_command.raw_string)
 
 
@@ -1,11 +1,18 @@
 from commands.command import QueuedCommand
-from evennia.objects.models import ObjectDB
+from gamerules.commerce import sell_item
+from gamerules.equipment_effect_kind import EquipmentEffectKind
 from gamerules.find import find_first
+from world.market import MARKET
 
 
 def find_merchant(location):
+  merchant = MARKET.merchant_in(location)
+  if merchant and merchant.location == location:
+    return merchant
+  # e.g. a merchant put here without a move hook
   for obj in location.contents:
     if obj.is_typeclass("typeclasses.merchant.Merchant", exact=False):
+      MARKET.merchant_moved(obj)
       return obj
   return None
 
@@ -30,21 +37,19 @@ class CmdBuy(QueuedCommand):
 
     # does the merchant have that object for sale?
     key = self.args.strip()
-    obj = find_first(merchant, key)
-    if not obj:
+    item = merchant.find_for_sale(key)
+    if not item:
       self.caller.msg("Merchant doesn't have that for sale.")
       return
+    key, price, source = item
 
-    # does the buyer have enough gold?
-    if self.caller.gold < obj.worth:
+    # buy it, if the buyer has enough gold
+    if not self.caller.gain_gold(-price):
       self.caller.msg("You don't have enough gold.")
       return
-
-    # buy it!
-    self.caller.gain_gold(-obj.worth)
-    # copy the object directly into the caller
-    ObjectDB.objects.copy_object(obj, new_key=obj.key, new_location=self.caller)
-    self.caller.msg(f"You buy a {obj.key} for {obj.worth} gold.")
+    # a fresh one goes directly into the caller
+    sell_item(source, self.caller)
+    self.caller.msg(f"You buy a {key} for {price} gold.")
 
 
 class CmdSell(QueuedCommand):
@@ -76,7 +81,7 @@ class CmdSell(QueuedCommand):
     # if not obj.worth:
     #  self.caller.msg("You can't sell that.")
     #  return
-    if obj.db.cursed:
+    if obj.effect(EquipmentEffectKind.CURSED):
       self.caller.msg(f"The {obj.key} is cursed.")
       return   
     if obj.is_typeclass("typeclasses.objects.Gold"):
@@ -89,3 +94,32 @@ class CmdSell(QueuedCommand):
     # TODO: do we want to call obj.at_drop()?
     obj.delete()
 
+
+
+class CmdPrice(QueuedCommand):
+  """Find out which merchants sell something, and for how much.
+
+  Usage:
+    price <item>
+  """
+  key = "price"
+  aliases = ["pri", "pric", "where"]
+  locks = "cmd:all()"
+  help_category = "Monster"
+
+  def check_preconditions(self):
+    if not self.args:
+      self.caller.msg("Usage: price <item>")
+      return False
+
+  def inner_func(self):
+    key = self.args.strip()
+    listings = MARKET.where(key)
+    if not listings:
+      self.caller.msg(f"Nobody is selling {key}.")
+      return
+    table = self.styled_table("|wItem", "|wCost", "|wMerchant", "|wWhere")
+    for item_key, merchant, price in listings:
+      location = merchant.location.key if merchant.location else "None"
+      table.add_row(item_key, price, merchant.key, location)
+    self.caller.msg(f"{table}")
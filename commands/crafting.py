@@ -1,39 +1,47 @@
-from collections import Counter
 from commands.command import QueuedCommand
-from evennia.prototypes import prototypes as protlib, spawner
+from evennia.prototypes import spawner
+from gamerules.crafting import RECIPES
+from gamerules.find import held_counts, held_names, keyed_contents
 
 
+def pick_components(caller, components):
+  """A distinct held object for each component key, in order, or None.
 
-def find_attr_value(prototype, attr_name):
-  for attr in prototype["attrs"]:
-    (name, value, _, _) = attr
-    if name == attr_name:
-      return value
-  return None
-
+  held_counts counts names, so one thing keyed "a" and aliased "b"
+  counts for both; it can only be used up once, though. Things actually
+  called a component are preferred over things merely aliased so.
+  """
+  candidates = []
+  for key in components:
+    lkey = key.lower()
+    exact = [obj for obj in keyed_contents(caller, key) if obj.key.lower() == lkey]
+    aliased = [obj for obj in caller.contents if obj not in exact and lkey in held_names(obj)]
+    candidates.append(exact + aliased)
+  # component index => object, giving earlier components' picks up for
+  # later ones when they have something else to use
+  picked = {}
 
-def has_components(caller, components):
-  # components is a list of keys; turn that into a count
-  component_counts = Counter(components)
-  for key in component_counts.keys():
-    objs = [x for x in caller.contents if x.key == key]
-    if len(objs) < component_counts[key]:
-      return False
-  return True
+  def assign(index, tried):
+    for obj in candidates[index]:
+      if obj.id in tried:
+        continue
+      tried.add(obj.id)
+      holder = next((i for i, other in picked.items() if other == obj), None)
+      if holder is None or assign(holder, tried):
+        picked[index] = obj
+        return True
+    return False
 
+  for index in range(len(components)):
+    if not assign(index, set()):
+      return None
+  return [picked[index] for index in range(len(components))]
 
-def consume_first(caller, key):
-  for obj in caller.contents:
-    # delete first found only
-    if obj.key == key:
-      caller.msg(f"Consuming {obj.key}.")
-      obj.delete()
-      return
 
-
-def consume_components(caller, components):
-  for key in components:
-    consume_first(caller, key)
+def consume_components(caller, objs):
+  for obj in objs:
+    caller.msg(f"Consuming {obj.key}.")
+    obj.delete()
 
 
 class CmdMake(QueuedCommand):
@@ -45,20 +53,41 @@ class CmdMake(QueuedCommand):
     if not self.args:
       self.caller.msg("Make what?")
       return
-    prototypes = protlib.search_prototype(key=self.args.strip())
-    if not prototypes:
-      self.caller.msg("No such object.")
-      return
-    prototype = prototypes[0]
-    components = find_attr_value(prototype, "components")
-    if not components:
+    recipe = RECIPES.find(self.args)
+    if not recipe:
       self.caller.msg("You can't make that.")
       return
-    if not has_components(self.caller, components):
+    components = None
+    if recipe.can_make(held_counts(self.caller)):
+      components = pick_components(self.caller, recipe.component_keys)
+    if not components:
       self.caller.msg("You don't have all the components.")
       return
     consume_components(self.caller, components)
-    obj = spawner.spawn(prototype['prototype_key'])[0]
+    obj = spawner.spawn(recipe.prototype_key)[0]
     obj.location = self.caller
-    self.caller.msg(f"You created {prototype['key']}.")
+    self.caller.msg(f"You created {recipe.key}.")
+
 
+class CmdRecipes(QueuedCommand):
+  """List what you could make from what you're carrying.
+
+  Usage:
+    recipes
+  """
+  key = "recipes"
+  aliases = ["reci", "recip", "recipe"]
+  locks = "cmd:all()"
+  help_category = "Monster"
+
+  def inner_func(self):
+    recipes = [
+      recipe for recipe in RECIPES.craftable(held_counts(self.caller))
+      if pick_components(self.caller, recipe.component_keys)]
+    if not recipes:
+      self.caller.msg("You can't make anything from what you're carrying.")
+      return
+    table = self.styled_table("|wMake", "|wFrom")
+    for recipe in recipes:
+      table.add_row(recipe.key, ", ".join(recipe.component_keys))
+    self.caller.msg(f"{table}")
@@ -1,4 +1,9 @@
+import os
+import time
+from django.conf import settings
 from evennia import Command as BaseCommand
+from gamerules.hiding import track_hidden
+from gamerules.rng import RECORDER
 
 
 class CmdClear(BaseCommand):
@@ -13,6 +18,7 @@ class CmdClear(BaseCommand):
     self.caller.ndb.command_queue.clear()
     self.caller.ndb.frozen_until = 0
     self.caller.ndb.hiding = 0
+    track_hidden(self.caller)
 
 
 class CmdDebug(BaseCommand):
@@ -29,6 +35,38 @@ class CmdDebug(BaseCommand):
     self.caller.msg(f"Debug: {self.caller.ndb.debug}")
 
 
+class CmdRecord(BaseCommand):
+  """
+  Record a session for utils/benchmarks/replay.py.
+
+  Usage:
+    record start [seed]
+    record stop
+    record
+  """
+  key = "record"
+  locks = "cmd:perm(Developer)"
+  help_category = "Monster"
+
+  def func(self):
+    args = self.args.split()
+    action = args[0].lower() if args else ""
+    if action == "start":
+      if len(args) > 1 and not args[1].isdigit():
+        self.caller.msg("Usage: record start [seed]")
+        return
+      seed = int(args[1]) if len(args) > 1 else None
+      path = os.path.join(settings.DATA_DIR, f"recording-{time.strftime('%Y%m%d-%H%M%S')}.jsonl")
+      seed = RECORDER.start(path, seed)
+      self.caller.msg(f"Recording to {path} with seed {seed}.")
+    elif action == "stop":
+      path = RECORDER.path
+      RECORDER.stop()
+      self.caller.msg(f"Stopped recording to {path}." if path else "Not recording.")
+    else:
+      self.caller.msg(f"Recording to {RECORDER.path}." if RECORDER.recording else "Not recording.")
+
+
 def debug_msg(caller, msg):
   if caller.ndb.debug:
     caller.msg("|w" + msg)
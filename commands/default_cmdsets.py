@@ -16,15 +16,16 @@ own cmdsets by inheriting from them or directly from `evennia.CmdSet`.
 
 from evennia import default_cmds
 from evennia.commands.default.comms import CmdGrapevine2Chan, CmdIRCStatus
+from commands.building import CmdRename, CmdSetAttribute, CmdSetObjAlias
 from commands.character import CmdName, CmdSheet
-from commands.crafting import CmdMake
+from commands.crafting import CmdMake, CmdRecipes
 from commands.combat import CmdAttack, CmdPunch, CmdRest
-from commands.commerce import CmdBuy, CmdSell
-from commands.debug import CmdClear, CmdDebug
+from commands.commerce import CmdBuy, CmdPrice, CmdSell
+from commands.debug import CmdClear, CmdDebug, CmdRecord
 from commands.equipment import CmdEquip, CmdUnequip, CmdUse
 from commands.general import CmdDrop, CmdExpress, CmdGet, CmdInventory, CmdLook, CmdShow
 from commands.hiding import CmdHide, CmdReveal, CmdSearch
-from commands.misc import CmdBrief, CmdDot, CmdWho
+from commands.misc import CmdBrief, CmdDot, CmdPing, CmdWho
 from commands.spells import CmdCast, CmdLearn
 from commands.talk import CmdSay, CmdShout, CmdWhisper
 
@@ -52,7 +53,9 @@ class CharacterCmdSet(default_cmds.CharacterCmdSet):
         self.add(CmdCast())
         self.add(CmdClear())
         self.add(CmdDebug())
+        self.add(CmdRecord())
         self.add(CmdDot())
+        self.add(CmdPing())
         self.remove(default_cmds.CmdDrop())
         self.add(CmdDrop())
         self.add(CmdEquip())
@@ -72,11 +75,17 @@ class CharacterCmdSet(default_cmds.CharacterCmdSet):
         self.add(CmdName())
         self.remove(default_cmds.CmdNick())
         self.remove(default_cmds.CmdPose())
+        self.add(CmdPrice())
         self.add(CmdPunch())
+        self.add(CmdRecipes())
         self.add(CmdRest())
         self.add(CmdReveal())
         self.remove(default_cmds.CmdSay())
         self.add(CmdSay())
+        self.remove(default_cmds.CmdSetAttribute())
+        self.add(CmdSetAttribute())
+        self.remove(default_cmds.CmdSetObjAlias())
+        self.add(CmdSetObjAlias())
         self.add(CmdSheet())
         self.add(CmdShout())
         self.add(CmdShow())
@@ -90,7 +99,7 @@ class CharacterCmdSet(default_cmds.CharacterCmdSet):
         self.add(CmdWho())
 
         # add back the original name command as 'rename'
-        rename = default_cmds.CmdName(key="rename", aliases="")
+        rename = CmdRename(key="rename", aliases="")
         self.add(rename)
 
 
@@ -1,7 +1,8 @@
 from commands.command import QueuedCommand
 from commands.spells import list_spells
 from evennia.utils.search import search_object
-from gamerules.find import find_first, find_first_unhidden
+from gamerules.find import find_first, find_first_unhidden, holds
+from gamerules.equipment_effect_kind import EquipmentEffectKind
 from gamerules.equipment_slot import EquipmentSlot
 from gamerules.object_kind import ObjectKind
 from gamerules.spells import do_cast, first_prompt, poof, second_prompt
@@ -49,7 +50,7 @@ class CmdUnequip(QueuedCommand):
     if not obj:
       self.caller.msg(f"You're not carrying {key}.")
       return
-    if obj.db.cursed:
+    if obj.effect(EquipmentEffectKind.CURSED):
       self.caller.msg(f"The {obj.key} is cursed.")
       return
     self.caller.unequip(obj)
@@ -79,8 +80,8 @@ class CmdUse(QueuedCommand):
     if obj.db.object_kind is None:
       self.caller.msg("You can't use that.")
       return False
-    if (obj.db.use_object_required 
-      and not find_first(self.caller, obj.db.use_object_required)):
+    if (obj.db.use_object_required
+      and not holds(self.caller, obj.db.use_object_required)):
       self.caller.msg("It doesn't work for some reason.")
       return False
     if (obj.db.use_location_required 
@@ -133,12 +134,12 @@ class CmdUse(QueuedCommand):
 
 
 def use_equipment(user, obj):
-  if obj.db.teleport:
-    room_id = f"room_{obj.db.teleport}"
+  if obj.effect(EquipmentEffectKind.TELEPORT):
+    room_id = f"room_{obj.effect(EquipmentEffectKind.TELEPORT)}"
     rooms = search_object(room_id)
     if rooms:
       poof(user, rooms[0])
-  elif obj.db.crystal_radius:
+  elif obj.effect(EquipmentEffectKind.CRYSTAL_RADIUS):
     # TODO: afaict crystal_radius was never implemented in the original code
     user.msg("[not implemented yet]")
   else:
@@ -146,10 +147,10 @@ def use_equipment(user, obj):
 
 
 def use_spell(user, obj, spell, input1, input2):
-  if obj.db.charges > 0:
+  if obj.charges > 0:
     do_cast(user, spell, input1, input2)
-    obj.db.charges -= 1
-  if obj.db.charges < 1:
+    obj.charges -= 1
+  if obj.charges < 1:
     # out of charges, so self-destruct
     verb = ""
     if obj.is_typeclass("typeclasses.objects.Scroll"):
@@ -1,6 +1,12 @@
+import re
 from commands.command import QueuedCommand
 from gamerules.special_room_kind import SpecialRoomKind
 from gamerules.find import find_first, find_first_unhidden
+from gamerules.gold import add_to_stack, materialize_ground_gold
+
+
+# drop gold, drop 10 gold, drop gold 10
+DROP_GOLD_RE = re.compile(r"^(?:(\d+)\s+)?gold(?:\s+(\d+))?$", re.IGNORECASE)
 
 
 class CmdDrop(QueuedCommand):
@@ -8,6 +14,7 @@ class CmdDrop(QueuedCommand):
 
   Usage:
     drop <obj>
+    drop [<amount>] gold
   """
   key = "drop"
   locks = "cmd:all()"
@@ -21,7 +28,11 @@ class CmdDrop(QueuedCommand):
     key = self.args.strip()
     obj = find_first(self.caller, key)
     if not obj:
-      self.caller.msg(f"You aren't carrying {key}.")
+      match = DROP_GOLD_RE.match(key)
+      if match:
+        self.drop_gold(match.group(1) or match.group(2))
+      else:
+        self.caller.msg(f"You aren't carrying {key}.")
       return
     # before the drop
     if not obj.at_before_drop(self.caller):
@@ -34,6 +45,17 @@ class CmdDrop(QueuedCommand):
     # after the drop
     obj.at_drop(self.caller)
 
+  def drop_gold(self, amount):
+    # gold comes out of our wallet as a Gold object others can see
+    amount = int(amount) if amount else self.caller.gold
+    if amount < 1 or not self.caller.gain_gold(-amount):
+      self.caller.msg("You don't have that much gold.")
+      return
+    add_to_stack(self.caller.location, amount)
+    self.caller.msg(f"You drop {amount} gold.")
+    self.caller.location.msg_contents(
+      f"{self.caller.name} drops {amount} gold.", exclude=self.caller)
+
 
 
 class CmdExpress(QueuedCommand):
@@ -92,6 +114,8 @@ class CmdGet(QueuedCommand):
       self.caller.msg("Get what?")
       return
     key = self.args.strip()
+    # we may be after gold we saw dropped but nobody has looked at yet
+    materialize_ground_gold(self.caller.location)
     obj = find_first_unhidden(self.caller.location, key)
     if not obj:
       self.caller.msg(f"You can't find {key}.")
@@ -127,10 +151,13 @@ class CmdInventory(QueuedCommand):
 
   def inner_func(self):
     items = self.caller.contents
-    if not items:
+    gold = getattr(self.caller, "gold", 0)
+    if not items and not gold:
       string = "You are not carrying anything."
     else:
       table = self.styled_table(border="header")
+      if gold:
+        table.add_row("|C%s gold|n" % gold, "")
       for item in items:
         table.add_row("|C%s|n" % item.name, item.db.desc or "")
       string = "|wYou are carrying:\n%s" % table
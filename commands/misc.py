@@ -1,8 +1,8 @@
 import time
 from commands.command import QueuedCommand
 from evennia.commands import cmdhandler
-from evennia.server.sessionhandler import SESSIONS
 from evennia.utils import utils
+from world.who_list import WHO_LIST
 
 
 class CmdBrief(QueuedCommand):
@@ -39,6 +39,25 @@ class CmdDot(QueuedCommand):
     pass
 
 
+class CmdPing(QueuedCommand):
+  """Answer once the commands typed before this one are done.
+
+  Usage:
+    ping [<text>]
+  """
+  key = "ping"
+  locks = "cmd:all()"
+  help_category = "Monster"
+
+  def inner_func(self):
+    text = self.args.strip()
+    self.caller.msg(f"Pong {text}." if text else "Pong.")
+
+  def at_post_cmd(self):
+    # not worth repeating with dot
+    pass
+
+
 """
 > who
                      Monster Status
@@ -68,73 +87,67 @@ class CmdWho(QueuedCommand):
   account_caller = True
 
   def inner_func(self):
-    """Get all connected accounts by polling session."""
+    """Render the who list from the shared snapshot."""
     account = self.account
-    session_list = SESSIONS.get_sessions()
-    session_list = sorted(session_list, key=lambda o: o.account.key)
     show_session_data = account.check_permstring("Developer") or account.check_permstring(
         "Admins"
     )
-    naccounts = SESSIONS.account_count()
+    # tables are fitted to the client's width
+    width = self.client_width()
     if show_session_data:
-      # privileged info
-      table = self.styled_table(
-          "|wAccount Name",
-          "|wOn for",
-          "|wIdle",
-          "|wPuppeting",
-          "|wLevel",
-          "|wClass",
-          "|wRoom",
-          "|wCmds",
-          "|wProtocol",
-          "|wHost",
-      )
-      for session in session_list:
-        if not session.logged_in:
-            continue
-        delta_cmd = time.time() - session.cmd_last_visible
-        delta_conn = time.time() - session.conn_time
-        account = session.get_account()
-        puppet = session.get_puppet()
-        location = puppet.location.key if puppet and puppet.location else "None"
-        table.add_row(
-          utils.crop(account.get_display_name(account), width=25),
-          utils.time_format(delta_conn, 0),
-          utils.time_format(delta_cmd, 1),
-          utils.crop(puppet.get_display_name(account) if puppet else "None", width=25),
-          puppet.level if hasattr(puppet, "level") else 0,
-          puppet.classname if hasattr(puppet, "classname") else "None",
-          utils.crop(location, width=25),
-          session.cmd_total,
-          session.protocol_key,
-          isinstance(session.address, tuple) and session.address[0] or session.address,
-        )
+      # privileged info has ages in it, so is good for a second at most
+      table = WHO_LIST.render(("privileged", width, int(time.time())), self.privileged_table)
     else:
-      # unprivileged
-      table = self.styled_table(
-        "|wUsername", 
-        "|wGame Name", 
-        "|wLevel", 
-        "|wClass", 
-        "|wWhere",
-      )
-      for session in session_list:
-        if not session.logged_in:
-            continue
-        delta_cmd = time.time() - session.cmd_last_visible
-        delta_conn = time.time() - session.conn_time
-        account = session.get_account()
-        puppet = session.get_puppet()        
-        location = puppet.location.key if puppet and puppet.location else "None"
-        table.add_row(
-          utils.crop(account.get_display_name(account), width=25),
-          utils.crop(puppet.get_display_name(account) if puppet else "None", width=25),
-          puppet.level if hasattr(puppet, "level") else 0,
-          puppet.classname if hasattr(puppet, "classname") else "None",
-          utils.crop(location, width=25),            
-      )
+      table = WHO_LIST.render(("unprivileged", width), self.unprivileged_table)
     self.msg(
       "|w                     Monster Status\n                  26-FEB-1991  8:38pm\n                  * - Monster Operator|n\n%s"
       % table
     )
+
+  def privileged_table(self, rows):
+    table = self.styled_table(
+        "|wAccount Name",
+        "|wOn for",
+        "|wIdle",
+        "|wPuppeting",
+        "|wLevel",
+        "|wClass",
+        "|wRoom",
+        "|wCmds",
+        "|wProtocol",
+        "|wHost",
+    )
+    now = time.time()
+    for row in rows:
+      session = row["session"]
+      table.add_row(
+        utils.crop(row["account"], width=25),
+        utils.time_format(now - row["conn_time"], 0),
+        utils.time_format(now - session.cmd_last_visible, 1),
+        utils.crop(row["character"] or "None", width=25),
+        row["level"],
+        row["class"] or "None",
+        utils.crop(row["where"] or "None", width=25),
+        session.cmd_total,
+        row["protocol"],
+        row["host"],
+      )
+    return str(table)
+
+  def unprivileged_table(self, rows):
+    table = self.styled_table(
+      "|wUsername", 
+      "|wGame Name", 
+      "|wLevel", 
+      "|wClass", 
+      "|wWhere",
+    )
+    for row in rows:
+      table.add_row(
+        utils.crop(row["account"], width=25),
+        utils.crop(row["character"] or "None", width=25),
+        row["level"],
+        row["class"] or "None",
+        utils.crop(row["where"] or "None", width=25),            
+      )
+    return str(table)
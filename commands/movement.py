@@ -1,6 +1,4 @@
 from commands.command import Command, QueuedCommand
-from gamerules.exit_kind import ExitKind
-from gamerules.find import find_first
 
 # see also evennia commands.py ExitCommand
 class CmdExit(QueuedCommand):
@@ -17,29 +15,14 @@ class CmdExit(QueuedCommand):
     return self.caller.move_speed / 100.0
 
   def inner_func(self):
-    ok_to_traverse = False
-    if self.obj.access(self.caller, "traverse"):
-      # we satisfy any locks on the exit
-      ok_to_traverse = True
-    elif self.obj.db.password and self.obj.db.password.lower() == self.raw_string.lower():
-      # we used the locked exit's password (case-insensitive)
-      # TODO: maybe we should convert OPEN + alias_required to PASSWORDED?
-      if (self.obj.db.exit_kind == ExitKind.OPEN 
-        or self.obj.db.exit_kind == ExitKind.PASSWORDED):
-        # passworded only
-        ok_to_traverse = True
-      elif ((self.obj.db.exit_kind == ExitKind.OBJECT_REQUIRED
-       or self.obj.db.exit_kind == ExitKind.ONLY_EXISTS_WITH_OBJECT)
-        and find_first(self.caller, self.obj.db.required_object)):
-        # passworded and we have the required object
-        ok_to_traverse = True
-      elif (self.obj.db.exit_kind == ExitKind.OBJECT_FORBIDDEN and 
-        not find_first(self.caller, self.obj.db.required_object)):
-        # passworded and we don't have the forbidden object
-        ok_to_traverse = True
-
-    if ok_to_traverse:
-      self.obj.at_traverse(self.caller, self.obj.destination)
+    pipeline = self.obj.pipeline
+    if pipeline.allows(self.obj, self.caller, self.raw_string):
+      # e.g. tolls and guardians
+      failure = pipeline.check(self.obj, self.caller)
+      if failure:
+        self.caller.msg(failure)
+      else:
+        self.obj.at_traverse(self.caller, self.obj.destination)
     else:
       if self.obj.db.err_traverse:
         # if exit has a better error message, let's use it.
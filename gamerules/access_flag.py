@@ -0,0 +1,7 @@
+from enum import IntFlag
+
+
+class AccessFlag(IntFlag):
+  """Flags checked before an object's view/traverse locks; see gamerules/hiding.py."""
+  HIDDEN = 1
+  IMPASSABLE = 2
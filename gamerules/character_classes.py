@@ -1,6 +1,7 @@
 import re
 from gamerules.xp import set_xp
 from userdefined.models import CharacterClass
+from world.who_list import who_changed
 
 def reset_character_class(target, record_id):
   set_character_class(target, record_id)
@@ -14,6 +15,7 @@ def set_character_class(target, record_id):
     target.db.character_class_key = char_class.db_key
     # force re-cache
     _ = target.character_class
+    who_changed(target)
     if target.db.health > target.max_health:
       target.db.health = target.max_health
     if target.db.mana > target.max_mana:
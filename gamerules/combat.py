@@ -1,12 +1,13 @@
-import random
 
 from evennia.utils.search import search_object
 from gamerules.combat_msgs import *
-from gamerules.gold import give_starting_gold
-from gamerules.find import is_hidden, keymatch
-from gamerules.hiding import reveal
+from gamerules.gold import drop_ground_gold, give_starting_gold
+from gamerules.find import is_hidden, keyed_contents
+from gamerules.hiding import reveal, track_hidden
+from gamerules.rng import RNG
 from gamerules.saving_throw import make_saving_throw
 from gamerules.talk import msg_global
+from gamerules.wear import note_hit, note_use
 from gamerules.xp import calculate_kill_xp, set_xp, gain_xp
 
 
@@ -20,8 +21,8 @@ def is_attackable(target):
 
 
 def find_first_attackable(container, key):
-  for obj in container.contents:
-    if keymatch(obj, key) and not is_hidden(obj) and is_attackable(obj):
+  for obj in keyed_contents(container, key):
+    if not is_hidden(obj) and is_attackable(obj):
       return obj
   return None
 
@@ -49,6 +50,9 @@ def resolve_attack(attacker, target):
     reveal(attacker)
     is_surprise = True
 
+  if weapon:
+    note_use(weapon)
+
   # calculate damage
   damage = attack_damage(attacker, weapon, is_surprise)
 
@@ -63,11 +67,12 @@ def resolve_attack(attacker, target):
   location_msg = attack_bystander_msg(attacker.name, target.name, attack_name, damage)
   attacker.location.msg_contents(location_msg, exclude=[attacker, target])
 
-  # apply armor to reduce damage
+  # apply armor to reduce damage, wearing it down
   damage = apply_armor(target, damage)
+  note_hit(target)
 
   # check for poison
-  if random.randint(0, 100) < attacker.poison_chance:
+  if RNG.randint(0, 100) < attacker.poison_chance:
     attacker.msg(f"You've poisoned {target.name}!")
     if not make_saving_throw(target, "poison"):
       target.msg(f"You've been poisoned by {attacker.name}'s {attack_name}!")
@@ -83,7 +88,7 @@ def apply_armor(target, damage):
   final_damage = damage
   base_armor = target.base_armor
   deflect_armor = target.deflect_armor
-  if deflect_armor > 0 and random.randint(0, 100) < deflect_armor:
+  if deflect_armor > 0 and RNG.randint(0, 100) < deflect_armor:
     target.msg("The attack is deflected by your armor.")
     final_damage = int(damage / 2)
   if base_armor > 0:
@@ -93,7 +98,7 @@ def apply_armor(target, damage):
 
 
 def attack_damage(attacker, weapon, is_surprise=False):
-  rand_multiplier = .7 if is_surprise else random.random()
+  rand_multiplier = .7 if is_surprise else RNG.random()
   if weapon:
     # attacker weapon damages may be the sum of several equipped objects
     dmg = attacker.base_weapon_damage + int(attacker.random_weapon_damage * rand_multiplier)
@@ -140,7 +145,7 @@ def resolve_punch(attacker, target):
     reveal(attacker)
     is_surprise = True
 
-  punch_num = random.randint(0, PUNCH_KINDS)
+  punch_num = RNG.randint(0, PUNCH_KINDS)
   if attacker.db.health < 75:
     punch_num = 16
 
@@ -201,6 +206,13 @@ def character_death(victim, killer=None, weapon_name=None):
       # nuke worthless objects
       obj.delete()
 
+  # and their gold, which is a wallet balance rather than an object
+  gold = victim.gold
+  if gold > 0 and victim.gain_gold(-gold):
+    drop_ground_gold(victim.location, gold)
+    victim.msg(f"You drop {gold} gold.")
+    victim.location.msg_contents(f"{victim.name} drops {gold} gold.", exclude=victim)
+
   # victim goes to the void
   the_void = search_object("Void")[0]
   if the_void:
@@ -226,4 +238,5 @@ def reset_victim_state(victim):
   victim.ndb.command_queue.clear()
   victim.ndb.frozen_until = 0
   victim.ndb.hiding = 0
+  track_hidden(victim)
   victim.ndb.resting = False
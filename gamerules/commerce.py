@@ -0,0 +1,104 @@
+"""
+Merchant stock
+
+Merchants stock prototype references with prices rather than spawned
+objects. Selling one spawns it normally the first time; that object's
+fields, attributes and tags become the template for the prototype, so
+later sales are a few bulk INSERTs instead of a spawn (or a copy_object)
+that saves every attribute one by one. Templates are kept per version
+of the prototype, so editing it in game takes effect on the next sale.
+"""
+import hashlib
+from django.db import transaction
+from evennia.objects.models import ObjectDB
+from evennia.prototypes import prototypes as protlib, spawner
+from world.bulk import bulk_add_attributes, bulk_add_tags, bulk_create_objects
+
+
+TEMPLATE_FIELDS = (
+  "db_key", "db_typeclass_path", "db_home_id", "db_lock_storage", "db_cmdset_storage")
+
+# prototype key => (prototype_version(), template), see object_template()
+_templates = {}
+
+
+def flat_attr(flat, attr_name, default=None):
+  # flattened prototypes keep their attributes as (key, value, category, locks)
+  for attr in flat.get("attrs", ()):
+    if attr[0] == attr_name:
+      return attr[1]
+  return flat.get(attr_name, default)
+
+
+def flat_prototype(prototype_key):
+  """prototype_key's prototype flattened, or None if there is no such prototype."""
+  prototypes = protlib.search_prototype(key=prototype_key)
+  if not prototypes:
+    return None
+  return spawner.flatten_prototype(prototypes[0])
+
+
+def prototype_version(prototype_key):
+  """A digest of prototype_key's prototype, which changes whenever it's edited."""
+  flat = flat_prototype(prototype_key)
+  if flat is None:
+    return None
+  return hashlib.sha1(repr(sorted(flat.items())).encode()).hexdigest()
+
+
+def stock_entry(prototype_key):
+  """A merchant stock entry for prototype_key, or None if there is no such prototype."""
+  flat = flat_prototype(prototype_key)
+  if flat is None:
+    return None
+  return {
+    "prototype_key": prototype_key,
+    "key": flat.get("key") or prototype_key,
+    "price": flat_attr(flat, "worth", 0) or 0,
+  }
+
+
+def object_template(obj):
+  return {
+    "fields": {field: getattr(obj, field) for field in TEMPLATE_FIELDS},
+    "attributes": [
+      (attr.db_key, attr.value, attr.db_category) for attr in obj.attributes.all()],
+    "tags": [
+      (tag.db_key, tag.db_category, tag.db_tagtype) for tag in obj.db_tags.all()],
+  }
+
+
+def clear_templates():
+  _templates.clear()
+
+
+def spawn_stock(prototype_key, location):
+  """Spawn a stocked prototype into location, from its template if we have one."""
+  version = prototype_version(prototype_key)
+  cached = _templates.get(prototype_key)
+  if cached is None or cached[0] != version:
+    # new, or edited since we made its template
+    obj = spawner.spawn(prototype_key)[0]
+    obj.location = location
+    _templates[prototype_key] = (version, object_template(obj))
+    return obj
+  template = cached[1]
+  with transaction.atomic():
+    obj_id = bulk_create_objects([dict(template["fields"], db_location_id=location.id)])[0].id
+    bulk_add_attributes([(obj_id, *attr) for attr in template["attributes"]])
+    bulk_add_tags([(obj_id, *tag) for tag in template["tags"]])
+  # load it properly typeclassed, and let location know it's there
+  obj = ObjectDB.objects.get(id=obj_id)
+  location.contents_cache.add(obj)
+  return obj
+
+
+def sell_item(source, buyer):
+  """Give buyer a new copy of a merchant's item.
+
+  source is a stock prototype key, or an object an admin handed the
+  merchant to sell.
+  """
+  if isinstance(source, str):
+    return spawn_stock(source, buyer)
+  return ObjectDB.objects.copy_object(source, new_key=source.key, new_location=buyer)
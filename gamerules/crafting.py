@@ -0,0 +1,90 @@
+"""
+Crafting recipes
+
+Any prototype with components can be made from them. The recipe index
+maps each such prototype to its components as a Counter, and each
+component to the recipes that use it, so checking a recipe is one held
+count lookup per component (see gamerules.find.held_counts), and
+finding everything an inventory can make only looks at recipes that
+share a component with it.
+"""
+from collections import Counter
+from evennia.prototypes import prototypes as protlib
+
+
+def prototype_attr(prototype, attr_name):
+  # search_prototype() gives prototypes with their attributes in "attrs"
+  for attr in prototype.get("attrs") or ():
+    if attr[0] == attr_name:
+      return attr[1]
+  return prototype.get(attr_name)
+
+
+class Recipe:
+  def __init__(self, prototype, components):
+    self.prototype = prototype
+    self.prototype_key = prototype["prototype_key"]
+    self.key = prototype.get("key") or self.prototype_key
+    # lowercased component key => how many
+    self.components = Counter(component.lower() for component in components)
+    # the components as named, in order, for consuming and listing
+    self.component_keys = list(components)
+
+  def can_make(self, held):
+    return all(held[component] >= count for component, count in self.components.items())
+
+
+class RecipeIndex:
+  def __init__(self):
+    self.loaded = False
+    # lowercased prototype key and key => recipe
+    self.recipes = {}
+    # lowercased component key => recipes using it
+    self.by_component = {}
+
+  def load(self):
+    self.recipes, self.by_component = {}, {}
+    for prototype in protlib.search_prototype():
+      components = prototype_attr(prototype, "components")
+      if not components:
+        continue
+      recipe = Recipe(prototype, components)
+      self.recipes[recipe.prototype_key.lower()] = recipe
+      self.recipes.setdefault(recipe.key.lower(), recipe)
+      for component in recipe.components:
+        self.by_component.setdefault(component, []).append(recipe)
+    self.loaded = True
+
+  def reload(self):
+    """Reload lazily, e.g. after prototypes changed."""
+    self.loaded = False
+
+  def _ensure_loaded(self):
+    if not self.loaded:
+      self.load()
+
+  def find(self, key):
+    """The recipe for key: an exact prototype key or key, else the first prefix match."""
+    self._ensure_loaded()
+    key = key.strip().lower()
+    recipe = self.recipes.get(key)
+    if recipe is None:
+      for name in sorted(self.recipes):
+        if name.startswith(key):
+          return self.recipes[name]
+    return recipe
+
+  def craftable(self, held):
+    """Recipes that can be made from held counts, by key."""
+    self._ensure_loaded()
+    candidates = {}
+    for component, count in held.items():
+      if count > 0:
+        for recipe in self.by_component.get(component, ()):
+          candidates[recipe.prototype_key] = recipe
+    return sorted(
+      (recipe for recipe in candidates.values() if recipe.can_make(held)),
+      key=lambda recipe: recipe.key.lower())
+
+
+RECIPES = RecipeIndex()
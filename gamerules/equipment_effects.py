@@ -0,0 +1,76 @@
+"""
+Equipment effect vectors
+
+Equipment keeps all of its effects in a single list attribute, indexed
+by EquipmentEffectKind value, instead of one attribute per effect. A
+character's equipment bonuses are then the sum of a few vectors.
+"""
+from operator import add
+from gamerules.equipment_effect_kind import EquipmentEffectKind
+
+
+# unused kind values (0, 45, 46, ...) just stay 0
+NUM_EFFECTS = max(EquipmentEffectKind) + 1
+DEFAULT_EFFECTS = {EquipmentEffectKind.CONDITION: 100}
+
+# stat bonuses, which wear down with the item's condition; the rest
+# describe the item itself
+CONDITION_SCALED_EFFECTS = frozenset([
+  EquipmentEffectKind.BASE_HEALTH, EquipmentEffectKind.LEVEL_HEALTH,
+  EquipmentEffectKind.BASE_MANA, EquipmentEffectKind.LEVEL_MANA,
+  EquipmentEffectKind.BASE_STEAL, EquipmentEffectKind.LEVEL_STEAL,
+  EquipmentEffectKind.BASE_MOVE_SILENT, EquipmentEffectKind.LEVEL_MOVE_SILENT,
+  EquipmentEffectKind.MOVE_SPEED, EquipmentEffectKind.HEAL_SPEED,
+  EquipmentEffectKind.ATTACK_SPEED, EquipmentEffectKind.BASE_CLAW_DAMAGE,
+  EquipmentEffectKind.RANDOM_CLAW_DAMAGE, EquipmentEffectKind.LEVEL_CLAW_DAMAGE,
+  EquipmentEffectKind.BASE_WEAPON_USE, EquipmentEffectKind.LEVEL_WEAPON_USE,
+  EquipmentEffectKind.HEAR_NOISE, EquipmentEffectKind.POISON,
+  EquipmentEffectKind.BASE_WEAPON_DAMAGE, EquipmentEffectKind.RANDOM_WEAPON_DAMAGE,
+  EquipmentEffectKind.BASE_ARMOR, EquipmentEffectKind.DEFLECT_ARMOR,
+  EquipmentEffectKind.SPELL_ARMOR, EquipmentEffectKind.SPELL_DEFLECT_ARMOR,
+])
+
+
+def effect_attribute_names(kind):
+  """The per-effect attribute names equipment used before effect vectors.
+
+  Generated prototypes wrote the class effect as "class", while
+  at_object_creation defaulted "character_class"; the first one an
+  object has wins.
+  """
+  if kind == EquipmentEffectKind.CLASS:
+    return ("class", "character_class")
+  return (kind.name.lower(),)
+
+
+def effect_vector(effects=None):
+  """An effect vector from a {kind or lowercase kind name: value} dict."""
+  vector = [0] * NUM_EFFECTS
+  for kind, value in DEFAULT_EFFECTS.items():
+    vector[kind] = value
+  for kind, value in (effects or {}).items():
+    if isinstance(kind, str):
+      kind = EquipmentEffectKind[kind.upper()]
+    vector[kind] = value or 0
+  return vector
+
+
+def scale_effects(effects):
+  """Stat bonuses scaled by condition, as in the original:
+
+  AttackSpeed := AttackSpeed + ROUND(AllStats.MyHold.Condition[OSlot] / 100 *
+    ( LookupEffect(Obj, EF_AttackSpeed)));
+  """
+  condition = effects[EquipmentEffectKind.CONDITION]
+  if condition == 100:
+    return tuple(effects)
+  return tuple(
+    int(round(condition / 100 * value)) if kind in CONDITION_SCALED_EFFECTS else value
+    for kind, value in enumerate(effects))
+
+
+def sum_effects(vectors):
+  total = [0] * NUM_EFFECTS
+  for vector in vectors:
+    total = list(map(add, total, vector))
+  return total
@@ -1,48 +1,161 @@
+"""
+Exit pipelines
+
+Everything an exit checks and does when it's used, compiled once from
+its attributes: the password and held-object rules, pre-traverse checks
+(which can stop the move, like not having the gold for a toll), and
+post-traverse effects. Exits cache their pipeline (see Exit.pipeline)
+and drop it when their attributes change.
+"""
 from gamerules.character_classes import reset_character_class, set_character_class
 from gamerules.exit_effect_kind import ExitEffectKind
+from gamerules.exit_kind import ExitKind
+from gamerules.find import holds
 from gamerules.talk import msg_global
+from gamerules.wallet import BANK, WALLET, balance, gain
 from gamerules.xp import gain_xp, set_xp
 
 
-def apply_exit_effect(target, source_location, exit_effect_kind, exit_effect_value):
-  if exit_effect_kind == ExitEffectKind.XP:
+# what using an exit's password takes, by exit kind
+PASSWORD_ONLY = "password_only"
+REQUIRES_OBJECT = "requires_object"
+FORBIDS_OBJECT = "forbids_object"
+
+PASSWORD_RULES = {
+  # TODO: maybe we should convert OPEN + alias_required to PASSWORDED?
+  ExitKind.OPEN: PASSWORD_ONLY,
+  ExitKind.PASSWORDED: PASSWORD_ONLY,
+  ExitKind.OBJECT_REQUIRED: REQUIRES_OBJECT,
+  ExitKind.ONLY_EXISTS_WITH_OBJECT: REQUIRES_OBJECT,
+  ExitKind.OBJECT_FORBIDDEN: FORBIDS_OBJECT,
+}
+
+
+class ExitPipeline:
+  def __init__(self, password=None, password_rule=None, required_object=None,
+      checks=(), effects=()):
+    self.password = password
+    self.password_rule = password_rule
+    self.required_object = required_object
+    # functions of (target, exit), returning a failure message or None
+    self.checks = checks
+    # functions of (target, source_location)
+    self.effects = effects
+
+  def allows(self, exit, target, raw_string):
+    """Whether target may use exit, having typed raw_string."""
+    if exit.access(target, "traverse"):
+      # we satisfy any locks on the exit
+      return True
+    if self.password is None or raw_string.lower() != self.password:
+      return False
+    if self.password_rule == PASSWORD_ONLY:
+      return True
+    if self.password_rule == REQUIRES_OBJECT:
+      return holds(target, self.required_object)
+    if self.password_rule == FORBIDS_OBJECT:
+      return not holds(target, self.required_object)
+    return False
+
+  def check(self, exit, target):
+    """The first pre-traverse check target fails, as a message; None if all pass."""
+    for check in self.checks:
+      failure = check(target, exit)
+      if failure:
+        return failure
+    return None
+
+  def apply(self, target, source_location):
+    for effect in self.effects:
+      effect(target, source_location)
+
+
+def compile_exit(exit):
+  """Build exit's ExitPipeline from its attributes."""
+  password = exit.db.password
+  required_object = exit.db.required_object
+  checks, effects = compile_exit_effect(exit.db.exit_effect_kind, exit.db.exit_effect_value)
+  return ExitPipeline(
+    password=password.lower() if password else None,
+    password_rule=PASSWORD_RULES.get(exit.db.exit_kind),
+    required_object=required_object,
+    checks=checks,
+    effects=effects)
+
+
+def has_wallet(target):
+  return getattr(target, "has_wallet", False)
+
+
+def compile_exit_effect(kind, value):
+  """(pre-traverse checks, post-traverse effects) for an exit effect."""
+  if not kind:
+    return (), ()
+  value = value or 0
+
+  if kind in (ExitEffectKind.XP, ExitEffectKind.XP_MODIFIED):
     # TODO: how is XP different from XP_MODIFIED?
-    gain_xp(target, exit_effect_value)
-  elif exit_effect_kind == ExitEffectKind.WEALTH:
-    # TODO: this isn't quite right
-    # we need to move this check to before traverse occurs
-        #     IF (AllStats.Stats.Wealth < -Mag) THEN
-        # BEGIN
-        #   ExitFail(ExitSlot, AllStats);
-        #   Writeln('Not enough money!');
-        #   Going := FALSE;
-    if target.has_attr("gain_gold"):
-      target.gain_gold(exit_effect_value)
-  elif exit_effect_kind == ExitEffectKind.BANK_WEALTH:
-    # TODO
-    pass
-  elif exit_effect_kind == ExitEffectKind.HEALTH:
-    target.gain_health(exit_effect_value)
-  elif exit_effect_kind == ExitEffectKind.MANA:
-    target.gain_mana(exit_effect_value)
-  elif exit_effect_kind == ExitEffectKind.XP_SET:
-    set_xp(target, exit_effect_value)
-  elif exit_effect_kind == ExitEffectKind.CLASS_RESET:
-    if target.db.character_class_key:
-      reset_character_class(target, exit_effect_value)
-  elif exit_effect_kind == ExitEffectKind.CLASS_SET:
-    if target.db.character_class_key:
-      set_character_class(target, exit_effect_value)
-  elif exit_effect_kind == ExitEffectKind.ALARMED:
-    sound_alarm(target, source_location)
-  elif exit_effect_kind == ExitEffectKind.HEALTH_LESS:
-    # TODO: also needs to be checked before travere
-    pass
-  elif exit_effect_kind == ExitEffectKind.GUARDIAN:
-    # TODO
-    pass
-  elif exit_effect_kind == ExitEffectKind.XP_MODIFIED:
-    gain_xp(target, exit_effect_value)
+    return (), (lambda target, _: gain_xp(target, value),)
+
+  if kind in (ExitEffectKind.WEALTH, ExitEffectKind.BANK_WEALTH):
+    #     IF (AllStats.Stats.Wealth < -Mag) THEN
+    # BEGIN
+    #   ExitFail(ExitSlot, AllStats);
+    #   Writeln('Not enough money!');
+    #   Going := FALSE;
+    account = WALLET if kind == ExitEffectKind.WEALTH else BANK
+    failure = "Not enough money!" if account == WALLET else "Not enough money in the bank!"
+    def check_wealth(target, _):
+      if has_wallet(target) and balance(target, account) < -value:
+        return failure
+      return None
+    def pay(target, _):
+      if has_wallet(target) and not gain(target, value, account):
+        target.msg(failure)
+    return (check_wealth,) if value < 0 else (), (pay,)
+
+  if kind == ExitEffectKind.HEALTH:
+    return (), (lambda target, _: target.gain_health(value),)
+
+  if kind == ExitEffectKind.MANA:
+    return (), (lambda target, _: target.gain_mana(value),)
+
+  if kind == ExitEffectKind.XP_SET:
+    return (), (lambda target, _: set_xp(target, value),)
+
+  if kind == ExitEffectKind.CLASS_RESET:
+    def reset_class(target, _):
+      if target.db.character_class_key:
+        reset_character_class(target, value)
+    return (), (reset_class,)
+
+  if kind == ExitEffectKind.CLASS_SET:
+    def set_class(target, _):
+      if target.db.character_class_key:
+        set_character_class(target, value)
+    return (), (set_class,)
+
+  if kind == ExitEffectKind.ALARMED:
+    return (), (sound_alarm,)
+
+  if kind == ExitEffectKind.HEALTH_LESS:
+    # only the less healthy may pass
+    def check_health(target, _):
+      if (target.db.health or 0) >= value:
+        return "You are too healthy to go that way."
+      return None
+    return (check_health,), ()
+
+  if kind == ExitEffectKind.GUARDIAN:
+    # a monster in the room guards the exit
+    def check_guardian(target, exit):
+      for obj in exit.location.contents:
+        if obj.is_typeclass("typeclasses.mobs.Mob", exact=False) and not obj.is_dead:
+          return f"{obj.key} won't let you pass."
+      return None
+    return (check_guardian,), ()
+
+  return (), ()
 
 
 def sound_alarm(target, source_location):
@@ -52,4 +165,4 @@ def sound_alarm(target, source_location):
   #   2 : s := s + 'at';
   #   3 : s := s + 'in the';
   #   4 : s := s + 'at the';  
-  msg_global(f"{target.name} set off an alarm in {source_location.name}.")
\ No newline at end of file
+  msg_global(f"{target.name} set off an alarm in {source_location.name}.")
@@ -1,15 +1,222 @@
+from collections import Counter
+from evennia.objects.models import ContentsHandler
 from gamerules.direction import Direction
+from gamerules.hidden_index import HiddenIndex
+from gamerules.key_index import KeyIndex
+
+
+class IndexedContentsHandler(ContentsHandler):
+  """A ContentsHandler that also keeps a KeyIndex of the contents.
+
+  Every location change goes through the old and new location's
+  contents_cache, so the index follows moves, creation and deletion
+  without relying on move hooks. Typeclasses opt in by overriding their
+  contents_cache lazy_property to return one of these.
+  """
+  key_index = None
+  # stack typeclass path => the stack of that kind we hold
+  stack_index = None
+  # what's hidden here; unlike the other indexes it survives changed(),
+  # hiding updates it in place (see gamerules/hiding.py)
+  hidden = None
+  # lowercased key or alias => how many of the contents go by it, and
+  # obj id => the names we counted for it; renames and alias changes
+  # don't go through here, so they call contents_changed()
+  held = None
+  held_names = None
+  # bumped whenever anything but a puppeted character comes, goes or
+  # changes, so rooms know when to rebuild their cached appearance
+  scenery_version = 0
+
+  def init(self):
+    super().init()
+    self.changed()
+
+  def changed(self):
+    self.scenery_version += 1
+    # (re)built lazily on the next lookup
+    self.key_index = None
+    self.stack_index = None
+    self.held = None
+
+  def add(self, obj):
+    super().add(obj)
+    if self.key_index is not None:
+      self.key_index.add(obj)
+    if self.stack_index is not None and is_stack(obj):
+      self.stack_index.setdefault(obj.typeclass_path, obj)
+    if self.hidden is not None:
+      self.hidden.added(obj)
+    if self.held is not None:
+      self._hold(obj)
+    if not obj.has_account:
+      self.scenery_version += 1
+
+  def remove(self, obj):
+    super().remove(obj)
+    if self.key_index is not None:
+      self.key_index.remove(obj)
+    if self.stack_index is not None and self.stack_index.get(obj.typeclass_path) == obj:
+      # there may be another stack of the same kind, so look again
+      self.stack_index = None
+    if self.hidden is not None:
+      self.hidden.removed(obj)
+    if self.held is not None:
+      self._unhold(obj)
+    if not obj.has_account:
+      self.scenery_version += 1
+
+  def reindex(self):
+    self.key_index = KeyIndex(self.get())
+
+  def find(self, key):
+    """Contents whose keys start with key, in contents order."""
+    if self.key_index is None:
+      self.reindex()
+    matches = self.key_index.prefix(key)
+    if any(self.key_index.is_stale(obj) for obj in matches):
+      # something got renamed since we indexed it
+      self.reindex()
+      matches = self.key_index.prefix(key)
+    return matches
+
+  def find_stack(self, typeclass_path):
+    if self.stack_index is None:
+      self.stack_index = {}
+      for obj in self.get():
+        if is_stack(obj):
+          self.stack_index.setdefault(obj.typeclass_path, obj)
+    return self.stack_index.get(typeclass_path)
+
+  def _hold(self, obj):
+    if obj.id in self.held_names:
+      return
+    names = held_names(obj)
+    self.held_names[obj.id] = names
+    self.held.update(names)
+
+  def _unhold(self, obj):
+    names = self.held_names.pop(obj.id, None)
+    if names:
+      self.held.subtract(names)
+
+  def held_counts(self):
+    if self.held is None:
+      self.held, self.held_names = Counter(), {}
+      for obj in self.get():
+        self._hold(obj)
+    return self.held
+
+  def count_held(self, name):
+    return self.held_counts()[name.lower()]
+
+  def hidden_index(self):
+    if self.hidden is None:
+      self.hidden = HiddenIndex(self.get())
+    return self.hidden
+
+  def find_first(self, key):
+    if self.key_index is None:
+      self.reindex()
+    obj = self.key_index.first(key)
+    if obj and self.key_index.is_stale(obj):
+      self.reindex()
+      obj = self.key_index.first(key)
+    return obj
+
+
+def contents_changed(container):
+  """Let container know one of its contents got renamed, hidden, etc."""
+  if container and isinstance(container.contents_cache, IndexedContentsHandler):
+    container.contents_cache.changed()
+
+
+def scenery_version(container):
+  """See IndexedContentsHandler.scenery_version; None if not tracked."""
+  contents_cache = container.contents_cache
+  if isinstance(contents_cache, IndexedContentsHandler):
+    return contents_cache.scenery_version
+  return None
+
+
+def held_names(obj):
+  """obj's lowercased key and aliases."""
+  return frozenset([obj.key.lower()] + [alias.lower() for alias in obj.aliases.all()])
 
 
 def keymatch(obj, key):
   return obj.key.lower().startswith(key.lower())
 
 
+def keyed_contents(container, key):
+  """Contents of container whose keys start with key, case-insensitively."""
+  contents_cache = container.contents_cache
+  if isinstance(contents_cache, IndexedContentsHandler):
+    return contents_cache.find(key)
+  return [obj for obj in container.contents if keymatch(obj, key)]
+
+
+def is_stack(obj):
+  return getattr(obj, "is_stack", False)
+
+
+def find_stack(container, typeclass_path, exclude=None):
+  """A stack (see StackableObject) of the given typeclass held by container."""
+  contents_cache = container.contents_cache
+  if isinstance(contents_cache, IndexedContentsHandler):
+    obj = contents_cache.find_stack(typeclass_path)
+    if obj is None or obj != exclude:
+      return obj
+  for obj in container.contents:
+    if obj.typeclass_path == typeclass_path and obj != exclude:
+      return obj
+  return None
+
+
 def is_hidden(obj):
   return hasattr(obj, "is_hiding") and obj.is_hiding
 
 
+def hidden_index(container):
+  """container's HiddenIndex; built on the spot if it doesn't keep one."""
+  contents_cache = container.contents_cache
+  if isinstance(contents_cache, IndexedContentsHandler):
+    return contents_cache.hidden_index()
+  return HiddenIndex(container.contents)
+
+
+def count_held(container, name):
+  """How many of container's contents have name as their key or an alias."""
+  contents_cache = container.contents_cache
+  if isinstance(contents_cache, IndexedContentsHandler):
+    return contents_cache.count_held(name)
+  name = name.lower()
+  return sum(1 for obj in container.contents if name in held_names(obj))
+
+
+def held_counts(container):
+  """Counter of lowercased key or alias => how many of container's contents go by it.
+
+  Don't modify it; for an indexed container it's the index itself.
+  """
+  contents_cache = container.contents_cache
+  if isinstance(contents_cache, IndexedContentsHandler):
+    return contents_cache.held_counts()
+  counts = Counter()
+  for obj in container.contents:
+    counts.update(held_names(obj))
+  return counts
+
+
+def holds(container, name):
+  """Whether container holds something called name (exactly, case-insensitively)."""
+  return bool(name) and count_held(container, name) > 0
+
+
 def find_first(container, key):
+  contents_cache = container.contents_cache
+  if isinstance(contents_cache, IndexedContentsHandler):
+    return contents_cache.find_first(key)
   for obj in container.contents:
     if keymatch(obj, key):
       return obj
@@ -17,23 +224,24 @@ def find_first(container, key):
 
 
 def find_first_unhidden(container, key):
-  for obj in container.contents:
-    if keymatch(obj, key) and not is_hidden(obj):
+  for obj in keyed_contents(container, key):
+    if not is_hidden(obj):
       return obj
   return None
 
 
 def find_all_unhidden(container, key=None):
   if key:
-    return [x for x in container.contents if keymatch(x, key) and not is_hidden(x)]
+    return [x for x in keyed_contents(container, key) if not is_hidden(x)]
   else:
     return [x for x in container.contents if not is_hidden(x)]
 
 
 def find_exit(location, direction):
   if direction is not None and direction != Direction.INVALID:
-    for x in location.contents:
-      if (x.is_typeclass("typeclasses.exits.Exit", exact=False) 
-        and x.key.lower() == direction.name.lower()):
+    name = direction.name.lower()
+    for x in keyed_contents(location, name):
+      if (x.is_typeclass("typeclasses.exits.Exit", exact=False)
+        and x.key.lower() == name):
         return x
-  return None
\ No newline at end of file
+  return None
@@ -1,10 +1,52 @@
 from evennia import create_object
+from gamerules.find import find_stack
+from gamerules.wallet import GROUND, balance, gain
 
 STARTING_GOLD_AMOUNT = 50
+GOLD_TYPECLASS = "typeclasses.objects.Gold"
+
+
+def gold_stack(container):
+  return find_stack(container, GOLD_TYPECLASS)
+
+
+def add_to_stack(container, amount):
+  """Add amount, which may be negative, to the gold stack in container.
+
+  An existing stack is just topped up; a new one is only created when
+  there is none, right where it belongs, so there is nothing to merge.
+  """
+  existing = gold_stack(container)
+  if existing:
+    existing.add(amount)
+  elif amount >= 1:
+    # don't create zero or negative gold
+    gold = create_object(GOLD_TYPECLASS, key="gold", location=container)
+    gold.add(amount)
+
 
 def give_starting_gold(character):
-  gold = create_object("typeclasses.objects.Gold", key="gold")
-  gold.add(STARTING_GOLD_AMOUNT)
-  # use move_to() so we invoke StackableObject accumulation
-  gold.move_to(character, quiet=True)
-  character.msg(f"You now have {STARTING_GOLD_AMOUNT} gold.")
\ No newline at end of file
+  gain(character, STARTING_GOLD_AMOUNT)
+  character.msg(f"You now have {STARTING_GOLD_AMOUNT} gold.")
+
+
+def drop_ground_gold(room, amount):
+  """Leave gold lying in room, without making a Gold object for it yet."""
+  gain(room, amount, GROUND)
+
+
+def materialize_ground_gold(room):
+  """Turn room's ground pile into a Gold stack, so it can be seen and picked up."""
+  if not room:
+    return
+  amount = balance(room, GROUND)
+  if amount > 0:
+    gain(room, -amount, GROUND)
+    add_to_stack(room, amount)
+
+
+def pocket_gold(character, gold):
+  """Fold a Gold object into character's wallet."""
+  amount = gold.db.amount or 0
+  gold.delete()
+  gain(character, amount)
@@ -0,0 +1,97 @@
+from gamerules.rng import RNG
+
+
+EXIT_TYPECLASS = "typeclasses.exits.Exit"
+CHARACTER_TYPECLASS = "typeclasses.characters.Character"
+OBJECT_TYPECLASS = "typeclasses.objects.Object"
+
+
+class SampleSet:
+  """A set that can also pick a random member in constant time."""
+  def __init__(self):
+    self._items = []
+    self._positions = {}
+
+  def __len__(self):
+    return len(self._items)
+
+  def __contains__(self, obj):
+    return obj in self._positions
+
+  def __iter__(self):
+    return iter(self._items)
+
+  def add(self, obj):
+    if obj not in self._positions:
+      self._positions[obj] = len(self._items)
+      self._items.append(obj)
+
+  def discard(self, obj):
+    pos = self._positions.pop(obj, None)
+    if pos is None:
+      return
+    # move the last item into the hole
+    last = self._items.pop()
+    if last is not obj:
+      self._items[pos] = last
+      self._positions[last] = pos
+
+  def choice(self):
+    return RNG.choice(self._items) if self._items else None
+
+
+class HiddenIndex:
+  """What's hidden in a room: objects, exits and people.
+
+  Lets searching pick straight from the hidden things instead of
+  scanning the room. Kept up to date by the room's contents handler as
+  things come and go, and by track_hidden() (see gamerules/hiding.py)
+  when something hides or is found.
+  """
+  def __init__(self, contents=()):
+    self.objects = SampleSet()
+    self.exits = SampleSet()
+    self.people = SampleSet()
+    # hidden person => hide level
+    self.hide_levels = {}
+    # all characters here, hidden or not
+    self.num_characters = 0
+    for obj in contents:
+      self.added(obj)
+
+  def _kind(self, obj):
+    if obj.is_typeclass(EXIT_TYPECLASS, exact=False):
+      return self.exits
+    if obj.is_typeclass(CHARACTER_TYPECLASS, exact=False):
+      return self.people
+    if obj.is_typeclass(OBJECT_TYPECLASS, exact=False):
+      return self.objects
+    return None
+
+  def added(self, obj):
+    if obj.is_typeclass(CHARACTER_TYPECLASS, exact=False):
+      self.num_characters += 1
+    self.update(obj)
+
+  def removed(self, obj):
+    if obj.is_typeclass(CHARACTER_TYPECLASS, exact=False):
+      self.num_characters -= 1
+    self.discard(obj)
+
+  def discard(self, obj):
+    self.objects.discard(obj)
+    self.exits.discard(obj)
+    self.people.discard(obj)
+    self.hide_levels.pop(obj, None)
+
+  def update(self, obj):
+    """Re-file obj after its hiding state (or hide level) changed."""
+    if not getattr(obj, "is_hiding", False):
+      self.discard(obj)
+      return
+    kind = self._kind(obj)
+    if kind is None:
+      return
+    kind.add(obj)
+    if kind is self.people:
+      self.hide_levels[obj] = obj.ndb.hiding
@@ -1,19 +1,60 @@
-import random
+from gamerules.access_flag import AccessFlag
+from gamerules.find import contents_changed, hidden_index
+from gamerules.rng import RNG
 from gamerules.special_room_kind import SpecialRoomKind
 
 
 MAX_HIDE = 15
 
+# what hiding used to do to view locks
+LEGACY_HIDDEN_VIEW_LOCK = "view:perm(see_hidden)"
 
-def evennia_hide(obj):
-  obj.locks.remove("view")
+
+# Hiding used to be done by rewriting view/traverse locks, which reparses
+# and saves the lock string every time. Now objects, characters and exits
+# expose AccessFlags (from their hiding state) that access() checks first,
+# and only fall back to the lock system when no flag applies.
+
+def sees_hidden(looker):
+  """Whether looker passes a perm(see_hidden) lock.
+
+  Not cached: @perm and quell change the answer without telling us, and
+  it's only asked about things that are actually hidden.
+  """
   # TODO: refactor permissions into an enum?
-  obj.locks.add("view:perm(see_hidden)")
+  return bool(looker.locks.check_lockstring(looker, "perm(see_hidden)"))
+
+
+def flag_access(flags, accessing_obj, access_type):
+  """Check access_type against AccessFlags, or None to ask the lock system."""
+  if access_type == "view" and flags & AccessFlag.HIDDEN:
+    return sees_hidden(accessing_obj)
+  if access_type == "traverse" and flags & AccessFlag.IMPASSABLE:
+    # like a none() lock, only superusers get past
+    return accessing_obj.is_superuser
+  return None
+
 
+def clear_legacy_hide_lock(obj):
+  """Undo a view lock left over from the old lock-based hiding."""
+  if obj.locks.get("view") == LEGACY_HIDDEN_VIEW_LOCK:
+    obj.locks.remove("view")
+    obj.locks.add("view:all()")
 
-def evennia_unhide(obj):
-  obj.locks.remove("view")
-  obj.locks.add("view:all()")
+
+def track_hidden(obj):
+  """Update the room's HiddenIndex after obj hides, is found or hides better."""
+  # a room that hasn't built its index yet will build it from how things are
+  index = getattr(obj.location.contents_cache, "hidden", None) if obj.location else None
+  if index is not None:
+    index.update(obj)
+
+
+def hidden_changed(obj):
+  """Call after changing obj's hiding state."""
+  clear_legacy_hide_lock(obj)
+  contents_changed(obj.location)
+  track_hidden(obj)
 
 
 def unhidden_others(hider):
@@ -51,7 +92,7 @@ def hide_object(hider, obj):
     return
 
   obj.db.hiding = 1
-  evennia_hide(obj)
+  hidden_changed(obj)
   hider.msg(f"You have hidden {obj.key}.")
 
 
@@ -66,7 +107,7 @@ def hide(hider):
 
   # check for hard-to-hide room
   if (room.is_special_kind(SpecialRoomKind.HARD_TO_HIDE)
-    and random.randint(0, 100) > 20):
+    and RNG.randint(0, 100) > 20):
     hider.msg("You couldn't find a place to hide.")
     return
 
@@ -78,7 +119,7 @@ def hide(hider):
       hider.msg("You can't hide when people are watching you.")
     return
 
-  if random.randint(0, 100) < 25:
+  if RNG.randint(0, 100) < 25:
     # hide fail
     if hider.ndb.hiding > 0:
       hider.msg("You could not find a better hiding place.")
@@ -95,9 +136,10 @@ def hide(hider):
 
   hider.ndb.hiding = hider.ndb.hiding + 1
   if hider.ndb.hiding > 1:
+    track_hidden(hider)
     hider.msg("You've managed to hide yourself a little better.")
   else:
-    evennia_hide(hider)
+    hidden_changed(hider)
     hider.msg("You've hidden yourself from view.")
 
 
@@ -106,80 +148,81 @@ def reveal(hider):
     hider.msg("You were not hiding.")
     return
   hider.ndb.hiding = 0
-  evennia_unhide(hider)
+  hidden_changed(hider)
   hider.msg("You are no longer hiding.")
   hider.location.msg_contents(f"{hider.key} has stepped out of the shadows.", exclude=[hider])
 
 
 def reveal_object(obj):
-  obj.db.hiding = 0
-  evennia_unhide(obj)
+  if obj.db.hiding:
+    obj.db.hiding = 0
+  hidden_changed(obj)
 
 
 def search(searcher):
   searcher.location.msg_contents(
     f"{searcher.key} seems to be looking for something.", exclude=[searcher])
-  rand = random.randint(0, 100)
+  hidden = hidden_index(searcher.location)
+  rand = RNG.randint(0, 100)
   found = False
   if rand < 20:
-    found = reveal_objects(searcher)
+    found = reveal_objects(searcher, hidden)
   elif rand < 40:
-    found = reveal_exits(searcher)
+    found = reveal_exits(searcher, hidden)
   else:
-    found = reveal_people(searcher)
+    found = reveal_people(searcher, hidden)
   if not found:
     searcher.msg("You haven't found anything.")
   else:
     searcher.location.msg_contents(f"{searcher.name} appears to have found something.", exclude=[searcher])
-  
-
-def reveal_objects(searcher):
-  for obj in searcher.location.contents:
-    if obj.is_typeclass("typeclasses.objects.Object", exact=False) and obj.is_hiding:
-      searcher.msg(f"You found {obj.name}.")
-      reveal_object(obj)
-      # only find one object at a time
-      return True
-  return False
 
 
-def find_exit(location, key):
-  for obj in location.contents:
-    if obj.is_typeclass('typeclasses.exits.Exit') and obj.key == key:
-      return obj
-  return None
+def reveal_objects(searcher, hidden):
+  # only find one object at a time
+  obj = hidden.objects.choice()
+  if obj is None:
+    return False
+  searcher.msg(f"You found {obj.name}.")
+  reveal_object(obj)
+  return True
 
 
-def reveal_exits(searcher):
-  # TODO: this is a weird algorithm
-  # the original algorithm tried 4 times, picking a random exit slot from NSEWUD and 
-  # seeing if that exit is hidden
-  exit_keys = ["north", "south", "east", "west", "up", "down"]
+def reveal_exits(searcher, hidden):
+  # the original algorithm tried 4 times, picking a random exit slot from
+  # NSEWUD and seeing if that exit is hidden; a try hits a hidden exit
+  # with odds (hidden exits / 6), so roll those odds and pick one directly
+  num_hidden = min(len(hidden.exits), 6)
+  if not num_hidden:
+    return False
   for _ in range(0, 4):
-    rand_key = random.choice(exit_keys)
-    rand_exit = find_exit(searcher.location, rand_key)
-    if rand_exit is not None and rand_exit.db.hiding > 0:
-      if rand_exit.db.hidden_desc:
-        searcher.msg(rand_exit.db.hidden_desc)
+    if RNG.randint(0, 5) < num_hidden:
+      found_exit = hidden.exits.choice()
+      if found_exit.db.hidden_desc:
+        searcher.msg(found_exit.db.hidden_desc)
       else:
-        exit_name = rand_exit.db.password or rand_exit.key
+        exit_name = found_exit.db.password or found_exit.key
         searcher.msg(f"You've found a hidden exit: {exit_name}.")
-      rand_exit.make_visible()
-      rand_exit.make_passable()
+      found_exit.make_visible()
+      found_exit.make_passable()
       return True
   return False
 
 
-def reveal_people(searcher):
-  # TODO: this logic is a bit wacko
-  characters = [
-    x for x in searcher.location.contents if x.is_typeclass("typeclasses.characters.Character")]
+def reveal_people(searcher, hidden):
+  # the original picked a random character in the room 7 times; a pick
+  # lands on a hidden person with odds (hidden people / characters)
+  num_hidden = len(hidden.people) - (searcher in hidden.people)
+  if num_hidden <= 0:
+    return False
   for retry in range(0, 7):
-    picked = random.choice(characters)
-    if (picked != searcher and picked.is_hiding
-      and random.randint(0, MAX_HIDE) > picked.ndb.hiding):
+    if RNG.randint(1, hidden.num_characters) > num_hidden:
+      continue
+    picked = hidden.people.choice()
+    while picked == searcher:
+      picked = hidden.people.choice()
+    if RNG.randint(0, MAX_HIDE) > hidden.hide_levels[picked]:
       picked.ndb.hiding = 0
-      evennia_unhide(picked)
+      hidden_changed(picked)
       searcher.msg(f"You've found {picked.key} hiding in the shadows!")
       picked.msg(f"You've been discovered by {searcher.key}!")
       searcher.location.msg_contents(
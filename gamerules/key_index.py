@@ -0,0 +1,65 @@
+from bisect import bisect_left, insort
+from operator import itemgetter
+
+
+class KeyIndex:
+  """Sorted index of a container's contents by lowercased key.
+
+  Prefix lookups are a bisect into the sorted keys rather than a scan
+  that lowercases every key. Matches come back in the order objects
+  were added, same as container.contents.
+  """
+  def __init__(self, objs=()):
+    # sorted list of (lowercased key, seq, id)
+    self._keys = []
+    # id => (lowercased key, seq, obj)
+    self._entries = {}
+    self._next_seq = 0
+    for obj in objs:
+      self.add(obj)
+
+  def __len__(self):
+    return len(self._entries)
+
+  def add(self, obj):
+    if obj.id in self._entries:
+      return
+    lkey = obj.key.lower()
+    seq = self._next_seq
+    self._next_seq += 1
+    self._entries[obj.id] = (lkey, seq, obj)
+    insort(self._keys, (lkey, seq, obj.id))
+
+  def remove(self, obj):
+    entry = self._entries.pop(obj.id, None)
+    if entry is None:
+      return
+    lkey, seq, _ = entry
+    idx = bisect_left(self._keys, (lkey, seq, obj.id))
+    if idx < len(self._keys) and self._keys[idx][2] == obj.id:
+      del self._keys[idx]
+
+  def is_stale(self, obj):
+    """Whether obj was renamed since it was indexed."""
+    entry = self._entries.get(obj.id)
+    return entry is not None and entry[0] != obj.key.lower()
+
+  def _prefix_range(self, key):
+    # every key starting with key sorts between key and key + a max char
+    lo = bisect_left(self._keys, (key,))
+    hi = bisect_left(self._keys, (key + "\U0010ffff",), lo)
+    return lo, hi
+
+  def first(self, key):
+    """The earliest added object whose key starts with key, or None."""
+    lo, hi = self._prefix_range(key.lower())
+    if lo == hi:
+      return None
+    _, _, obj_id = min(self._keys[lo:hi], key=itemgetter(1))
+    return self._entries[obj_id][2]
+
+  def prefix(self, key):
+    """All indexed objects whose keys start with key, in added order."""
+    lo, hi = self._prefix_range(key.lower())
+    matches = sorted(self._keys[lo:hi], key=itemgetter(1))
+    return [self._entries[obj_id][2] for _, _, obj_id in matches]
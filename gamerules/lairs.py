@@ -0,0 +1,103 @@
+"""
+Monster lairs
+
+Lair rooms (SpecialRoomKind.MONSTER_LAIR, magnitude = mob record id)
+are kept stocked by the lair ticker script rather than on the way in,
+so walking into a lair costs the same as walking anywhere else.
+
+Every tick, a lair with no mob in it (its own or a wanderer), no
+players, and no cooldown running gets a new mob. A lair whose
+mob is found gone waits LAIR_RESPAWN_SECONDS before restocking, and
+no more than MAX_SPAWNS_PER_TICK mobs are spawned per tick, so a cold
+start fills the lairs over a few ticks. Lair mobs are tagged LAIR_MOB_TAG
+and don't count towards the wandering mobs' MAX_MOBS.
+"""
+import time
+from evennia.objects.models import ObjectDB
+from gamerules.mobs import LAIR_MOB_TAG, has_mobs, mob_prototype_index, spawn_lair_mob
+from gamerules.special_room_kind import SpecialRoomKind
+from gamerules.special_rooms import SPECIAL_ROOMS
+
+
+LAIR_TICK_SECONDS = 10
+LAIR_RESPAWN_SECONDS = 60
+MAX_SPAWNS_PER_TICK = 5
+
+
+def is_mob(obj):
+  return obj.is_typeclass("typeclasses.mobs.Mob", exact=False)
+
+
+class LairManager:
+  def __init__(self):
+    self.prototypes = None
+    # SPECIAL_ROOMS.version our lair list was read at
+    self.version = None
+    # lair room id => room
+    self.lairs = {}
+    # lair room id => its mobs
+    self.mobs = {}
+    # lair room id => when it may next spawn
+    self.next_spawn = {}
+
+  def reload(self):
+    """Re-read prototypes and lairs lazily, e.g. after a world update."""
+    self.prototypes = None
+    self.version = None
+
+  def _refresh_lairs(self):
+    ids = SPECIAL_ROOMS.room_ids(SpecialRoomKind.MONSTER_LAIR)
+    new_ids = [room_id for room_id in ids if room_id not in self.lairs]
+    self.lairs = {room_id: self.lairs[room_id] for room_id in ids if room_id in self.lairs}
+    if new_ids:
+      for room in ObjectDB.objects.filter(id__in=new_ids):
+        self.lairs[room.id] = room
+        # mobs already there from before a reload; only stay-at-home ones are ours
+        mobs = [
+          obj for obj in room.contents if is_mob(obj) and obj.db.moves_between_rooms is False]
+        for mob in mobs:
+          mob.tags.add(LAIR_MOB_TAG)
+        self.mobs[room.id] = mobs
+    self.version = SPECIAL_ROOMS.version
+
+  def _ensure_loaded(self):
+    if self.prototypes is None:
+      self.prototypes = mob_prototype_index()
+    if not SPECIAL_ROOMS.loaded or self.version != SPECIAL_ROOMS.version:
+      self._refresh_lairs()
+
+  def _living_mobs(self, room):
+    mobs = [mob for mob in self.mobs.get(room.id, ()) if mob.id and mob.location == room]
+    self.mobs[room.id] = mobs
+    return mobs
+
+  def tick(self, now=None):
+    now = now or time.time()
+    self._ensure_loaded()
+    spawned = 0
+    for room_id, room in self.lairs.items():
+      if spawned >= MAX_SPAWNS_PER_TICK:
+        break
+      if self.next_spawn.get(room_id, 0) > now:
+        continue
+      num_mobs = len(self.mobs.get(room_id, ()))
+      mobs = self._living_mobs(room)
+      if len(mobs) < num_mobs:
+        # one died or wandered off; give it a while
+        self.next_spawn[room_id] = now + LAIR_RESPAWN_SECONDS
+        continue
+      if has_mobs(room):
+        continue
+      if any(obj.has_account for obj in room.contents):
+        # only spawn without anyone watching
+        continue
+      proto = self.prototypes.get(room.magnitude(SpecialRoomKind.MONSTER_LAIR))
+      if not proto:
+        # no such mob
+        continue
+      mobs.append(spawn_lair_mob(room, proto))
+      self.next_spawn[room_id] = now
+      spawned += 1
+
+
+LAIRS = LairManager()
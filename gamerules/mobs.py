@@ -1,13 +1,15 @@
-import random
-from evennia import create_object
 from evennia.prototypes import prototypes as protlib, spawner
 from evennia.utils.search import search_object_by_tag
 from gamerules.combat import apply_armor, attack_bystander_msg, attack_target_msg
-from gamerules.special_room_kind import SpecialRoomKind
+from gamerules.gold import drop_ground_gold
+from gamerules.rng import RNG
+from gamerules.wear import note_hit
 from gamerules.xp import calculate_kill_xp, set_xp, gain_xp
 
-# never spawn more than this many mobs in the world
+# never generate more than this many wandering mobs in the world
 MAX_MOBS = 20
+# lair mobs are stocked by gamerules/lairs.py, outside MAX_MOBS
+LAIR_MOB_TAG = "lair_mob"
 
 MOB_NAMES = [
   'Agroth','Agrit','Atamut','Ali Baba','Arnold','Aluzinthra','Atariana','Agmeish',
@@ -47,15 +49,16 @@ def resolve_mob_attack(mob, target, attack_name="claws"):
 
   # apply armor to reduce damage
   damage = apply_armor(target, damage)
+  note_hit(target)
 
   # target takes the damage
   target.gain_health(-damage, damager=mob, weapon_name=attack_name)
 
 
 def mob_attack_damage(mob, is_surprise=False):
-  rand_multiplier = .7 if is_surprise else random.random()
+  rand_multiplier = .7 if is_surprise else RNG.random()
   # TODO: consider mob.level_damage?
-  dmg = mob.base_damage + random.randint(0, mob.random_damage)
+  dmg = mob.base_damage + RNG.randint(0, mob.random_damage)
   if is_surprise:
     dmg = dmg + int(dmg * mob.shadow_damage_percent / 100)
   return dmg  
@@ -68,10 +71,7 @@ def mob_death(mob, killer=None):
     gain_xp(killer, xp)
 
   if mob.db.drop_gold:
-    gold = create_object("typeclasses.objects.Gold", key="gold")
-    gold.add(mob.db.drop_gold)
-    # use move_to() so we invoke StackableObject accumulation
-    gold.move_to(mob.location, quiet=True)
+    drop_ground_gold(mob.location, mob.db.drop_gold)
     mob.location.msg_contents(f"{mob.key} drops {mob.db.drop_gold} gold.")
 
   if mob.db.drop_object_id:
@@ -94,8 +94,8 @@ def generate_mob(location, level):
   if not mob_prototypes:
     # no valid prototypes found
     return
-  proto = random.choice(mob_prototypes)
-  mob_name = f"{random.choice(MOB_NAMES)} the {proto['key']}"
+  proto = RNG.choice(mob_prototypes)
+  mob_name = f"{RNG.choice(MOB_NAMES)} the {proto['key']}"
   mob = spawner.spawn({
     'prototype_parent': proto['prototype_key'], 'prototype_key': mob_name, 'key': mob_name,
   })[0]
@@ -103,16 +103,9 @@ def generate_mob(location, level):
   location.msg_contents(f"A {mob.key} appears!")
 
 
-def has_players_or_mobs(location):
-  for obj in location.contents:
-    if (obj.is_typeclass("typeclasses.characters.Character")
-      or obj.is_typeclass("typeclasses.mobs.Mob", exact=False)):
-      return True
-  return False
-
-
 def mob_count():
-  return len(all_mobs())
+  """Wandering mobs, towards MAX_MOBS; lair mobs don't count."""
+  return len(all_mobs()) - len(search_object_by_tag(LAIR_MOB_TAG))
 
 
 def all_mobs():
@@ -126,34 +119,23 @@ def has_mobs(location):
   return False
 
 
-def find_mob_prototype(mob_id):
-  record_id_tag = f"record_id_{mob_id}"
-  # unfortunately search_prototype() tags are OR'd,
-  # so we can't search for tags "mob" AND "record_id_123".
-  # Instead we do the second-pass filtering ourself.
-  mob_prototypes = protlib.search_prototype(tags=["mob"])
-  for proto in mob_prototypes:
-    if record_id_tag in proto["prototype_tags"]:
-      return proto
-  return None
+def mob_prototype_index():
+  """Mob prototypes by record id."""
+  index = {}
+  for proto in protlib.search_prototype(tags=["mob"]):
+    for tag in proto.get("prototype_tags") or ():
+      if tag.startswith("record_id_"):
+        index[int(tag[len("record_id_"):])] = proto
+  return index
 
 
-def maybe_spawn_mob_in_lair(location):
-  if not location.is_special_kind(SpecialRoomKind.MONSTER_LAIR):
-    # not a lair
-    return
-  if has_players_or_mobs(location):
-    # only spawn a new mob in a room devoid of players or mobs
-    return
-  mob_id = location.magnitude(SpecialRoomKind.MONSTER_LAIR)
-  proto = find_mob_prototype(mob_id)
-  if not proto:
-    # no such mob found
-    return
-  mob_name = f"{random.choice(MOB_NAMES)} the {proto['key']}"
+def spawn_lair_mob(location, proto):
+  mob_name = f"{RNG.choice(MOB_NAMES)} the {proto['key']}"
   mob = spawner.spawn({
     'prototype_parent': proto['prototype_key'], 'prototype_key': mob_name, 'key': mob_name,
   })[0]
   # stay in the lair
   mob.location = location
   mob.db.moves_between_rooms = False
+  mob.tags.add(LAIR_MOB_TAG)
+  return mob
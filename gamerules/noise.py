@@ -0,0 +1,40 @@
+"""
+Movement noise
+
+Whether the people in a room notice someone coming or going. A mover's
+move silent is their chance, in percent, of slipping by unheard; each
+listener's hear noise takes that chance down. Everyone in the room is
+rolled for in one pass, and the announcement is formatted once and only
+sent to those who heard.
+"""
+from gamerules.rng import RNG
+
+
+def move_silent(mover):
+  return getattr(mover, "total_move_silent", 0)
+
+
+def hear_noise(listener):
+  return getattr(listener, "hear_noise", 0)
+
+
+def listeners(mover, room, exclude=()):
+  """Those in room, besides mover and exclude, who hear mover move."""
+  silence = move_silent(mover)
+  others = [obj for obj in room.contents if obj != mover and obj not in exclude]
+  if silence <= 0:
+    return others
+  return [obj for obj in others if RNG.randint(0, 99) >= silence - hear_noise(obj)]
+
+
+def announce_move(mover, room, string, mapping=None):
+  """Tell the listeners in room about mover's move.
+
+  string may use {object}, {exit}, {origin} and {destination} like
+  msg_contents(); they're filled in with names, once for everyone.
+  """
+  if mapping:
+    string = string.format(**{
+      key: getattr(value, "name", value) for key, value in mapping.items()})
+  for listener in listeners(mover, room):
+    listener.msg(string, from_obj=mover)
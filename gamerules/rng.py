@@ -0,0 +1,85 @@
+"""
+Seedable randomness, and a session recorder
+
+Game rules roll with RNG instead of the random module, so a run can be
+seeded. RECORDER captures a session (the seed, a snapshot of the
+database, then every command and tick in order) that
+utils/benchmarks/replay.py plays back headless with the same rolls.
+
+Recordings are JSON lines: a header {"seed": ..., "db": ...}, then
+events like
+  {"t": 1.25, "kind": "cmd", "obj": 12, "raw": "north"}
+  {"t": 2.0, "kind": "tick", "name": "behavior"}
+  {"t": 30.0, "kind": "tick", "name": "health", "obj": 12}
+where t is seconds since the recording started and obj is an object id.
+"""
+import json
+import os
+import random
+import sqlite3
+import time
+from django.db import connection
+
+
+RNG = random.Random()
+
+
+def snapshot_db(path):
+  """Copy the live SQLite database to path."""
+  connection.ensure_connection()
+  target = sqlite3.connect(path)
+  try:
+    connection.connection.backup(target)
+  finally:
+    target.close()
+
+
+class Recorder:
+  def __init__(self):
+    self.file = None
+    self.path = None
+    self.started = None
+
+  @property
+  def recording(self):
+    return self.file is not None
+
+  def start(self, path, seed=None):
+    """Reseed RNG and start recording to path; returns the seed."""
+    self.stop()
+    if seed is None:
+      seed = random.randrange(2 ** 32)
+    db_path = f"{path}.db3"
+    snapshot_db(db_path)
+    RNG.seed(seed)
+    # line buffered, so a crashed server still leaves a usable recording
+    self.file = open(path, "w", buffering=1)
+    self.path = path
+    self.started = time.monotonic()
+    # the snapshot sits next to the recording, so they can be moved together
+    self._write({"seed": seed, "db": os.path.basename(db_path)})
+    return seed
+
+  def stop(self):
+    if self.file:
+      self.file.close()
+    self.file, self.path, self.started = None, None, None
+
+  def _write(self, event):
+    self.file.write(json.dumps(event) + "\n")
+
+  def _event(self, kind, **data):
+    if self.file:
+      self._write(dict(t=round(time.monotonic() - self.started, 3), kind=kind, **data))
+
+  def command(self, obj, raw_string):
+    self._event("cmd", obj=obj.id, raw=raw_string)
+
+  def tick(self, name, obj=None):
+    if obj is None:
+      self._event("tick", name=name)
+    else:
+      self._event("tick", name=name, obj=obj.id)
+
+
+RECORDER = Recorder()
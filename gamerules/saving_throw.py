@@ -1,3 +1,4 @@
+from gamerules.rng import RNG
 
 
 def make_saving_throw(target, save_name):
@@ -5,7 +6,7 @@ def make_saving_throw(target, save_name):
   # but that code also checks if >80, which would never happen. WTF?
   # Maybe it was supposed to be 10% per level? or max 8%?
   chance_to_save = target.level
-  if random.randint(0, 100) <= chance_to_save:
+  if RNG.randint(0, 100) <= chance_to_save:
     target.msg(f"You resisted the {save_name}.")
     target.location.msg_contents(
       f"{target.ket} resisted the {save_name}.", exclude=[target])
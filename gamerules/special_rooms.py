@@ -0,0 +1,121 @@
+"""
+Special room table
+
+Every room's special_kind_bitmask and magnitudes, held in flat arrays
+indexed by room id. Rooms answer is_special_kind() and magnitude() from
+here instead of unpickling their attributes on each check, and callers
+can ask for e.g. all heal rooms without touching every room.
+
+The table is loaded from the attribute rows on first use. Rooms push
+their own row on creation and whenever @set changes one of the two
+attributes (see Room.at_attribute_changed); anything that writes the
+attributes some other way should call update_room() or reload().
+"""
+from array import array
+from evennia.objects.models import ObjectDB
+from gamerules.special_room_kind import SpecialRoomKind
+
+
+NUM_MAGNITUDES = 32
+ATTR_KEYS = ("special_kind_bitmask", "magnitudes")
+
+
+class SpecialRoomTable:
+  def __init__(self):
+    self.loaded = False
+    # bumped on every change, so others can cache what they derive from us
+    self.version = 0
+    self.clear()
+
+  def clear(self):
+    self.version += 1
+    # room id => bitmask
+    self.bitmasks = array("L")
+    # room id * NUM_MAGNITUDES + kind => magnitude
+    self.magnitudes = array("l")
+
+  def _grow(self, room_id):
+    missing = room_id + 1 - len(self.bitmasks)
+    if missing > 0:
+      self.bitmasks.extend([0] * missing)
+      self.magnitudes.extend([0] * (missing * NUM_MAGNITUDES))
+
+  def _set(self, room_id, bitmask=None, magnitudes=None):
+    self.version += 1
+    self._grow(room_id)
+    if bitmask is not None:
+      self.bitmasks[room_id] = bitmask or 0
+    if magnitudes is not None:
+      row = [int(x or 0) for x in list(magnitudes)[:NUM_MAGNITUDES]]
+      row += [0] * (NUM_MAGNITUDES - len(row))
+      start = room_id * NUM_MAGNITUDES
+      self.magnitudes[start:start + NUM_MAGNITUDES] = array("l", row)
+
+  def load(self):
+    self.clear()
+    rows = ObjectDB.objects.filter(
+      db_attributes__db_key__in=ATTR_KEYS,
+      db_attributes__db_category=None,
+    ).values_list("id", "db_attributes__db_key", "db_attributes__db_value")
+    for room_id, key, value in rows:
+      if key == "special_kind_bitmask":
+        self._set(room_id, bitmask=value)
+      else:
+        self._set(room_id, magnitudes=value or ())
+    self.loaded = True
+
+  def reload(self):
+    """Reload lazily, e.g. after bulk attribute changes."""
+    self.loaded = False
+
+  def _ensure_loaded(self):
+    if not self.loaded:
+      self.load()
+
+  def update_room(self, room):
+    self._ensure_loaded()
+    self._set(room.id,
+      bitmask=room.attributes.get("special_kind_bitmask", default=0),
+      magnitudes=room.attributes.get("magnitudes", default=()))
+
+  def remove_room(self, room_id):
+    if self.loaded and room_id < len(self.bitmasks):
+      self._set(room_id, bitmask=0, magnitudes=())
+
+  def bitmask(self, room_id):
+    self._ensure_loaded()
+    if room_id is None or room_id >= len(self.bitmasks):
+      return 0
+    return self.bitmasks[room_id]
+
+  def is_special_kind(self, room_id, kind):
+    return bool(self.bitmask(room_id) & (1 << kind))
+
+  def special_kinds(self, room_id):
+    bitmask = self.bitmask(room_id)
+    return [kind for kind in SpecialRoomKind if bitmask & (1 << kind)]
+
+  def magnitude(self, room_id, kind):
+    self._ensure_loaded()
+    if room_id is None or room_id >= len(self.bitmasks):
+      return 0
+    return self.magnitudes[room_id * NUM_MAGNITUDES + kind]
+
+  def room_ids(self, kind, min_magnitude=None):
+    """Ids of rooms of the given kind, optionally with magnitude >= min_magnitude."""
+    self._ensure_loaded()
+    mask = 1 << kind
+    ids = [room_id for room_id, bitmask in enumerate(self.bitmasks) if bitmask & mask]
+    if min_magnitude is not None:
+      mags = self.magnitudes
+      ids = [room_id for room_id in ids
+        if mags[room_id * NUM_MAGNITUDES + kind] >= min_magnitude]
+    return ids
+
+  def rooms(self, kind, min_magnitude=None):
+    """Room objects of the given kind, see room_ids()."""
+    ids = self.room_ids(kind, min_magnitude)
+    return list(ObjectDB.objects.filter(id__in=ids)) if ids else []
+
+
+SPECIAL_ROOMS = SpecialRoomTable()
@@ -1,10 +1,10 @@
-import random
 from gamerules.combat import find_first_attackable
 from gamerules.direction import Direction
 from gamerules.distance_spell_behavior import DistanceSpellBehavior
 from gamerules.find import find_all_unhidden, find_exit, find_first_unhidden
 from gamerules.freeze import freeze
 from gamerules.hiding import reveal
+from gamerules.rng import RNG
 from gamerules.saving_throw import make_saving_throw
 from gamerules.spell_effect_kind import SpellEffectKind
 
@@ -97,7 +97,7 @@ def cast_spell(caster, spell, target=None,
       reveal(caster)
 
   # possibly fail
-  if spell.failure_chance and random.randint(0, 100) < spell.failure_chance:
+  if spell.failure_chance and RNG.randint(0, 100) < spell.failure_chance:
     if spell.failure_desc:
       caster.msg(spell.failure_desc)
     else:
@@ -191,7 +191,7 @@ def remove_spell_deflections(effect, targets):
   deflected = []
   for target in targets:
     if target.spell_deflect_armor:
-      if random.randint(0, 100) < target.spell_deflect_armor:
+      if RNG.randint(0, 100) < target.spell_deflect_armor:
         target.msg("The spell has been deflected by your armor!")
         target.location.msg_contents(
           f"The spell was deflected by {target.key}'s armor.", exclude=target)
@@ -301,7 +301,7 @@ def apply_heal_effect(effect, caster, targets):
   level_rand = effect.param_4
   base_heal = base + level_base * caster.level
   random_heal = rand + level_rand * caster.level
-  heal = base_heal + random.randint(0, random_heal)
+  heal = base_heal + RNG.randint(0, random_heal)
   for target in targets:
     target.gain_health(heal, damager=None)
 
@@ -342,7 +342,7 @@ def apply_hurt_effect(spell, effect, caster, targets):
   level_rand = effect.param_4
   base_dmg = base + level_base * caster.level
   random_dmg = rand + level_rand * caster.level
-  damage = base_dmg + random.randint(0, random_dmg)
+  damage = base_dmg + RNG.randint(0, random_dmg)
   caster.msg(f"Your {spell.key} spell does {damage} damage.")
 
   for target in targets:
@@ -356,7 +356,7 @@ def apply_sleep_effect(spell, effect, caster, targets):
   level_rand = effect.param_4
   base_sleep_time = base + level_base * caster.level
   random_sleep_time = rand + level_rand * caster.level
-  sleep_time = base_sleep_time + random.randint(0, random_sleep_time)
+  sleep_time = base_sleep_time + RNG.randint(0, random_sleep_time)
   freeze_duration = sleep_time / 100.0
 
   for target in targets:
@@ -387,7 +387,7 @@ def apply_distance_hurt_effect(spell, effect, caster,
   target=None, direction=None, distance_target_key=None):
   damage_base = effect.param_1
   damage_rand = effect.param_2
-  damage = damage_base + random.randint(0, damage_rand)
+  damage = damage_base + RNG.randint(0, damage_rand)
   max_range = effect.param_3
   behavior = DistanceSpellBehavior(effect.param_4)
 
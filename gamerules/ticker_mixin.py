@@ -1,6 +1,6 @@
-import random
 from evennia import TICKER_HANDLER
 from gamerules.mobs import generate_mob, has_mobs, MAX_MOBS, mob_count
+from gamerules.rng import RECORDER, RNG
 from gamerules.special_room_kind import SpecialRoomKind
 
 
@@ -48,9 +48,6 @@ class TickerMixin:
     except KeyError:
       pass
 
-  def add_trapdoor_ticker(self):
-    TICKER_HANDLER.add(TRAPDOOR_TICK_SECONDS, self.tick_trapdoor)
-
   def remove_trapdoor_ticker(self):
     try:
       TICKER_HANDLER.remove(TRAPDOOR_TICK_SECONDS, self.tick_trapdoor)
@@ -60,6 +57,7 @@ class TickerMixin:
   def tick_health(self):
     if not self.db or not self.location:
       return
+    RECORDER.tick("health", self)
     change = int((self.max_health - self.db.health) * (self.heal_speed / 1000))
     change = max(change, 1)  
     if self.is_poisoned:
@@ -72,6 +70,7 @@ class TickerMixin:
   def tick_mana(self):
     if not self.db or not self.location:
       return
+    RECORDER.tick("mana", self)
     if self.db.mana < self.max_mana:
       # AllStats.Stats.Mana := AllStats.Stats.Mana + (AllStats.MyHold.MaxMana) DIV 2;
       # TODO: so in two ticks the self will be fully mana-healed? is that correct?
@@ -82,6 +81,7 @@ class TickerMixin:
   def tick_mob_generator(self):
     if not self.db or not self.location:
       return
+    RECORDER.tick("mob_generator", self)
     if self.location.is_special_kind(SpecialRoomKind.NO_COMBAT):
       # never spawn mobs in a no-combat room
       return
@@ -90,23 +90,13 @@ class TickerMixin:
     else:
       # default is a 1% chance
       spawn_chance = 1
-    if (random.randint(0, 100) < spawn_chance
+    if (RNG.randint(0, 100) < spawn_chance
       and not has_mobs(self.location)
       and mob_count() < MAX_MOBS):
       # yay, let's make a monster
       generate_mob(self.location, self.level)
 
   def tick_trapdoor(self):
-    if not self.db or not self.location:
-      return
-    if not self.location.db.trap_chance or not self.location.db.trap_direction:
-      # no trapdoor here
-      return
-    # find the trapdoor exit
-    exits = self.location.search(
-      self.location.db.trap_direction, typeclass="typeclasses.exits.Exit", quiet=True)
-    if not exits:
-      return
-    if random.randint(0, 100) < self.location.db.trap_chance:
-      # away we go!
-      exits[0].at_traverse(self, exits[0].destination)  
+    # trapdoors are scheduled by gamerules/trapdoors.py; this stays so
+    # tickers saved before then can still be loaded and removed
+    pass
@@ -0,0 +1,76 @@
+"""
+Trapdoors
+
+A room with a trap_chance and trap_direction drops its occupants
+through the exit in that direction: each second there, a player has a
+trap_chance in 101 (randint(0, 100) < trap_chance) of falling.
+
+Rather than rolling every second for everyone online, a player is armed
+when they enter a trapdoor room: the second they'd fall on is drawn up
+front (a geometric draw from the per-second chance) and scheduled once.
+Leaving the room cancels it. Players in ordinary rooms cost nothing.
+"""
+import math
+from twisted.internet import reactor
+from gamerules.rng import RNG
+
+
+def fall_chance(room):
+  """Chance per second of falling through room's trapdoor."""
+  return min(room.db.trap_chance or 0, 101) / 101
+
+
+def seconds_until_fall(chance):
+  """Seconds until the first fall, rolling chance once a second."""
+  if chance >= 1:
+    return 1
+  # 1 - random() is in (0, 1], so log is defined
+  return max(1, math.ceil(math.log(1 - RNG.random()) / math.log(1 - chance)))
+
+
+def trap_exit(room):
+  """The trapdoor exit of room, or None; cached on the room."""
+  direction = room.db.trap_direction
+  if not room.db.trap_chance or not direction:
+    return None
+  cached = room.ndb.trap_exit
+  if cached is None or cached[0] != direction or not cached[1].id or cached[1].location != room:
+    exits = room.search(direction, typeclass="typeclasses.exits.Exit", quiet=True)
+    cached = (direction, exits[0] if exits else None)
+    room.ndb.trap_exit = cached
+  return cached[1]
+
+
+def trap_changed(room):
+  """Call after room's trap_chance or trap_direction changes."""
+  room.ndb.trap_exit = None
+  for obj in room.contents:
+    if obj.has_account:
+      arm(obj, room)
+
+
+def arm(character, room):
+  """Schedule character's fall through room's trapdoor, if it has one."""
+  disarm(character)
+  if not room or not trap_exit(room):
+    return
+  seconds = seconds_until_fall(fall_chance(room))
+  character.ndb.trapdoor = reactor.callLater(seconds, fall, character, room)
+
+
+def disarm(character):
+  pending = character.ndb.trapdoor
+  if pending is not None:
+    character.ndb.trapdoor = None
+    if pending.active():
+      pending.cancel()
+
+
+def fall(character, room):
+  character.ndb.trapdoor = None
+  if character.location != room or not character.has_account:
+    return
+  trapdoor = trap_exit(room)
+  if trapdoor:
+    # away we go!
+    trapdoor.at_traverse(character, trapdoor.destination)
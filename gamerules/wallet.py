@@ -0,0 +1,62 @@
+"""
+Gold ledger
+
+Gold is kept as integer balances in attributes rather than as Gold
+objects: a character's wallet and bank account, and a room's ground
+pile of loose gold. Gold objects only exist while gold is lying around
+visibly, see gamerules/gold.py.
+
+Balance changes go through a GoldTransaction, which applies a batch of
+changes together, and only if no balance would go negative.
+"""
+from django.db import transaction
+
+
+WALLET = "wallet"
+BANK = "gold_in_bank"
+GROUND = "ground_gold"
+
+
+def balance(holder, account=WALLET):
+  return holder.attributes.get(account, default=0) or 0
+
+
+class GoldTransaction:
+  """A batch of balance changes, applied all together or not at all.
+
+    tx = GoldTransaction()
+    tx.add(buyer, -price)
+    tx.add(seller, price)
+    if not tx.commit():
+      buyer.msg("You don't have enough gold.")
+  """
+  def __init__(self):
+    # (holder id, account) => [holder, change]
+    self.changes = {}
+
+  def add(self, holder, amount, account=WALLET):
+    entry = self.changes.setdefault((holder.id, account), [holder, 0])
+    entry[1] += amount
+    return self
+
+  def new_balances(self):
+    """(holder, account, new balance) for each balance that changes."""
+    return [
+      (holder, account, balance(holder, account) + change)
+      for (_, account), (holder, change) in self.changes.items() if change]
+
+  def commit(self):
+    """Apply the changes, unless a balance would go negative; returns success."""
+    new_balances = self.new_balances()
+    if any(new_balance < 0 for _, _, new_balance in new_balances):
+      return False
+    with transaction.atomic():
+      for holder, account, new_balance in new_balances:
+        holder.attributes.add(account, new_balance)
+    self.changes = {}
+    return True
+
+
+def gain(holder, amount, account=WALLET):
+  """Change one balance by amount; returns False if there isn't enough."""
+  return GoldTransaction().add(holder, amount, account).commit()
@@ -0,0 +1,87 @@
+"""
+Equipment wear
+
+A weapon wears each time it's swung and armor each time its wearer is
+hit: every use is a roll against the item's break chance, and every
+break takes its break magnitude off the item's condition. Condition
+scales the item's stat bonuses (see scale_effects()), and at zero the
+item breaks for good.
+
+Uses are only counted as they happen; the rolls are made in one batch
+at the end of each combat tick, so an item's condition is written at
+most once a tick however many swings it saw.
+"""
+from collections import Counter
+from evennia.utils import delay
+from gamerules.equipment_effect_kind import EquipmentEffectKind
+from gamerules.rng import RNG
+
+
+WEAR_TICK_SECONDS = 2
+ARMOR_EFFECTS = (EquipmentEffectKind.BASE_ARMOR, EquipmentEffectKind.DEFLECT_ARMOR)
+
+# item id => uses this tick, and item id => item
+_uses = Counter()
+_items = {}
+_scheduled = False
+
+
+def note_use(item):
+  """Count a use of item towards this tick's break rolls."""
+  global _scheduled
+  if not item.effect(EquipmentEffectKind.BREAK_CHANCE):
+    return
+  _uses[item.id] += 1
+  _items[item.id] = item
+  if not _scheduled:
+    _scheduled = True
+    delay(WEAR_TICK_SECONDS, apply_wear)
+
+
+def note_hit(target):
+  """target was hit; wear whatever armor it has on."""
+  equipment = target.attributes.get("equipment") or {}
+  for item in filter(None, equipment.values()):
+    if any(item.effect(kind) for kind in ARMOR_EFFECTS):
+      note_use(item)
+
+
+def roll_breaks(uses, break_chance):
+  return sum(1 for _ in range(uses) if RNG.randint(0, 100) < break_chance)
+
+
+def apply_wear():
+  """End of the combat tick: roll for breaks and write the new conditions."""
+  global _scheduled
+  pending = [(_items[item_id], uses) for item_id, uses in _uses.items()]
+  _uses.clear()
+  _items.clear()
+  _scheduled = False
+  for item, uses in pending:
+    if not item.id:
+      # deleted since
+      continue
+    breaks = roll_breaks(uses, item.effect(EquipmentEffectKind.BREAK_CHANCE))
+    if not breaks:
+      continue
+    magnitude = max(1, item.effect(EquipmentEffectKind.BREAK_MAGNITUDE))
+    condition = item.effect(EquipmentEffectKind.CONDITION) - breaks * magnitude
+    if condition > 0:
+      item.set_effect(EquipmentEffectKind.CONDITION, condition)
+      if item.location:
+        item.location.msg(f"Your {item.key} is damaged.")
+    else:
+      break_item(item)
+
+
+def break_item(item):
+  holder = item.location
+  if holder:
+    equipment = holder.attributes.get("equipment")
+    if equipment and equipment.get(item.db.equipment_slot) == item:
+      del equipment[item.db.equipment_slot]
+    holder.msg(f"|rYour {item.key} breaks!")
+    if holder.location:
+      holder.location.msg_contents(
+        f"{holder.name}'s {item.key} breaks!", exclude=[holder])
+  item.delete()
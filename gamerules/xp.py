@@ -1,3 +1,5 @@
+from world.who_list import who_changed
+
 
 MIN_XP = 0
 
@@ -54,5 +56,6 @@ def set_xp(target, new_xp):
   new_level = target.level
   if old_level != new_level:
     target.msg(f"You are now level {new_level}.")
+    who_changed(target)
     # level changes are reflected in various character method calculations
 
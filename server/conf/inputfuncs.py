@@ -25,6 +25,9 @@ as argument.
     default(session, cmdname, *args, **kwargs)
 
 """
+from evennia.server import inputfuncs as _default_inputfuncs
+from gamerules.rng import RECORDER as _RECORDER
+
 
 # def oob_echo(session, *args, **kwargs):
 #     """
@@ -50,3 +53,10 @@ as argument.
 #
 #     """
 #     pass
+
+
+def text(session, *args, **kwargs):
+  """Default text input, which gamerules.rng.RECORDER also records."""
+  if _RECORDER.recording and session.puppet and args and args[0].strip():
+    _RECORDER.command(session.puppet, args[0])
+  _default_inputfuncs.text(session, *args, **kwargs)
@@ -19,6 +19,12 @@ Lock functions in this module extend (and will overload same-named)
 lock functions from evennia.locks.lockfuncs.
 
 """
+from evennia.locks import lockfuncs as _default_lockfuncs
+from evennia.utils.utils import dbref as _dbref
+from gamerules.find import holds as _holds_name
+
+# module globals that are callable become lockfuncs, hence the underscores
+
 
 # def myfalse(accessing_obj, accessed_obj, *args, **kwargs):
 #    """
@@ -28,3 +34,17 @@ lock functions from evennia.locks.lockfuncs.
 #    """
 #    print "%s tried to access %s. Access denied." % (accessing_obj, accessed_obj)
 #    return False
+
+
+def holds(accessing_obj, accessed_obj, *args, **kwargs):
+  """holds(name) from the held names index instead of scanning contents.
+
+  Anything else (no args, dbrefs, attribute checks) goes to the default.
+  """
+  if len(args) == 1 and not _dbref(str(args[0]), reqhash=False):
+    try:
+      return _holds_name(accessing_obj, str(args[0]))
+    except AttributeError:
+      # e.g. an account or a session checking
+      pass
+  return _default_lockfuncs.holds(accessing_obj, accessed_obj, *args, **kwargs)
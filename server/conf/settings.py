@@ -53,6 +53,14 @@ DATABASES = {
     }
 }
 
+# utils/benchmarks/load_test.py creates and logs in hundreds of accounts
+# from one address, so it starts the server with the throttles off
+if os.getenv("LOAD_TEST"):
+    CREATION_THROTTLE_LIMIT = None
+    LOGIN_THROTTLE_LIMIT = None
+    MAX_CONNECTION_RATE = 100000
+    MAX_COMMAND_RATE = 100000
+
 DEFAULT_CHANNELS = [
      {
         "key": "Public",
@@ -11,19 +11,29 @@ import time
 from collections import deque
 from random import randint
 
-from evennia import create_object, DefaultCharacter, search_object, TICKER_HANDLER
+from evennia import DefaultCharacter, search_object, TICKER_HANDLER
 from evennia.commands import cmdhandler
+from evennia.utils.utils import lazy_property
 
+from gamerules.access_flag import AccessFlag
 from gamerules.alignment import Alignment
 from gamerules.combat import character_death
+from gamerules.equipment_effect_kind import EquipmentEffectKind
+from gamerules.equipment_effects import sum_effects
 from gamerules.equipment_slot import EquipmentSlot
-from gamerules.gold import give_starting_gold
+from gamerules.find import IndexedContentsHandler
+from gamerules.gold import give_starting_gold, gold_stack, pocket_gold
 from gamerules.health import MIN_HEALTH, health_msg
+from gamerules.hiding import clear_legacy_hide_lock, flag_access, track_hidden
 from gamerules.mana import MIN_MANA
+from gamerules.noise import announce_move
 from gamerules.talk import msg_global
 from gamerules.ticker_mixin import TickerMixin
+from gamerules.trapdoors import arm, disarm
+from gamerules.wallet import balance, gain
 from gamerules.xp import MIN_XP, level_from_xp
 from userdefined.models import CharacterClass
+from world.who_list import who_changed
 
 
 class Character(DefaultCharacter, TickerMixin):
@@ -46,6 +56,14 @@ class Character(DefaultCharacter, TickerMixin):
   at_post_puppet - Echoes "AccountName has entered the game" to the room.
 
   """
+  # we carry gold as a balance, see gamerules/wallet.py
+  has_wallet = True
+
+  @lazy_property
+  def contents_cache(self):
+    # index our inventory by key, see gamerules/find.py
+    return IndexedContentsHandler(self)
+
   def at_object_creation(self):
     """Called at initial creation."""
     super().at_object_creation()
@@ -68,6 +86,8 @@ class Character(DefaultCharacter, TickerMixin):
       self.db.mana = 0
     if self.db.brief_descriptions is None:
       self.db.brief_descriptions = False      
+    if self.db.wallet is None:
+      self.db.wallet = 0
     if self.db.gold_in_bank is None:
       self.db.gold_in_bank = 0
     if self.db.equipment is None:
@@ -78,12 +98,16 @@ class Character(DefaultCharacter, TickerMixin):
   
   def at_init(self):
     self.reset_transient_state()
+    if self.has_account:
+      # still puppeted across a reload, which loses scheduled falls
+      arm(self, self.location)
 
   def reset_transient_state(self):
     self.ndb.active_command = None
     self.ndb.command_queue = deque()
     self.ndb.frozen_until = 0
     self.ndb.hiding = 0
+    track_hidden(self)
     self.ndb.resting = False
 
   def at_post_puppet(self, **kwargs):
@@ -93,11 +117,20 @@ class Character(DefaultCharacter, TickerMixin):
     # "Welcome back, King Kickass.  Your last play was on 24-FEB-1991 at 3:35pm.
     self.msg(f"Welcome back, {self.name}.")
     self.reset_transient_state()
+    # we're no longer hiding, whatever our view lock says
+    clear_legacy_hide_lock(self)
+    # gold we carried before we had a wallet
+    gold = gold_stack(self)
+    if gold:
+      pocket_gold(self, gold)
     # idempotent ticker adds
     self.add_health_ticker()
     self.add_mana_ticker()
     self.add_mob_generator_ticker()
-    self.add_trapdoor_ticker()
+    # trapdoors are scheduled on room entry now; drop any old ticker
+    self.remove_trapdoor_ticker()
+    arm(self, self.location)
+    who_changed(self)
 
   def at_post_unpuppet(self, account, session=None, **kwargs):
     super().at_post_unpuppet(account, session, **kwargs)
@@ -105,7 +138,14 @@ class Character(DefaultCharacter, TickerMixin):
     self.remove_health_ticker()
     self.remove_mana_ticker()
     self.remove_mob_generator_ticker()
-    self.remove_trapdoor_ticker()
+    disarm(self)
+    # our sessions are already detached from us
+    who_changed(account)
+
+  def at_attribute_changed(self, attr_name):
+    """Called by @set after it changes or removes one of our attributes."""
+    if attr_name in ("xp", "character_class_key"):
+      who_changed(self)
 
   def at_after_move(self, source_location, **kwargs):
     if self.location.access(self, "view"):
@@ -174,7 +214,7 @@ class Character(DefaultCharacter, TickerMixin):
       "origin": location or "nowhere",
       "destination": destination or "nowhere",
     })
-    location.msg_contents(string, exclude=(self,), mapping=mapping)
+    announce_move(self, location, string, mapping=mapping)
     if success_msg:
       self.msg(success_msg)
 
@@ -230,7 +270,7 @@ class Character(DefaultCharacter, TickerMixin):
       "origin": origin or "nowhere",
       "destination": destination or "nowhere",
     })
-    destination.msg_contents(string, exclude=(self,), mapping=mapping)
+    announce_move(self, destination, string, mapping=mapping)
 
   # helper getters
 
@@ -240,18 +280,9 @@ class Character(DefaultCharacter, TickerMixin):
       self.ndb.character_class = CharacterClass.objects.get(db_key=self.db.character_class_key)
     return self.ndb.character_class
 
-  def gold_object(self):
-    for obj in self.contents:
-      if obj.is_typeclass("typeclasses.objects.Gold"):
-        return obj
-    return None
-
   @property
   def gold(self):
-    gold = self.gold_object()
-    if gold:
-      return gold.db.amount
-    return 0
+    return balance(self)
 
   @property
   def level(self):
@@ -287,6 +318,19 @@ class Character(DefaultCharacter, TickerMixin):
   def is_hiding(self):
     return self.ndb.hiding > 0
 
+  @property
+  def access_flags(self):
+    return AccessFlag.HIDDEN if self.is_hiding else AccessFlag(0)
+
+  def access(self, accessing_obj, access_type="read", default=False, no_superuser_bypass=False, **kwargs):
+    # see gamerules/hiding.py
+    if not no_superuser_bypass:
+      result = flag_access(self.access_flags, accessing_obj, access_type)
+      if result is not None:
+        return result
+    return super().access(accessing_obj, access_type=access_type, default=default,
+      no_superuser_bypass=no_superuser_bypass, **kwargs)
+
   @property
   def is_poisoned(self):
     return self.db.poisoned
@@ -342,13 +386,20 @@ class Character(DefaultCharacter, TickerMixin):
 
   # our damage, armor, etc is the sum of our equipped objects
 
-  def equipped_attr(self, attr_name):
+  def equipped_effects(self):
+    """The summed, condition scaled effect vectors of our equipped items."""
     # TODO: there may be None values in the dict post-dequip
-    equipped = filter(None, self.db.equipment.values())
-    # TODO: we need to consider equipment condition... condition/100 * val
-    # AttackSpeed := AttackSpeed + ROUND(AllStats.MyHold.Condition[OSlot] / 100 *
-    #            ( LookupEffect(Obj, EF_AttackSpeed)));
-    return sum(getattr(e.db, attr_name) for e in equipped)
+    vectors = [e.scaled_effects for e in filter(None, self.db.equipment.values())]
+    cached = self.ndb.equipped_effects
+    # items get new effect tuples when their effects change
+    if (cached is None or len(cached[0]) != len(vectors)
+        or any(a is not b for a, b in zip(cached[0], vectors))):
+      cached = (vectors, sum_effects(vectors))
+      self.ndb.equipped_effects = cached
+    return cached[1]
+
+  def equipped_attr(self, attr_name):
+    return self.equipped_effects()[EquipmentEffectKind[attr_name.upper()]]
 
   def class_plus_equipped_attr(self, attr_name):
     class_val = getattr(self.character_class, attr_name)
@@ -381,9 +432,7 @@ class Character(DefaultCharacter, TickerMixin):
   def base_armor(self):
     # TODO: ivars are named differently :P
     class_armor = self.character_class.armor
-    equipped = filter(None, self.db.equipment.values())
-    item_armor = sum(o.db.base_armor for o in equipped)
-    return class_armor + item_armor
+    return class_armor + self.equipped_attr("base_armor")
 
   @property
   def deflect_armor(self):
@@ -431,6 +480,10 @@ class Character(DefaultCharacter, TickerMixin):
   def total_move_silent(self):
     return self.base_move_silent + self.level_move_silent * self.level
 
+  @property
+  def hear_noise(self):
+    return self.class_plus_equipped_attr("hear_noise")
+
   @property
   def base_steal(self):
     return self.class_plus_equipped_attr("base_steal")
@@ -525,14 +578,6 @@ class Character(DefaultCharacter, TickerMixin):
     self.db.mana = max(MIN_MANA, min(self.max_mana, self.db.mana + amount))
 
   def gain_gold(self, amount):
-    existing = self.gold_object()
-    if existing:
-      existing.add(amount)
-    elif amount < 1:
-      # don't create zero or negative gold
-      return
-    else:
-      gold = create_object("typeclasses.objects.Gold", key="gold")
-      gold.add(amount)
-      gold.move_to(self, quiet=True)
+    """Returns False, changing nothing, if we can't pay -amount."""
+    return gain(self, amount)
 
@@ -8,9 +8,12 @@ for allowing Characters to traverse the exit to its destination.
 """
 from evennia import DefaultExit
 from commands.movement import CmdExit
-from gamerules.exit_effects import apply_exit_effect
+from gamerules.access_flag import AccessFlag
+from gamerules.exit_effects import compile_exit
 from gamerules.exit_kind import ExitKind
-from gamerules.mobs import maybe_spawn_mob_in_lair
+from gamerules.find import contents_changed
+from gamerules.hiding import flag_access, track_hidden
+from world.world_map import structure_changed
 
 
 class Exit(DefaultExit):
@@ -59,7 +62,29 @@ class Exit(DefaultExit):
     self.db.hiding = 0
     # description to show if exit was hidden then found
     self.db.hidden_desc = None
+    # see access_flags
+    self.db.access_flags = None
     self.db.auto_look = True
+    structure_changed()
+
+  def at_object_delete(self):
+    structure_changed()
+    return True
+
+  @property
+  def pipeline(self):
+    """Our compiled checks and effects, see gamerules/exit_effects.py."""
+    if self.ndb.pipeline is None:
+      self.ndb.pipeline = compile_exit(self)
+    return self.ndb.pipeline
+
+  def exit_changed(self):
+    """Call after changing our attributes other than through @set."""
+    self.ndb.pipeline = None
+
+  def at_attribute_changed(self, attr_name):
+    """Called by @set after it changes or removes one of our attributes."""
+    self.exit_changed()
 
   def at_traverse(self, traversing_object, target_location, **kwargs):
     """Override superclass for custom exit messaging.
@@ -71,10 +96,6 @@ class Exit(DefaultExit):
             overriding the call (unused by default).
     """
     source_location = traversing_object.location
-
-    # check for mob lair at our destination
-    maybe_spawn_mob_in_lair(target_location)
-
     if traversing_object.move_to(target_location,
         # TODO: this is too-powerful way to control character looking
         move_hooks=self.db.auto_look != False,
@@ -89,8 +110,7 @@ class Exit(DefaultExit):
 
   def at_after_traverse(self, traversing_object, source_location, **kwargs):
     # note: this is taking place *after* we have moved to the new location.
-    if self.db.exit_effect_kind:
-      apply_exit_effect(traversing_object, source_location, self.db.exit_effect_kind, self.db.exit_effect_value)
+    self.pipeline.apply(traversing_object, source_location)
     if self.db.hidden_desc:
       # re-hide the exit
       self.make_invisible()
@@ -100,23 +120,65 @@ class Exit(DefaultExit):
     fail_msg = self.db.fail_msg if self.db.fail_msg else "You can't go that way."
     traversing_object.msg(fail_msg)
 
+  @property
+  def access_flags(self):
+    """Current AccessFlags; see gamerules/hiding.py.
+
+    db.access_flags holds the resting state, e.g. hidden and impassable
+    for a searchable hidden exit. Finding or re-hiding the exit only
+    changes the non-persistent copy in ndb, so it costs no lock or
+    database writes, and hidden exits are hidden again after a reload.
+    """
+    if self.ndb.access_flags is None:
+      self.ndb.access_flags = AccessFlag(self.db.access_flags or 0)
+    return self.ndb.access_flags
+
+  def _set_access_flags(self, flags):
+    if flags != self.access_flags:
+      self.ndb.access_flags = flags
+      contents_changed(self.location)
+      track_hidden(self)
+
+  def _migrate_hiding_locks(self):
+    # exits built with lock-based hiding get their locks reset once, and
+    # their hidden state moved into access flags
+    if self.db.access_flags is not None or not self.db.hidden_desc:
+      return
+    hidden = bool(self.db.hiding)
+    for access_type in ("view", "traverse"):
+      self.locks.remove(access_type)
+      self.locks.add(f"{access_type}:all()")
+    flags = AccessFlag.HIDDEN | AccessFlag.IMPASSABLE
+    self.db.access_flags = int(flags)
+    self.ndb.access_flags = flags if hidden else AccessFlag(0)
+
+  def at_init(self):
+    super().at_init()
+    self._migrate_hiding_locks()
+
+  def access(self, accessing_obj, access_type="read", default=False, no_superuser_bypass=False, **kwargs):
+    if not no_superuser_bypass:
+      result = flag_access(self.access_flags, accessing_obj, access_type)
+      if result is not None:
+        return result
+    return super().access(accessing_obj, access_type=access_type, default=default,
+      no_superuser_bypass=no_superuser_bypass, **kwargs)
+
+  @property
+  def is_hiding(self):
+    return bool(self.access_flags & AccessFlag.HIDDEN)
+
   def make_passable(self):
-    self.locks.remove("traverse")
-    self.locks.add("traverse:all()")
+    self._set_access_flags(self.access_flags & ~AccessFlag.IMPASSABLE)
 
   def make_impassable(self):
-    self.locks.remove("traverse")
-    self.locks.add("traverse:none()")
+    self._set_access_flags(self.access_flags | AccessFlag.IMPASSABLE)
 
   def make_visible(self):
-    self.db.hiding = 0
-    self.locks.remove("view")
-    self.locks.add("view:all()")
+    self._set_access_flags(self.access_flags & ~AccessFlag.HIDDEN)
 
   def make_invisible(self):
-    self.db.hiding = 1
-    self.locks.remove("view")
-    self.locks.add("view:perm(see_hidden)")
+    self._set_access_flags(self.access_flags | AccessFlag.HIDDEN)
 
   def get_display_name(self, looker, **kwargs):
     if self.db.exit_desc:
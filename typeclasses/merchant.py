@@ -1,6 +1,8 @@
 from evennia.utils import evtable
-from evennia.prototypes.spawner import spawn
+from gamerules.commerce import stock_entry
+from gamerules.find import scenery_version
 from typeclasses.objects import Object
+from world.market import MARKET
 
 
 class Merchant(Object):
@@ -8,29 +10,70 @@ class Merchant(Object):
     super().at_object_creation()
     self.sticky = True
     self.db.for_sale_keys = []
-    # spawn("axe")[0].location = self
-    # spawn("cudgel")[0].location = self
-    # spawn("dirk")[0].location = self
-    # spawn("iron_bar")[0].location = self
-    # spawn("meat_cleaver")[0].location = self
-    # spawn("short_sword")[0].location = self
-    # spawn("book_of_shadows")[0].location = self
-    # spawn("grand_grimoire")[0].location = self
-    # spawn("mabinogian")[0].location = self
+    # list of {"prototype_key", "key", "price"}, see gamerules/commerce.py
+    self.db.stock = []
 
   def basetype_posthook_setup(self):
     # overriding this so we can do some post-init
     # after spawning, as BaseObject.at_first_save() applies _create_dict field values
     # *after* calling at_object_creation()
     super().basetype_posthook_setup()
-    for key in self.db.for_sale_keys:
-      spawn(key)[0].location = self
+    self.restock()
+    if MARKET.loaded:
+      MARKET.add_merchant(self)
+
+  def at_object_delete(self):
+    MARKET.remove_merchant(self)
+    return super().at_object_delete()
+
+  def at_after_move(self, source_location, **kwargs):
+    super().at_after_move(source_location, **kwargs)
+    MARKET.merchant_moved(self)
+
+  def restock(self):
+    """Rebuild our stock from for_sale_keys."""
+    self.db.stock = list(filter(None, (stock_entry(key) for key in self.db.for_sale_keys or [])))
+    self.stock_changed()
+
+  def stock_changed(self):
+    self.ndb.for_sale = None
+
+  def at_attribute_changed(self, attr_name):
+    """Called by @set after it changes or removes one of our attributes."""
+    if attr_name == "for_sale_keys":
+      self.restock()
+    elif attr_name == "stock":
+      self.stock_changed()
+
+  def _for_sale(self):
+    # (contents version, [(key, price, source)], rendered price table),
+    # rebuilt when our stock or contents change
+    version = scenery_version(self)
+    cached = self.ndb.for_sale
+    if cached is None or cached[0] != version:
+      items = [(entry["key"], entry["price"], entry["prototype_key"]) for entry in self.db.stock or []]
+      # anything admins gave us to sell, or stock spawned before we had prototype stock
+      items += [(obj.key, obj.worth, obj) for obj in self.contents]
+      table = evtable.EvTable("Item", "Cost")
+      for key, price, _ in items:
+        table.add_row(key, price)
+      cached = (version, items, f"You see a merchant, hawking their wares:\n{table}")
+      self.ndb.for_sale = cached
+    return cached
+
+  def for_sale(self):
+    """[(key, price, source)]; source is a prototype key or an object, see sell_item()."""
+    return self._for_sale()[1]
+
+  def find_for_sale(self, key):
+    key = key.lower()
+    for item in self.for_sale():
+      if item[0].lower().startswith(key):
+        return item
+    return None
 
   def return_appearance(self, looker, **kwargs):
-    table = evtable.EvTable("Item", "Cost")
-    for obj in self.contents:
-      table.add_row(obj.key, obj.worth)
-    return f"You see a merchant, hawking their wares:\n{table}"
+    return self._for_sale()[2]
 
   def at_object_receive(self, moved_obj, source_location, **kwargs):
     # only admins can give objects to merchant to go on sale
@@ -40,4 +83,3 @@ class Merchant(Object):
       moved_obj.delete()
       if source_location and hasattr(source_location, "msg"):
         source_location.msg("Sweet, merchants love free stuff.")
-
@@ -1,9 +1,9 @@
 from enum import IntEnum
-import random
 from evennia import GLOBAL_SCRIPTS, TICKER_HANDLER
 from gamerules.health import MIN_HEALTH, health_msg
 from gamerules.mob_kind import MobKind
 from gamerules.mobs import mob_death, resolve_mob_attack
+from gamerules.rng import RNG
 from gamerules.ticker_mixin import TickerMixin
 from gamerules.xp import level_from_xp
 from typeclasses.objects import Object
@@ -15,6 +15,19 @@ from typeclasses.objects import Object
 # goes to attacking state and adds self to global ticker
 # if not target available, goes to IDLE and unhooks from global ticker
 
+
+def global_ticker_targets():
+  """Target sets of the global mob tickers that are running.
+
+  They're stopped when everyone logs out, and never started in a replay
+  (utils/benchmarks/replay.py); each picks up all mobs when it starts.
+  """
+  for script in (GLOBAL_SCRIPTS.behavior_ticker, GLOBAL_SCRIPTS.health_ticker):
+    targets = script.ndb.targets if script else None
+    if targets is not None:
+      yield targets
+
+
 class MobBehavior(IntEnum):
   IDLE = 0
   PATROLLING = 1
@@ -82,7 +95,7 @@ class OldMob(Object, TickerMixin):
     # *after* calling at_object_creation()
     super().basetype_posthook_setup()
     # TODO: what about level_health and level_mana? do mobs have a level?
-    self.db.max_health = self.db.base_health + random.randint(0, self.db.random_health)
+    self.db.max_health = self.db.base_health + RNG.randint(0, self.db.random_health)
     self.db.health = self.db.max_health
     self.db.max_mana = self.db.base_mana
     self.db.mana = self.db.max_mana
@@ -191,7 +204,7 @@ class OldMob(Object, TickerMixin):
     characters = [x for x in location.contents 
       if x.is_typeclass("typeclasses.characters.Character") and not x.is_hiding]
     if characters:
-      target = random.choice(characters)
+      target = RNG.choice(characters)
       return target
 
   def _set_ticker(self, interval, hook_key, stop=False):
@@ -233,8 +246,8 @@ class OldMob(Object, TickerMixin):
         callback=getattr(self, hook_key), idstring=idstring)
 
   def _maybe_say_something(self):
-    if random.random() < 0.01 and self.db.irregular_msgs:
-      self.location.msg_contents(random.choice(self.db.irregular_msgs))
+    if RNG.random() < 0.01 and self.db.irregular_msgs:
+      self.location.msg_contents(RNG.choice(self.db.irregular_msgs))
 
   def start_idle(self):
     """Starts just standing around. This will kill the ticker and do nothing more."""
@@ -295,7 +308,7 @@ class OldMob(Object, TickerMixin):
       exits = [x for x in self.location.exits if x.access(self, "traverse")]
       if exits:
         # randomly pick an exit
-        exit = random.choice(exits)
+        exit = RNG.choice(exits)
         # move there.
         self.move_to(exit.destination)
       else:
@@ -400,7 +413,7 @@ class Mob(Object, TickerMixin):
     # *after* calling at_object_creation()
     super().basetype_posthook_setup()
     # TODO: what about level_health and level_mana? do mobs have a level?
-    self.db.max_health = self.db.base_health + random.randint(0, self.db.random_health)
+    self.db.max_health = self.db.base_health + RNG.randint(0, self.db.random_health)
     self.db.health = self.db.max_health
     self.db.max_mana = self.db.base_mana
     self.db.mana = self.db.max_mana
@@ -418,12 +431,12 @@ class Mob(Object, TickerMixin):
     return True
 
   def add_to_global_tickers(self):
-    GLOBAL_SCRIPTS.behavior_ticker.ndb.targets.add(self)
-    GLOBAL_SCRIPTS.health_ticker.ndb.targets.add(self)
+    for targets in global_ticker_targets():
+      targets.add(self)
 
   def remove_from_global_tickers(self):
-    GLOBAL_SCRIPTS.behavior_ticker.ndb.targets.remove(self)
-    GLOBAL_SCRIPTS.health_ticker.ndb.targets.remove(self)
+    for targets in global_ticker_targets():
+      targets.discard(self)
 
   def at_new_arrival(self, new_character):
     """This is triggered whenever a new character enters the room.
@@ -525,12 +538,12 @@ class Mob(Object, TickerMixin):
     characters = [x for x in location.contents 
       if x.is_typeclass("typeclasses.characters.Character") and not x.is_hiding]
     if characters:
-      target = random.choice(characters)
+      target = RNG.choice(characters)
       return target
 
   def _maybe_say_something(self):
-    if random.random() < 0.01 and self.db.irregular_msgs:
-      self.location.msg_contents(random.choice(self.db.irregular_msgs))
+    if RNG.random() < 0.01 and self.db.irregular_msgs:
+      self.location.msg_contents(RNG.choice(self.db.irregular_msgs))
 
   def do_patrol(self, *args, **kwargs):
     """Called repeatedly during patrolling mode.  
@@ -555,7 +568,7 @@ class Mob(Object, TickerMixin):
       exits = [x for x in self.location.exits if x.access(self, "traverse")]
       if exits:
         # randomly pick an exit
-        exit = random.choice(exits)
+        exit = RNG.choice(exits)
         # move there.
         self.move_to(exit.destination)
       else:
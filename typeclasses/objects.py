@@ -14,9 +14,16 @@ import random
 
 from evennia import CmdSet, Command, DefaultExit, DefaultObject
 from evennia.utils import delay, search
+from evennia.utils.utils import lazy_property
 
+from gamerules.access_flag import AccessFlag
+from gamerules.equipment_effect_kind import EquipmentEffectKind
+from gamerules.equipment_effects import effect_attribute_names, effect_vector, scale_effects
 from gamerules.equipment_slot import EquipmentSlot
+from gamerules.find import IndexedContentsHandler, contents_changed, find_stack
+from gamerules.gold import pocket_gold
 from gamerules.health import MIN_HEALTH, health_msg
+from gamerules.hiding import flag_access
 from gamerules.object_kind import ObjectKind
 from gamerules.special_room_kind import SpecialRoomKind
 from userdefined.models import Spell
@@ -166,6 +173,11 @@ class Object(DefaultObject):
    at_say(speaker, message)  - by default, called if an object inside this
                                object speaks
   """
+  @lazy_property
+  def contents_cache(self):
+    # containers (merchants, mobs) get key-indexed contents too
+    return IndexedContentsHandler(self)
+
   def at_object_creation(self):
     super().at_object_creation()
     self.db.record_id = None
@@ -190,10 +202,35 @@ class Object(DefaultObject):
   def worth(self):
     return self.db.worth or 0
 
+  def effect(self, kind):
+    """Magnitude of an EquipmentEffectKind; only Equipment has any."""
+    return 0
+
+  @property
+  def charges(self):
+    return self.db.charges or 0
+
+  @charges.setter
+  def charges(self, value):
+    self.db.charges = value
+
   @property
   def is_hiding(self):
     return self.db.hiding > 0
 
+  @property
+  def access_flags(self):
+    return AccessFlag.HIDDEN if self.is_hiding else AccessFlag(0)
+
+  def access(self, accessing_obj, access_type="read", default=False, no_superuser_bypass=False, **kwargs):
+    # hiding is checked without going through the lock system
+    if not no_superuser_bypass:
+      result = flag_access(self.access_flags, accessing_obj, access_type)
+      if result is not None:
+        return result
+    return super().access(accessing_obj, access_type=access_type, default=default,
+      no_superuser_bypass=no_superuser_bypass, **kwargs)
+
   def at_before_get(self, getter, **kwargs):
     if self.db.sticky:
       if self.db.get_fail_msg:
@@ -221,6 +258,9 @@ class Object(DefaultObject):
 
 
 class StackableObject(Object):
+  # stacks of the same typeclass merge when they meet, see find_stack()
+  is_stack = True
+
   def at_object_creation(self):
     super().at_object_creation()
     self.db.amount = 0
@@ -248,17 +288,18 @@ class StackableObject(Object):
   def add(self, amount):
     self.db.amount = (self.db.amount or 0) + amount
     self.db.desc = f"A {self._stack_name()}."
+    # our display name changed
+    contents_changed(self.location)
     if self.db.amount < 1:
       # don't keep empty stacks around
       self.delete()
 
   def _maybe_add_to_existing(self, location):
     # see if getter already has a stack of this kind
-    existing = [x for x in location.contents if x.typeclass_path == self.path and x != self]
+    existing = find_stack(location, self.typeclass_path, exclude=self)
     if existing:
       # add our count to the existing object
-      obj = existing[0]
-      obj.add(self.db.amount)
+      existing.add(self.db.amount)
       self.delete()
 
   def at_after_move(self, source_location, **kwargs):
@@ -278,6 +319,13 @@ class Gold(StackableObject):
   def worth(self):
     return self.db.amount
 
+  def at_after_move(self, source_location, **kwargs):
+    if getattr(self.location, "has_wallet", False):
+      # carried gold lives in the wallet, see gamerules/wallet.py
+      pocket_gold(self.location, self)
+    else:
+      super().at_after_move(source_location, **kwargs)
+
 class Bland(Object):
   def at_object_creation(self):
     super().at_object_creation()
@@ -288,76 +336,77 @@ class Equipment(Object):
   def at_object_creation(self):
     super().at_object_creation()
     self.db.object_kind = ObjectKind.EQUIPMENT
-    # equipment effects
-    # TODO: keep as a sparse dict instead of fields?
-    # {EquipmentEffectKind:value}
-    # self.db.effects = {}
-    self.db.attack_speed = 0
-    self.db.base_armor = 0
-    self.db.base_claw_damage = 0
-    self.db.base_health = 0
-    self.db.base_mana = 0
-    self.db.base_move_silent = 0
-    self.db.base_steal = 0
-    self.db.base_weapon_damage = 0
-    self.db.base_weapon_use = 0    
-    self.db.bomb_base = 0
-    self.db.bomb_random = 0
-    self.db.bomb_time = 0
-    self.db.break_chance = 0
-    self.db.break_magnitude = 0
-    self.db.cast_spell = 0
-    self.db.character_class = 0
-    self.db.charges = 0
-    self.db.condition = 100
-    self.db.control = 0
-    self.db.crystal_radius = 0
-    self.db.cursed = 0
-    self.db.deflect_armor = 0
-    self.db.drop_destroy = 0
     self.db.equipment_slot = EquipmentSlot.NOT_EQUIPPABLE
-    self.db.group = 0
-    self.db.heal_speed = 0
-    self.db.hear_noise = 0
-    self.db.invisible = 0
-    self.db.largest_fit = 0
-    self.db.level_claw_damage = 0    
-    self.db.level_health = 0
-    self.db.level_mana = 0
-    self.db.level_move_silent = 0
-    self.db.level_steal = 0
-    self.db.level_weapon_use = 0
-    self.db.move_speed = 0
-    self.db.no_throw = 0
-    self.db.poison = 0
-    self.db.random_claw_damage = 0    
-    self.db.random_weapon_damage = 0
-    self.db.see_invisible = 0
-    self.db.size = 0
-    self.db.smallest_fit = 0
-    self.db.spell = 0
-    self.db.spell_armor = 0
-    self.db.spell_deflect_armor = 0
-    self.db.teleport = 0
-    self.db.throw_base = 0
-    self.db.throw_behavior = 0
-    self.db.throw_random = 0
-    self.db.throw_range = 0
-    self.db.trap = 0
-    self.db.xp = 0
+    # one value per EquipmentEffectKind, see gamerules/equipment_effects.py
+    self.db.effects = effect_vector()
+
+  def at_init(self):
+    super().at_init()
+    self._migrate_effect_attributes()
+
+  def _migrate_effect_attributes(self):
+    # equipment spawned before effect vectors has an attribute per effect
+    if not self.id or self.attributes.has("effects"):
+      return
+    legacy = {}
+    for kind in EquipmentEffectKind:
+      for name in effect_attribute_names(kind):
+        if self.attributes.has(name):
+          legacy.setdefault(kind, self.attributes.get(name))
+          self.attributes.remove(name)
+    self.db.effects = effect_vector(legacy)
+
+  def at_attribute_changed(self, attr_name):
+    """Called by @set after it changes or removes one of our attributes."""
+    if attr_name == "effects":
+      self.ndb.effects = None
+
+  @property
+  def effects(self):
+    """Our effect vector, as a tuple."""
+    if self.ndb.effects is None:
+      self.ndb.effects = tuple(self.db.effects or effect_vector())
+    return self.ndb.effects
+
+  def effect(self, kind):
+    return self.effects[kind]
+
+  @property
+  def scaled_effects(self):
+    """Our effects as they count towards stats, i.e. scaled by condition."""
+    effects = self.effects
+    cached = self.ndb.scaled_effects
+    if cached is None or cached[0] is not effects:
+      cached = (effects, scale_effects(effects))
+      self.ndb.scaled_effects = cached
+    return cached[1]
+
+  def set_effect(self, kind, value):
+    effects = list(self.effects)
+    effects[kind] = value
+    self.db.effects = effects
+    self.ndb.effects = tuple(effects)
+
+  @property
+  def charges(self):
+    return self.effect(EquipmentEffectKind.CHARGES)
+
+  @charges.setter
+  def charges(self, value):
+    self.set_effect(EquipmentEffectKind.CHARGES, value)
 
   def at_before_drop(self, dropper, **kwargs):
     # TODO: decide if we want to check drop access
     # if not self.access(dropper, "drop", default=False):
     #   dropper.msg(f"You cannot drop {self.get_display_name(dropper)}")
     #   return False
-    if self.db.cursed:
+    if self.effect(EquipmentEffectKind.CURSED):
       dropper.msg(f"The {self.key} is cursed.")
       return False
     return True
 
   def at_drop(self, dropper, **kwargs):
-    if (self.db.drop_destroy
+    if (self.effect(EquipmentEffectKind.DROP_DESTROY)
       or dropper.location.is_special_kind(SpecialRoomKind.OBJECT_DESTROY)):
      dropper.msg(f"The {self.key} was destroyed.")
      dropper.location.msg_contents(
@@ -366,7 +415,8 @@ class Equipment(Object):
      self.delete()
 
   def is_weapon(self):
-    return self.db.base_weapon_damage or self.db.random_weapon_damage
+    return (self.effect(EquipmentEffectKind.BASE_WEAPON_DAMAGE)
+      or self.effect(EquipmentEffectKind.RANDOM_WEAPON_DAMAGE))
 
 
 class Scroll(Object):
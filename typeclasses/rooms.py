@@ -9,15 +9,13 @@ from collections import defaultdict
 from enum import IntEnum
 from evennia import DefaultRoom
 from evennia.utils import evtable
-from evennia.utils.utils import list_to_string
-from gamerules.find import find_first
-from gamerules.special_room_kind import SpecialRoomKind
-
-
-# TODO: move this somewhere (utils?)
-def check_bit(num, offset):
-  mask = 1 << offset
-  return(num & mask)
+from evennia.utils.utils import lazy_property, list_to_string
+from gamerules.find import IndexedContentsHandler, holds, scenery_version
+from gamerules.gold import materialize_ground_gold
+from gamerules.special_rooms import SPECIAL_ROOMS
+from gamerules.trapdoors import arm, disarm, trap_changed
+from world.who_list import who_changed
+from world.world_map import structure_changed
 
 
 class WhichDesc(IntEnum):
@@ -28,6 +26,24 @@ class WhichDesc(IntEnum):
   SECONDARY_IF_OBJECT_ELSE_PRIMARY = 4
 
 
+class RoomContentsHandler(IndexedContentsHandler):
+  """Room contents, also arming trapdoors and updating the who list as
+  players come and go.
+
+  Exits with auto_look off move without hooks, so at_object_receive and
+  at_after_move can't be relied on to see every arrival; this can.
+  """
+  def add(self, obj):
+    super().add(obj)
+    if obj.has_account:
+      arm(obj, self.obj)
+      who_changed(obj)
+
+  def remove(self, obj):
+    super().remove(obj)
+    disarm(obj)
+
+
 class Room(DefaultRoom):
   """Rooms are like any Object, except their location is None
   (which is default). They also use basetype_setup() to
@@ -37,6 +53,11 @@ class Room(DefaultRoom):
   See examples/object.py for a list of
   properties and methods available on all Objects.
   """
+  @lazy_property
+  def contents_cache(self):
+    # index room contents by key for find_first() and friends
+    return RoomContentsHandler(self)
+
   def at_object_creation(self):
     super().at_object_creation()
     self.db.record_id = None
@@ -51,6 +72,20 @@ class Room(DefaultRoom):
     self.db.magic_object = None
     # dict of detail name => description
     self.db.details = {}
+    SPECIAL_ROOMS.update_room(self)
+    structure_changed()
+
+  def at_object_delete(self):
+    SPECIAL_ROOMS.remove_room(self.id)
+    structure_changed()
+    return True
+
+  def at_attribute_changed(self, attr_name):
+    """Called by @set after it changes or removes one of our attributes."""
+    if attr_name in ("special_kind_bitmask", "magnitudes"):
+      SPECIAL_ROOMS.update_room(self)
+    elif attr_name in ("trap_chance", "trap_direction"):
+      trap_changed(self)
 
   def at_object_receive(self, new_arrival, source_location):
     """
@@ -71,14 +106,13 @@ class Room(DefaultRoom):
           obj.at_new_arrival(new_arrival)
 
   def special_kinds(self):
-    return [x for x in SpecialRoomKind 
-      if check_bit(self.db.special_kind_bitmask, x.value)]
+    return SPECIAL_ROOMS.special_kinds(self.id)
 
   def is_special_kind(self, special_room_kind):
-    return check_bit(self.db.special_kind_bitmask, special_room_kind.value)
+    return SPECIAL_ROOMS.is_special_kind(self.id, special_room_kind)
 
   def magnitude(self, special_room_kind):
-    return self.db.magnitudes[special_room_kind.value]
+    return SPECIAL_ROOMS.magnitude(self.id, special_room_kind)
 
   def choose_desc(self, looker):
     if self.db.which_desc == WhichDesc.PRIMARY:
@@ -95,43 +129,95 @@ class Room(DefaultRoom):
         return self.db.desc
     elif self.db.which_desc == WhichDesc.PRIMARY_THEN_SECONDARY_IF_OBJECT:
       if self.db.secondary_desc is not None and self.db.magic_object is not None:
-        has_obj = find_first(looker, self.db.magic_object)
-        if has_obj:
+        if holds(looker, self.db.magic_object):
           return f"{self.db.desc}\n{self.db.secondary_desc}"
       return self.db.desc
     elif self.db.which_desc == WhichDesc.SECONDARY_IF_OBJECT_ELSE_PRIMARY:
       if self.db.secondary_desc is not None and self.db.magic_object is not None:
-        has_obj = find_first(looker, self.db.magic_object)
-        if has_obj:
+        if holds(looker, self.db.magic_object):
           return self.db.secondary_desc
       return self.db.desc
 
-  def return_appearance(self, looker, **kwargs):
-    """This formats a description. It is the hook a 'look' command
-    should call.
+  def _cached_scenery(self, looker):
+    """Exit and thing strings for looker, cached until the scenery changes.
 
-    Args:
-        looker (Object): Object doing the looking.
-        **kwargs (dict): Arbitrary, optional arguments for users
-            overriding the call (unused by default).
+    Renders are keyed by the room's scenery version (see
+    gamerules.find.IndexedContentsHandler), whether the looker sees
+    builder details, and the looker's view access to any contents with
+    conditional view locks (hidden things, object-only exits).
     """
-    if not looker:
-      return ""
-    # get and identify all objects
-    visible = (con for con in self.contents if con != looker and con.access(looker, "view"))
-    exits, users, things = [], [], defaultdict(list)
-    for con in visible:
+    if not looker.has_account:
+      # e.g. a mob looking; it may be part of the scenery itself
+      return self._render_scenery(looker, [con for con in self.contents if not con.has_account])
+    version = scenery_version(self)
+    cache = self.ndb.appearance_cache
+    if version is None or not cache or cache["version"] != version:
+      scenery = [con for con in self.contents if not con.has_account]
+      cache = {
+        "version": version,
+        "scenery": scenery,
+        # contents we need to check view access for on every look
+        "conditional": [
+          con for con in scenery
+          if con.locks.get("view") != "view:all()" or getattr(con, "access_flags", 0)],
+        "renders": {},
+      }
+      self.ndb.appearance_cache = cache
+    render_key = (
+      looker.locks.check_lockstring(looker, "perm(Builder)"),
+      tuple(con.access(looker, "view") for con in cache["conditional"]))
+    render = cache["renders"].get(render_key)
+    if render is None:
+      render = self._render_scenery(looker, cache["scenery"])
+      cache["renders"][render_key] = render
+    return render
+
+  def _render_scenery(self, looker, scenery):
+    exits, things = [], defaultdict(list)
+    for con in scenery:
+      if con == looker or not con.access(looker, "view"):
+        continue
       key = con.get_display_name(looker)
       if not key:
         # skip any no-description things
         continue
       if con.destination:
         exits.append(key)
-      elif con.has_account:
-        users.append("|c%s|n" % key)
       else:
         # things can be pluralized
         things[key].append(con)
+    thing_strings = []
+    for key, itemlist in sorted(things.items()):
+      nitem = len(itemlist)
+      if nitem == 1:
+        key, _ = itemlist[0].get_numbered_name(nitem, looker, key=key)
+      else:
+        key = [item.get_numbered_name(nitem, looker, key=key)[1] for item in itemlist][0]
+      thing_strings.append(key)
+    return exits, thing_strings
+
+  def return_appearance(self, looker, **kwargs):
+    """This formats a description. It is the hook a 'look' command
+    should call.
+
+    Args:
+        looker (Object): Object doing the looking.
+        **kwargs (dict): Arbitrary, optional arguments for users
+            overriding the call (unused by default).
+    """
+    if not looker:
+      return ""
+    # loose gold only becomes a Gold object once someone sees it
+    materialize_ground_gold(self)
+    # exits and things rarely change, so they come prebuilt
+    exits, thing_strings = self._cached_scenery(looker)
+    # (never pluralize users)
+    users = []
+    for con in self.contents:
+      if con.has_account and con != looker and con.access(looker, "view"):
+        key = con.get_display_name(looker)
+        if key:
+          users.append("|c%s|n" % key)
     # get description, build string
     string = "|c%s|n\n" % self.get_display_name(looker)
 
@@ -141,15 +227,6 @@ class Room(DefaultRoom):
         string += "%s\n" % desc
     if exits:
       string += "\n" + "\n".join(exits)
-    if users or things:
-      # handle pluralization of things (never pluralize users)
-      thing_strings = []
-      for key, itemlist in sorted(things.items()):
-        nitem = len(itemlist)
-        if nitem == 1:
-          key, _ = itemlist[0].get_numbered_name(nitem, looker, key=key)
-        else:
-          key = [item.get_numbered_name(nitem, looker, key=key)[1] for item in itemlist][0]
-        thing_strings.append(key)
+    if users or thing_strings:
       string += "\n|wYou see:|n " + list_to_string(users + thing_strings)
     return string
@@ -35,10 +35,15 @@ def start_global_scripts():
     create_script("typeclasses.scripts.HealthTicker", 
       key="health_ticker", persistent=False, obj=None)
 
+  if not GLOBAL_SCRIPTS.lair_ticker:
+    create_script("typeclasses.scripts.LairTicker",
+      key="lair_ticker", persistent=False, obj=None)
+
 
 def stop_global_scripts():
   GLOBAL_SCRIPTS.behavior_ticker.stop()
   GLOBAL_SCRIPTS.health_ticker.stop()
+  GLOBAL_SCRIPTS.lair_ticker.stop()
     
 
 
@@ -12,10 +12,11 @@ just overloads its hooks to have it perform its function.
 
 """
 
-import random
 from evennia import DefaultScript
 from evennia.utils.search import search_object_by_tag
 from gamerules.freeze import unfreeze
+from gamerules.lairs import LAIR_TICK_SECONDS, LAIRS
+from gamerules.rng import RECORDER
 
 
 class Script(DefaultScript):
@@ -124,7 +125,9 @@ class BehaviorTicker(Script):
     self.ndb.targets = set(search_object_by_tag("mob"))
 
   def at_repeat(self):
-    for target in self.ndb.targets:
+    RECORDER.tick("behavior")
+    # in id order, so a seeded run rolls for the same mobs on replay
+    for target in sorted(self.ndb.targets, key=lambda target: target.id):
       target.tick_behavior()
 
 
@@ -144,3 +147,15 @@ class HealthTicker(Script):
     for target in self.ndb.targets:
       target.tick_health()
 
+
+class LairTicker(Script):
+  """Global script for keeping monster lairs stocked, see gamerules/lairs.py."""
+  def at_script_creation(self):
+    self.key = "lair_ticker"
+    self.interval = LAIR_TICK_SECONDS
+    self.repeats = -1
+    self.persistent = True
+
+  def at_repeat(self):
+    RECORDER.tick("lair")
+    LAIRS.tick()
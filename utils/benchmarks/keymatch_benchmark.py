@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""Compare KeyIndex prefix lookups against the old linear keymatch scan.
+
+Simulates a large inventory and a crowded room, and times the kind of
+lookups that get, drop, look, use, equip, attack, buy and sell do.
+
+$ cd utils/benchmarks
+$ python keymatch_benchmark.py
+"""
+import random
+import sys
+import time
+sys.path.insert(0, '../..')
+
+from gamerules.key_index import KeyIndex
+
+
+WORDS = [
+  'amber', 'arrowhead', 'axe', 'bag', 'battleaxe', 'bent', 'book', 'broken',
+  'candle', 'cudgel', 'dagger', 'dirk', 'goblin', 'gold', 'grimoire', 'hammer',
+  'iron', 'key', 'lantern', 'longsword', 'mace', 'meat', 'orc', 'pelt', 'ring',
+  'rope', 'scroll', 'shield', 'short', 'spear', 'staff', 'sword', 'troll', 'wand',
+]
+LOOKUPS = 10000
+
+
+class Thing:
+  def __init__(self, obj_id, key):
+    self.id = obj_id
+    self.key = key
+
+
+def make_things(count, rng):
+  return [
+    Thing(obj_id, f"{rng.choice(WORDS).capitalize()} {rng.choice(WORDS)} {obj_id}")
+    for obj_id in range(count)]
+
+
+def linear_first(contents, key):
+  # the old gamerules.find.find_first()
+  for obj in contents:
+    if obj.key.lower().startswith(key.lower()):
+      return obj
+  return None
+
+
+def indexed_first(index, key):
+  return index.first(key)
+
+
+def bench(name, count, rng):
+  things = make_things(count, rng)
+  # a mix of ambiguous prefixes, specific names and misses
+  keys = []
+  for _ in range(LOOKUPS // 3):
+    keys.append(rng.choice(WORDS)[:rng.randint(2, 5)])
+    keys.append(rng.choice(things).key[:-1])
+    keys.append(rng.choice(WORDS) + "zz")
+
+  start = time.perf_counter()
+  expected = [linear_first(things, key) for key in keys]
+  linear = time.perf_counter() - start
+
+  start = time.perf_counter()
+  index = KeyIndex(things)
+  build = time.perf_counter() - start
+  start = time.perf_counter()
+  actual = [indexed_first(index, key) for key in keys]
+  indexed = time.perf_counter() - start
+  assert actual == expected
+
+  # objects coming and going, e.g. get/drop spam
+  start = time.perf_counter()
+  for thing in things[:100]:
+    index.remove(thing)
+    index.add(thing)
+  churn = time.perf_counter() - start
+
+  per_lookup = 1000000 / len(keys)
+  print(f"{name:<24} {count:6} objs: "
+    f"linear {linear * per_lookup:7.2f} us, indexed {indexed * per_lookup:7.2f} us per lookup, "
+    f"build {build * 1000:6.2f} ms, move {churn * 10000:6.2f} us")
+
+
+def main():
+  """Command-line script."""
+  rng = random.Random(1)
+  bench("small inventory", 20, rng)
+  bench("large inventory", 500, rng)
+  bench("crowded room", 2000, rng)
+  bench("very crowded room", 10000, rng)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,400 @@
+#!/usr/bin/python3
+"""Load test a local server with scripted telnet bots.
+
+Starts a server against a throwaway SQLite database (via TEST_DB_PATH),
+builds the world into it, then connects N bots that create accounts and
+wander Tai Tastigon: moving, looking, fighting whatever mob turns up,
+casting, buying and selling, searching and shouting.
+
+Every bot command is followed by "ping <unique text>". ping is a
+queued command like the rest, so it only runs after the command before
+it has sat out its freezes and prompts; the time until its "Pong ..."
+comes back is the command's round trip, whatever other players' chatter
+arrives in between. Prompts (e.g. cast's "At who?") are answered as
+they come up.
+
+While the bots run, the server process is sampled through /proc for CPU
+time and I/O: write_bytes and write syscalls, plus growth of the
+database file. At the end it prints latency percentiles per action and
+overall, throughput, CPU and write rates.
+
+$ cd utils/benchmarks
+$ python load_test.py --bots 100 --duration 120
+$ python load_test.py --bots 500 --ramp 60 --duration 300
+$ python load_test.py --no-server --port 4000 --bots 50   # an already running server
+
+A server you start yourself needs LOAD_TEST=1 in its environment, or
+Evennia's throttles will turn most of the bots away.
+
+Linux only (/proc), and needs the evennia launcher on the PATH.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+sys.path.insert(0, '../..')
+
+import world.generated_object_prototypes as object_prototypes
+
+
+GAME_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+SERVER_PID_FILE = os.path.join(GAME_DIR, 'server', 'server.pid')
+SPELLS_FILE = os.path.join(GAME_DIR, 'world', 'spell_data.json')
+
+# run in `evennia shell` against the fresh database
+SETUP_CODE = (
+  "from world import db_loader, world_loader; "
+  "db_loader.create_everything(); "
+  "world_loader.build_world()"
+)
+
+DIRECTIONS = ['north', 'south', 'east', 'west', 'up', 'down']
+# action => weight
+ACTIONS = {
+  'move': 30,
+  'look': 15,
+  'attack': 12,
+  'inventory': 8,
+  'cast': 6,
+  'buy': 6,
+  'sell': 4,
+  'search': 6,
+  'shout': 4,
+  'who': 5,
+  'sheet': 4,
+}
+PROMPT_RE = re.compile(r'(Direction\?|At who\?|Person to target\?)\s*$')
+# from gamerules/mobs.py generate_mob() and maybe a lair: "A Grog the Orc appears!"
+MOB_APPEARS_RE = re.compile(r'A (.+?) appears!')
+TELNET_IAC_RE = re.compile(rb'\xff[\xfb-\xfe].|\xff\xfa.*?\xff\xf0|\xff[\xf0-\xfa]', re.DOTALL)
+ANSI_RE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+
+
+def percentile(sorted_values, pct):
+  if not sorted_values:
+    return 0.0
+  idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+  return sorted_values[idx]
+
+
+def item_keys():
+  return sorted({
+    value['key'] for value in vars(object_prototypes).values()
+    if isinstance(value, dict) and 'key' in value and 'prototype_tags' in value})
+
+
+def spell_names():
+  with open(SPELLS_FILE) as f:
+    return [spell['name'] for spell in json.load(f)]
+
+
+class ProcSampler:
+  """CPU time and I/O counters of one process, from /proc."""
+  def __init__(self, pid, db_path=None):
+    self.pid = pid
+    self.db_path = db_path
+    self.clock_ticks = os.sysconf('SC_CLK_TCK')
+
+  def sample(self):
+    with open(f'/proc/{self.pid}/stat') as f:
+      # the command name may contain spaces, so split after it
+      fields = f.read().rsplit(')', 1)[1].split()
+    # utime and stime are fields 14 and 15, i.e. 11 and 12 after the name
+    cpu = (int(fields[11]) + int(fields[12])) / self.clock_ticks
+    io = {}
+    try:
+      with open(f'/proc/{self.pid}/io') as f:
+        for line in f:
+          key, value = line.split(':')
+          io[key] = int(value)
+    except PermissionError:
+      pass
+    db_size = 0
+    if self.db_path:
+      for suffix in ('', '-wal', '-journal'):
+        if os.path.exists(self.db_path + suffix):
+          db_size += os.path.getsize(self.db_path + suffix)
+    return {
+      'time': time.monotonic(),
+      'cpu': cpu,
+      'write_bytes': io.get('write_bytes', 0),
+      'syscw': io.get('syscw', 0),
+      'db_size': db_size,
+    }
+
+
+class Stats:
+  def __init__(self):
+    # action => [round trip seconds]
+    self.latencies = {}
+    self.timeouts = 0
+    self.errors = 0
+    self.logins = 0
+    # only count round trips inside the measured window
+    self.measuring = False
+
+  def add(self, action, seconds):
+    if self.measuring:
+      self.latencies.setdefault(action, []).append(seconds)
+
+  def all_latencies(self):
+    return list(itertools.chain.from_iterable(self.latencies.values()))
+
+
+class Bot:
+  def __init__(self, num, args, stats, items, spells, rng):
+    self.name = f'{args.prefix}{num}'
+    self.password = f'{args.prefix}-pw-{num}'
+    self.args = args
+    self.stats = stats
+    self.items = items
+    self.spells = spells
+    self.rng = rng
+    self.reader = None
+    self.writer = None
+    self.buffer = ''
+    self.sentinels = itertools.count()
+    self.target = None
+
+  async def connect(self):
+    self.reader, self.writer = await asyncio.open_connection(self.args.host, self.args.port)
+    await self.read_for(1.0)
+    await self.send(f'create {self.name} {self.password}')
+    await self.read_for(1.0)
+    self.buffer = ''
+    start = time.perf_counter()
+    await self.send(f'connect {self.name} {self.password}')
+    # at_post_puppet's greeting; anything else means we didn't get in
+    if not await self.wait_for('Welcome back, ', start + self.args.timeout):
+      raise ConnectionError('login failed')
+    self.stats.add('login', time.perf_counter() - start)
+    self.stats.logins += 1
+
+  async def send(self, line):
+    self.writer.write(line.encode('utf-8') + b'\r\n')
+    await self.writer.drain()
+
+  def _absorb(self, data):
+    text = ANSI_RE.sub('', TELNET_IAC_RE.sub(b'', data).decode('utf-8', 'replace'))
+    for match in MOB_APPEARS_RE.finditer(text):
+      # attack by the mob's last word, e.g. "orc" for "Grog the Orc"
+      self.target = match.group(1).split()[-1]
+    self.buffer = (self.buffer + text)[-8192:]
+
+  async def read_for(self, seconds):
+    try:
+      while True:
+        data = await asyncio.wait_for(self.reader.read(4096), seconds)
+        if not data:
+          raise ConnectionError('server closed the connection')
+        self._absorb(data)
+    except asyncio.TimeoutError:
+      pass
+
+  async def wait_for(self, text, deadline, on_prompt=None):
+    """Read until text shows up, calling on_prompt at prompts; False if deadline passes first."""
+    while text not in self.buffer:
+      remaining = deadline - time.perf_counter()
+      if remaining <= 0:
+        return False
+      try:
+        data = await asyncio.wait_for(self.reader.read(4096), remaining)
+      except asyncio.TimeoutError:
+        continue
+      if not data:
+        raise ConnectionError('server closed the connection')
+      self._absorb(data)
+      prompt = PROMPT_RE.search(self.buffer) if on_prompt else None
+      if prompt:
+        self.buffer = ''
+        await on_prompt(prompt.group(1))
+    return True
+
+  async def roundtrip(self, action, command):
+    """Send command plus a ping queued behind it, and time until the pong."""
+    token = f'zzbench{next(self.sentinels)}'
+    sentinel = f'ping {token}'
+    self.buffer = ''
+    start = time.perf_counter()
+    await self.send(command)
+    await self.send(sentinel)
+
+    async def answer(prompt):
+      await self.send(self.target if prompt != 'Direction?' and self.target
+        else self.rng.choice(DIRECTIONS))
+      # a command that prompts without freezing first takes our ping as
+      # its answer; a spare pong from the first one is harmless
+      await self.send(sentinel)
+
+    if await self.wait_for(f'Pong {token}.', start + self.args.timeout, answer):
+      self.stats.add(action, time.perf_counter() - start)
+    elif self.stats.measuring:
+      self.stats.timeouts += 1
+
+  def command(self, action):
+    rng = self.rng
+    if action == 'move':
+      return rng.choice(DIRECTIONS)
+    if action == 'attack':
+      return f'attack {self.target}' if self.target else 'look'
+    if action == 'cast':
+      return f'cast {rng.choice(self.spells)}'
+    if action == 'buy':
+      return f'buy {rng.choice(self.items)}'
+    if action == 'sell':
+      return f'sell {rng.choice(self.items)}'
+    if action == 'shout':
+      return f'shout {self.name} was here'
+    return action
+
+  async def run(self, until):
+    actions, weights = zip(*ACTIONS.items())
+    while time.monotonic() < until:
+      action = self.rng.choices(actions, weights)[0]
+      await self.roundtrip(action, self.command(action))
+      await asyncio.sleep(self.rng.expovariate(1 / self.args.think))
+
+  async def close(self):
+    if self.writer:
+      try:
+        await self.send('quit')
+        self.writer.close()
+      except ConnectionError:
+        pass
+
+
+async def run_bot(num, args, stats, items, spells, start_delay, until):
+  await asyncio.sleep(start_delay)
+  bot = Bot(num, args, stats, items, spells, random.Random(args.seed + num))
+  try:
+    await bot.connect()
+    await bot.run(until)
+  except (ConnectionError, OSError) as e:
+    stats.errors += 1
+    if args.verbose:
+      print(f'{bot.name}: {e}', file=sys.stderr)
+  finally:
+    await bot.close()
+
+
+async def run_bots(args, stats):
+  items, spells = item_keys(), spell_names()
+  until = time.monotonic() + args.ramp + args.duration
+  await asyncio.gather(*[
+    run_bot(num, args, stats, items, spells, args.ramp * num / args.bots, until)
+    for num in range(args.bots)])
+
+
+def evennia(*evennia_args, env=None, check=True):
+  return subprocess.run(['evennia', *evennia_args], cwd=GAME_DIR, env=env, check=check)
+
+
+def wait_for_port(host, port, timeout=120):
+  deadline = time.monotonic() + timeout
+  while time.monotonic() < deadline:
+    try:
+      socket.create_connection((host, port), 2).close()
+      return
+    except OSError:
+      time.sleep(1)
+  raise RuntimeError(f'server did not come up on {host}:{port}')
+
+
+def start_server(args, db_path):
+  # LOAD_TEST turns off the account creation, login and rate throttles
+  env = dict(os.environ, TEST_DB_PATH=db_path, LOAD_TEST='1')
+  evennia('migrate', env=env)
+  evennia('createsuperuser', '--noinput', '--username', 'benchadmin',
+    '--email', 'benchadmin@example.com', env=env)
+  evennia('shell', '-c', SETUP_CODE, env=env)
+  evennia('start', env=env)
+  wait_for_port(args.host, args.port)
+
+
+def stop_server():
+  evennia('stop', check=False)
+
+
+def server_pid():
+  with open(SERVER_PID_FILE) as f:
+    return int(f.read().strip())
+
+
+def report(args, stats, first, last):
+  elapsed = last['time'] - first['time']
+  print(f'\n{args.bots} bots, {elapsed:.0f} s measured, {stats.logins} logged in, '
+    f'{stats.errors} errors, {stats.timeouts} timeouts')
+  print(f"{'action':<12} {'count':>7} {'p50 ms':>8} {'p90 ms':>8} {'p95 ms':>8} "
+    f"{'p99 ms':>8} {'max ms':>8}")
+  rows = sorted(stats.latencies.items()) + [('all', stats.all_latencies())]
+  for action, latencies in rows:
+    latencies = sorted(latencies)
+    print(f'{action:<12} {len(latencies):7} ' + ' '.join(
+      f'{percentile(latencies, pct) * 1000:8.1f}' for pct in (50, 90, 95, 99, 100)))
+  if elapsed > 0:
+    num_commands = len(stats.all_latencies())
+    print(f'\nthroughput     {num_commands / elapsed:10.1f} commands/s')
+    print(f"server cpu     {(last['cpu'] - first['cpu']) / elapsed * 100:10.1f} %")
+    print(f"disk writes    {(last['write_bytes'] - first['write_bytes']) / elapsed / 1024:10.1f} KiB/s")
+    print(f"write calls    {(last['syscw'] - first['syscw']) / elapsed:10.1f} /s")
+    print(f"db growth      {(last['db_size'] - first['db_size']) / elapsed / 1024:10.1f} KiB/s")
+
+
+def main():
+  """Command-line script."""
+  parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+  parser.add_argument('--bots', type=int, default=100)
+  parser.add_argument('--duration', type=float, default=60, help='seconds to measure, after ramp-up')
+  parser.add_argument('--ramp', type=float, default=30, help='seconds over which bots log in')
+  parser.add_argument('--think', type=float, default=1.0, help='mean seconds between commands')
+  parser.add_argument('--timeout', type=float, default=30, help='seconds before a command counts as lost')
+  parser.add_argument('--host', default='localhost')
+  parser.add_argument('--port', type=int, default=4000)
+  parser.add_argument('--prefix', default='bot')
+  parser.add_argument('--seed', type=int, default=1)
+  parser.add_argument('--no-server', action='store_true', help='use an already running server')
+  parser.add_argument('--keep-db', action='store_true', help="don't delete the temp database")
+  parser.add_argument('--verbose', action='store_true')
+  args = parser.parse_args()
+
+  tmpdir = None
+  db_path = None
+  if not args.no_server:
+    tmpdir = tempfile.mkdtemp(prefix='monster-load-')
+    db_path = os.path.join(tmpdir, 'monster.db3')
+    start_server(args, db_path)
+  try:
+    sampler = ProcSampler(server_pid(), db_path)
+    stats = Stats()
+    loop = asyncio.new_event_loop()
+    bots = loop.create_task(run_bots(args, stats))
+    # measure after the ramp-up, while everyone's on
+    loop.run_until_complete(asyncio.sleep(args.ramp))
+    first = sampler.sample()
+    stats.measuring = True
+    loop.run_until_complete(asyncio.sleep(args.duration))
+    stats.measuring = False
+    last = sampler.sample()
+    loop.run_until_complete(bots)
+    loop.close()
+    report(args, stats, first, last)
+  finally:
+    if not args.no_server:
+      stop_server()
+      if args.keep_db:
+        print(f'database kept in {db_path}')
+      else:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,240 @@
+#!/usr/bin/python3
+"""Replay a recorded session headless, timing ticks and checking outcomes.
+
+A recording (see gamerules/rng.py, and the "record" command) holds the
+RNG seed, a snapshot of the database when it started, and every
+command and tick after that. The replay runs against a copy of that
+snapshot with no server and no one connected: RNG is reseeded, commands
+go straight to the characters that typed them, and ticks are run at the
+recorded times in the recorded order instead of by the tickers. Timed
+effects (freezes, wear, trapdoors) still run on the reactor, as live.
+
+It reports time spent per tick kind and per command, then a digest of
+the resulting world: every object's key, location and attributes, plus
+the RNG state, so two replays that rolled differently can't match.
+Save it from one build and compare it from another:
+
+$ cd utils/benchmarks
+$ python replay.py /opt/monsterdata/recording-20261018-120000.jsonl --save before.json
+$ python replay.py /opt/monsterdata/recording-20261018-120000.jsonl --compare before.json
+
+Replays run in real time by default. --speed 10 plays the recording ten
+times faster, but freezes and the like don't speed up with it, so
+commands can queue where they didn't live; only compare replays made at
+the same speed.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+from load_test import percentile
+
+
+GAME_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+def setup_evennia(db_path):
+  """Load Django and Evennia against db_path, without starting a server."""
+  os.environ['TEST_DB_PATH'] = db_path
+  os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.conf.settings')
+  os.chdir(GAME_DIR)
+  sys.path.insert(0, GAME_DIR)
+  import django
+  django.setup()
+  import evennia
+  evennia._init()
+
+
+def read_recording(path):
+  with open(path) as f:
+    header = json.loads(f.readline())
+    events = [json.loads(line) for line in f if line.strip()]
+  return header, events
+
+
+class Replayer:
+  def __init__(self, events, speed):
+    from evennia.objects.models import ObjectDB
+    from evennia.utils.search import search_object_by_tag
+    from gamerules.lairs import LAIRS
+    self.events = events
+    self.speed = speed
+    self.objects = ObjectDB.objects
+    self.search_mobs = lambda: search_object_by_tag('mob')
+    self.lairs = LAIRS
+    self.position = 0
+    self.started = None
+    self.skipped = 0
+    # "tick <name>" or "cmd <verb>" => seconds spent in each call
+    self.timings = defaultdict(list)
+    self._objs = {}
+
+  def obj(self, obj_id):
+    if obj_id not in self._objs:
+      self._objs[obj_id] = self.objects.filter(id=obj_id).first()
+    return self._objs[obj_id]
+
+  def tick(self, event):
+    name = event['name']
+    if name == 'behavior':
+      for mob in sorted(self.search_mobs(), key=lambda mob: mob.id):
+        mob.tick_behavior()
+    elif name == 'lair':
+      self.lairs.tick()
+    else:
+      obj = self.obj(event['obj'])
+      if obj is None:
+        return False
+      getattr(obj, f'tick_{name}')()
+    return True
+
+  def command(self, event):
+    raw = event['raw']
+    # starting and stopping the recording isn't part of it
+    if raw.split()[0].lower() == 'record':
+      return False
+    obj = self.obj(event['obj'])
+    if obj is None:
+      return False
+    obj.execute_cmd(raw)
+    return True
+
+  def play(self, event):
+    if event['kind'] == 'tick':
+      label, handler = f"tick {event['name']}", self.tick
+    else:
+      label, handler = f"cmd {event['raw'].split()[0].lower()}", self.command
+    start = time.perf_counter()
+    played = handler(event)
+    elapsed = time.perf_counter() - start
+    if played:
+      self.timings[label].append(elapsed)
+    else:
+      self.skipped += 1
+
+  def due(self, event):
+    """Seconds from now until event is due."""
+    if not self.speed:
+      return 0
+    return self.started + event['t'] / self.speed - time.monotonic()
+
+  def step(self, done):
+    from twisted.internet import reactor
+    while self.position < len(self.events):
+      event = self.events[self.position]
+      wait = self.due(event)
+      if wait > 0:
+        reactor.callLater(wait, self.step, done)
+        return
+      self.play(event)
+      self.position += 1
+    done()
+
+  def run(self, drain):
+    """Play every event, then let timed effects settle for drain seconds."""
+    from twisted.internet import reactor
+    self.started = time.monotonic()
+    reactor.callWhenRunning(self.step, lambda: reactor.callLater(drain, reactor.stop))
+    reactor.run()
+    return time.monotonic() - self.started
+
+
+def world_fingerprints():
+  """{object id: digest of its key, typeclass, location and attributes}."""
+  from evennia.objects.models import ObjectDB
+  fingerprints = {}
+  for obj in ObjectDB.objects.order_by('id'):
+    attrs = sorted(
+      (attr.db_key, attr.db_category or '', repr(attr.value)) for attr in obj.db_attributes.all())
+    state = repr((obj.db_key, obj.db_typeclass_path, obj.db_location_id, attrs))
+    fingerprints[str(obj.id)] = hashlib.sha1(state.encode()).hexdigest()
+  return fingerprints
+
+
+def outcome():
+  from gamerules.rng import RNG
+  objects = world_fingerprints()
+  rng = hashlib.sha1(repr(RNG.getstate()).encode()).hexdigest()
+  digest = hashlib.sha1(json.dumps([rng, objects], sort_keys=True).encode()).hexdigest()
+  return {'digest': digest, 'rng': rng, 'objects': objects}
+
+
+def compare(result, path):
+  with open(path) as f:
+    expected = json.load(f)
+  if result['digest'] == expected['digest']:
+    print(f"outcome matches {path}")
+    return True
+  print(f"outcome DIFFERS from {path}")
+  if result['rng'] != expected['rng']:
+    print('  RNG state differs (a different number or order of rolls)')
+  ids = sorted(set(result['objects']) | set(expected['objects']), key=int)
+  changed = [
+    obj_id for obj_id in ids if result['objects'].get(obj_id) != expected['objects'].get(obj_id)]
+  for obj_id in changed[:20]:
+    if obj_id not in expected['objects']:
+      print(f'  #{obj_id} only in this replay')
+    elif obj_id not in result['objects']:
+      print(f'  #{obj_id} only in {path}')
+    else:
+      print(f'  #{obj_id} changed')
+  if len(changed) > 20:
+    print(f'  ... and {len(changed) - 20} more')
+  return False
+
+
+def report(replayer, wall_time):
+  print(f"{replayer.position} events in {wall_time:.1f}s ({replayer.skipped} skipped)")
+  print(f"{'event':<24}{'count':>8}{'total ms':>11}{'mean ms':>10}{'p95 ms':>9}{'per sec':>10}")
+  for label, times in sorted(replayer.timings.items()):
+    ordered = sorted(times)
+    total = sum(ordered)
+    print(f"{label:<24}{len(ordered):>8}{total * 1000:>11.1f}"
+      f"{total / len(ordered) * 1000:>10.2f}{percentile(ordered, 95) * 1000:>9.2f}"
+      f"{len(ordered) / total if total else 0:>10.0f}")
+
+
+def main():
+  """Command-line script."""
+  parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+  parser.add_argument('recording', help='a recording .jsonl file')
+  parser.add_argument('--speed', type=float, default=1, help='playback speed; 0 for no waiting at all')
+  parser.add_argument('--drain', type=float, default=5, help='seconds to run on after the last event')
+  parser.add_argument('--save', help='write the outcome here as JSON')
+  parser.add_argument('--compare', help='compare the outcome with one saved by --save')
+  args = parser.parse_args()
+
+  recording = os.path.abspath(args.recording)
+  header, events = read_recording(recording)
+  # the snapshot is kept pristine; every replay gets its own copy
+  tmpdir = tempfile.mkdtemp(prefix='evmonster-replay-')
+  db_path = os.path.join(tmpdir, 'replay.db3')
+  shutil.copyfile(os.path.join(os.path.dirname(recording), header['db']), db_path)
+  save = os.path.abspath(args.save) if args.save else None
+  expected = os.path.abspath(args.compare) if args.compare else None
+  try:
+    setup_evennia(db_path)
+    from gamerules.rng import RNG
+    RNG.seed(header['seed'])
+    replayer = Replayer(events, args.speed)
+    wall_time = replayer.run(args.drain)
+    report(replayer, wall_time)
+    result = outcome()
+    print(f"outcome digest {result['digest']}")
+    if save:
+      with open(save, 'w') as f:
+        json.dump(result, f)
+    matched = compare(result, expected) if expected else True
+  finally:
+    shutil.rmtree(tmpdir, ignore_errors=True)
+  sys.exit(0 if matched else 1)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""Time a full generation run.
+
+Runs every generator in-process with its output discarded, and prints the
+time spent loading the og_monster_data JSON and in each generator.
+
+$ cd utils/data_generation
+$ python benchmark.py
+"""
+import contextlib
+import importlib
+import io
+import sys
+import time
+sys.path.insert(0, '../..')
+
+import generator_utils
+
+
+# (module, entry point); spell_data fills in SPELLS in place, so it goes last
+GENERATORS = [
+  ('build_rooms', 'main'),
+  ('build_room_descs', 'main'),
+  ('build_room_attrs', 'main'),
+  ('build_exits', 'main'),
+  ('build_exit_descs', 'main'),
+  ('build_exit_attrs', 'main'),
+  ('object_prototypes', 'main'),
+  ('mob_prototypes', 'main'),
+  ('store_inventory', 'main'),
+  ('non_store_inventory', 'main'),
+  ('spell_data', 'create_spells'),
+]
+
+
+def timed(func):
+  start = time.perf_counter()
+  with contextlib.redirect_stdout(io.StringIO()):
+    func()
+  return time.perf_counter() - start
+
+
+def main():
+  """Command-line script."""
+  def load_all():
+    for name in generator_utils.DATA_FILES:
+      generator_utils.load_dataset(name)
+    for name in generator_utils.INDEXES:
+      generator_utils.load_index(name)
+
+  total = timed(load_all)
+  print(f"{'load data':<20} {total * 1000:8.1f} ms")
+  for module_name, entry_point in GENERATORS:
+    module = importlib.import_module(module_name)
+    elapsed = timed(getattr(module, entry_point))
+    total += elapsed
+    print(f"{module_name:<20} {elapsed * 1000:8.1f} ms")
+  print(f"{'total':<20} {total * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+  main()
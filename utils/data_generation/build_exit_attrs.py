@@ -5,7 +5,9 @@ import sys
 sys.path.insert(0, '../..')
 
 from gamerules.exit_kind import ExitKind
-from generator_utils import *
+from generator_utils import (
+  DEFAULT_MSG_ID, DESCS, LINES, OBJECTS_BY_ID, ROOMDESCS,
+  split_integer, lookup_description)
 
 
 def maybe_set_desc(desc_id, exit_name, attr_name):
@@ -42,7 +44,7 @@ def make_exit(exit, to_loc, come_out_exit):
   obj_req = None
   obj_req_id = exit['obj_req']
   if obj_req_id:
-    obj_req = find_object(OBJECTS, obj_req_id)
+    obj_req = OBJECTS_BY_ID.get(obj_req_id)
   if obj_req:
     print(f"@set {exit_name}/required_object = {repr(obj_req['obj_name'])}")
     print('#')
@@ -4,7 +4,7 @@ import json
 import sys
 sys.path.insert(0, '../..')
 
-from generator_utils import *
+from generator_utils import DEFAULT_MSG_ID, DESCS, LINES, ROOMDESCS, lookup_description
 
 
 def maybe_set_desc(desc_id, exit_name, attr_name):
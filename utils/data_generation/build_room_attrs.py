@@ -6,7 +6,8 @@ sys.path.insert(0, '../..')
 
 from gamerules.exit_effect_kind import ExitEffectKind
 from gamerules.exit_kind import ExitKind
-from generator_utils import *
+from generator_utils import (
+  DESCS, LINES, OBJECTS_BY_ID, ROOMDESCS, lookup_description)
 
 
 def make_room(roomdesc):
@@ -26,7 +27,7 @@ def make_room(roomdesc):
     print(f"@set here/which_desc = {roomdesc['which']}")
     print('#')
   if roomdesc['magic_obj']:
-    magic_obj = find_object(OBJECTS, roomdesc['magic_obj'])
+    magic_obj = OBJECTS_BY_ID.get(roomdesc['magic_obj'])
     if magic_obj:
       print(f"@set here/magic_object = {repr(magic_obj['obj_name'])}")
       print('#')
@@ -6,7 +6,7 @@ sys.path.insert(0, '../..')
 
 from gamerules.exit_effect_kind import ExitEffectKind
 from gamerules.exit_kind import ExitKind
-from generator_utils import *
+from generator_utils import ROOMDESCS
 
 
 def make_room(roomdesc):
@@ -1,51 +1,91 @@
 import json
+import os
 
 
 DEFAULT_MSG_ID = 32000
 
-# global data
-with open('./og_monster_data/desc.json') as f:
-  DESCS = json.load(f)
-with open('./og_monster_data/lines.json') as f:
-  LINES = json.load(f)
-with open('./og_monster_data/objects.json') as f:
-  OBJECTS = json.load(f)
-with open('./og_monster_data/randoms.json') as f:
-  RANDOMS = json.load(f)
-with open('./og_monster_data/roomdesc.json') as f:
-  ROOMDESCS = json.load(f)
-with open('./og_monster_data/rooms.json') as f:
-  ROOMS = json.load(f)
-with open('./og_monster_data/spells.json') as f:
-  SPELLS = json.load(f)
+# resolve data files relative to this module, so we can also be imported
+# from the game directory (see world/world_loader.py)
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'og_monster_data')
+
+# global data, loaded lazily on first access (see __getattr__ below)
+DATA_FILES = {
+  'DESCS': 'desc.json',
+  'LINES': 'lines.json',
+  'OBJECTS': 'objects.json',
+  'RANDOMS': 'randoms.json',
+  'ROOMDESCS': 'roomdesc.json',
+  'ROOMS': 'rooms.json',
+  'SPELLS': 'spells.json',
+}
+
+# dict indexes over the global data: name => (dataset, record field, unique)
+# unique indexes map a field value to a record, others to a list of records
+INDEXES = {
+  'OBJECTS_BY_ID': ('OBJECTS', 'id', True),
+  'ROOMDESCS_BY_NAME': ('ROOMDESCS', 'nice_name', False),
+  'ROOMS_BY_ID': ('ROOMS', 'id', True),
+  'SPELLS_BY_ID': ('SPELLS', 'id', True),
+}
 
 
 def load_json(filepath):
   with open(filepath) as f:
-    data = json.load(filepath)
+    data = json.load(f)
   return data
 
+
+def load_dataset(name):
+  """Load one of the DATA_FILES datasets, e.g. 'OBJECTS', once."""
+  data = globals().get(name)
+  if data is None:
+    data = load_json(os.path.join(DATA_DIR, DATA_FILES[name]))
+    globals()[name] = data
+  return data
+
+
+def index_by(records, field, unique=True):
+  if unique:
+    return {rec[field]: rec for rec in records}
+  index = {}
+  for rec in records:
+    index.setdefault(rec[field], []).append(rec)
+  return index
+
+
+def load_index(name):
+  """Build one of the INDEXES, e.g. 'OBJECTS_BY_ID', once."""
+  index = globals().get(name)
+  if index is None:
+    dataset, field, unique = INDEXES[name]
+    index = index_by(load_dataset(dataset), field, unique)
+    globals()[name] = index
+  return index
+
+
+def __getattr__(name):
+  # only called for names not yet in the module globals
+  if name in DATA_FILES:
+    return load_dataset(name)
+  if name in INDEXES:
+    return load_index(name)
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def load_descs():
-  return load_json('./og_monster_data/desc.json')
+  return load_dataset('DESCS')
 
 
 def load_lines():
-  return load_json('./og_monster_data/lines.json')
+  return load_dataset('LINES')
 
 
 def load_objects():
-  return load_json('./og_monster_data/objects.json')
+  return load_dataset('OBJECTS')
 
 
 def load_roomdescs():
-  return load_json('./og_monster_data/roomdesc.json')
-
-
-def find_object(objects, obj_id):
-  for obj in objects:
-    if obj['id'] == obj_id:
-      return obj
-  return None
+  return load_dataset('ROOMDESCS')
 
 
 def split_integer(i):
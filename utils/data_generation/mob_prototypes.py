@@ -4,17 +4,10 @@ import sys
 sys.path.insert(0, '../..')
 
 from gamerules.mob_kind import MobKind
-from generator_utils import *
+from generator_utils import OBJECTS_BY_ID, RANDOMS, snake_case
 
 
-def find_object(objects, record_id):
-  for obj in objects:
-    if obj['id'] == record_id:
-      return obj
-  return None
-
-
-def output_mob(obj, objects):
+def output_mob(obj):
   obj_name = obj['name']
   print(f"{snake_case(obj_name)} = {{")
   print(f"  'key': {repr(obj_name)},")
@@ -49,7 +42,7 @@ def output_mob(obj, objects):
   print(f"  'heal_speed': {obj['heal_speed']},")
   weapon_id = obj['weapon']
   if weapon_id:
-    weapon = find_object(objects, weapon_id)
+    weapon = OBJECTS_BY_ID.get(weapon_id)
     if weapon:
       print(f"  'attack_name': '{weapon['obj_name']}',")
   print(f"  'weapon_use': {obj['weapon_use']},")
@@ -78,7 +71,7 @@ MOB = {
 """)
 
   for rand_mob in RANDOMS:
-    output_mob(rand_mob, OBJECTS)
+    output_mob(rand_mob)
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ import json
 import sys
 sys.path.insert(0, '../..')
 
-from generator_utils import *
+from generator_utils import OBJECTS_BY_ID, ROOMDESCS, ROOMS_BY_ID
 
 
 # TODO: move this somewhere (utils?)
@@ -23,7 +23,7 @@ def main():
     rec = {}
     rec["room"] = roomdesc["nice_name"]
     room_id = roomdesc["id"]
-    room = find_object(ROOMS, room_id)
+    room = ROOMS_BY_ID.get(room_id)
     inventory = []
     for packed_object_int, packed_hide_int in zip(room["objs"], room["obj_hides"]):
       if packed_object_int:
@@ -31,7 +31,7 @@ def main():
         condition = int(packed_object_int / 1000)
         hide = packed_hide_int % 1000
         charges = int(packed_hide_int / 1000)
-        obj = find_object(OBJECTS, object_id)
+        obj = OBJECTS_BY_ID.get(object_id)
         inventory.append({
           "object": obj["obj_name"],
           "condition": condition,
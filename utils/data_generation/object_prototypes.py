@@ -6,7 +6,9 @@ sys.path.insert(0, '../..')
 from gamerules.equipment_effect_kind import EquipmentEffectKind
 from gamerules.equipment_slot import EquipmentSlot
 from gamerules.object_kind import ObjectKind
-from generator_utils import *
+from generator_utils import (
+  DEFAULT_MSG_ID, DESCS, LINES, OBJECTS, OBJECTS_BY_ID, SPELLS_BY_ID, split_integer,
+  lookup_description, snake_case)
 
 
 DEFAULT_ARTICLE = 1
@@ -18,13 +20,6 @@ def lookup_effect(obj, effect):
       return eff_num
 
 
-def find_obj(objs, id):
-  for obj in objs:
-    if obj['id'] == id:
-      return obj
-  return None
-
-
 def maybe(value, field_name, except_if=None):
   if value and value != except_if:
     print(f"  '{field_name}': {value},")
@@ -37,10 +32,15 @@ def maybe_desc_field(desc_id, field_name):
       print(f"  '{field_name}': {repr(desc)},")
 
 
-def maybe_effect(obj, effect_kind, field_name):
-   value = lookup_effect(obj, effect_kind)
-   if value:
-    print(f"  '{field_name}': {value},")
+def output_effects(obj):
+  # packed into one vector attribute, see gamerules/equipment_effects.py
+  effects = [(kind, lookup_effect(obj, kind)) for kind in EquipmentEffectKind]
+  effects = [(kind, value) for kind, value in effects if value]
+  if effects:
+    print("  'effects': effect_vector({")
+    for kind, value in effects:
+      print(f"    '{kind.name.lower()}': {value},")
+    print("  }),")
 
 
 def output_common_fields(obj, prototype_parent):
@@ -58,7 +58,7 @@ def output_common_fields(obj, prototype_parent):
   if components:
     component_keys = []
     for obj_id in components:
-      component = find_obj(OBJECTS, obj_id)
+      component = OBJECTS_BY_ID.get(obj_id)
       if component:
         component_keys.append(component["obj_name"])
     print(f"  'components': {component_keys},")
@@ -107,8 +107,7 @@ BASE_EQUIPMENT = {
     slot_num = obj['wear']
     slot = EquipmentSlot(slot_num)
     print(f"  'equipment_slot': EquipmentSlot.{slot.name},")
-    for effect_kind in EquipmentEffectKind:
-      maybe_effect(obj, effect_kind, effect_kind.name.lower())
+    output_effects(obj)
     print('}')
     print()
 
@@ -127,7 +126,7 @@ BASE_SCROLL = {
     output_common_fields(obj, 'base_scroll')
     parms = obj['parms']
     if len(parms) == 2:
-      spell = find_obj(SPELLS, parms[0])
+      spell = SPELLS_BY_ID.get(parms[0])
       if spell:
         print(f"  'spell_key': '{spell['name']}',")
       charges = parms[1]
@@ -151,7 +150,7 @@ BASE_WAND = {
     output_common_fields(obj, 'base_wand')
     parms = obj['parms']
     if len(parms) == 2:
-      spell = find_obj(SPELLS, parms[0])
+      spell = SPELLS_BY_ID.get(parms[0])
       if spell:
         print(f"  'spell_key': '{spell['name']}',")
       charges = parms[1]
@@ -212,7 +211,7 @@ BASE_SPELLBOOK = {
     print(f"  'equipment_slot': EquipmentSlot.{slot.name},")
     spell_keys = []
     for parm in obj['parms']:
-      spell = find_obj(SPELLS, parm)
+      spell = SPELLS_BY_ID.get(parm)
       if spell:
         spell_keys.append(spell['name'])
     print(f"  'spell_keys': {spell_keys},")
@@ -249,6 +248,7 @@ def main():
   print("""#
 # Generated object prototypes
 #
+from gamerules.equipment_effects import effect_vector
 from gamerules.equipment_slot import EquipmentSlot
 """)
   output_blands(obj_by_kind[ObjectKind.BLAND])
@@ -3,7 +3,7 @@ import sys
 sys.path.insert(0, '../..')
 
 import json
-from generator_utils import *
+from generator_utils import DESCS, LINES, SPELLS, lookup_description
 
 
 def fill_in(rec, key, descs, lines):
@@ -1,6 +1,12 @@
 #!/usr/bin/python3
-import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import argparse
+import os
+import subprocess
 import sys
+sys.path.insert(0, '../data_generation')
+
+from generator_utils import ROOMDESCS_BY_NAME
 
 
 ZONES = [
@@ -44,53 +50,84 @@ ZONES = [
   'wilted_lothlorien',
 ]
 
-with open('../json/roomdesc.json') as f:
-  ROOMDESCS = json.load(f)
-
 
 def room_names_in_zone(zone):
   with open(f'../zones/{zone}.txt') as f:
     return [x.strip() for x in f.readlines()]
 
 
-def ids_for_room_names(room_names):
-  ids = []
-  for roomdesc in ROOMDESCS:
-    name = roomdesc["nice_name"]
-    if name not in room_names:
-      continue
-    ids.append(roomdesc["id"])
-  return ids
+def rooms_by_zone(zones=ZONES):
+  """Map zone => list of its roomdescs, in record id order.
+
+  Reads each zone file once and looks its room names up by name.
+  """
+  zone_rooms = {}
+  for zone in zones:
+    roomdescs = {}
+    for name in room_names_in_zone(zone):
+      for roomdesc in ROOMDESCS_BY_NAME.get(name, ()):
+        roomdescs[roomdesc["id"]] = roomdesc
+    zone_rooms[zone] = [roomdescs[record_id] for record_id in sorted(roomdescs)]
+  return zone_rooms
 
 
-def output_zone(zone):
-  room_names = room_names_in_zone(zone)
-  room_ids = ids_for_room_names(room_names)
+def output_zone(zone, roomdescs=None):
+  if roomdescs is None:
+    roomdescs = rooms_by_zone([zone])[zone]
+  room_ids = {roomdesc["id"] for roomdesc in roomdescs}
 
   with open(f'./dot/{zone}.dot', 'w') as f:
     print('digraph monster {', file=f)
-    for roomdesc in ROOMDESCS:
-      name = roomdesc["nice_name"]
-      if name not in room_names:
-        continue
+    for roomdesc in roomdescs:
       record_id = roomdesc["id"]
       # room_0 [label="NOWHERE"];
       print(f'room_{record_id} [label="{roomdesc["nice_name"]}"];', file=f)
       for exit in roomdesc['exits']:
         to_loc = exit['to_loc']
         direction = exit['direction']
-        direction_letter = direction[0]    
+        direction_letter = direction[0]
         if to_loc in room_ids:
           # room_1 -> room_0 [label="n"];
           print(f'room_{record_id} -> room_{to_loc} [label="{direction_letter}"];', file=f)
     print('}', file=f)
+  return zone
 
 
-def output_zones():
-  for zone in ZONES:
-    output_zone(zone)
+def output_zones(processes=None):
+  """Write the DOT files for all zones, using a process pool."""
+  zone_rooms = rooms_by_zone()
+  with ProcessPoolExecutor(max_workers=processes) as executor:
+    return list(executor.map(output_zone, zone_rooms.keys(), zone_rooms.values()))
 
 
-if __name__ == "__main__":
-  output_zones()
+def render_zone(zone, fmt):
+  """Lay out and render a zone's DOT file with neato, e.g. fmt='png'."""
+  subprocess.run(
+    ['neato', f'-T{fmt}', f'./dot/{zone}.dot', '-o', f'./{fmt}/{zone}.{fmt}', '-Goverlap=false'],
+    check=True)
+  return zone, fmt
+
 
+def render_zones(zones=ZONES, formats=('png', 'svg'), jobs=None):
+  """Render all zones in all formats, running at most jobs neato processes at once."""
+  jobs = jobs or os.cpu_count()
+  with ThreadPoolExecutor(max_workers=jobs) as executor:
+    futures = [executor.submit(render_zone, zone, fmt) for zone in zones for fmt in formats]
+    return [future.result() for future in futures]
+
+
+def main():
+  """Command-line script."""
+  parser = argparse.ArgumentParser(description="Build the zone maps.")
+  parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+    help="number of parallel workers (default: all cores)")
+  parser.add_argument('--render', action='store_true',
+    help="also render png and svg maps with neato")
+  args = parser.parse_args()
+  zones = output_zones(args.jobs)
+  if args.render:
+    render_zones(zones, jobs=args.jobs)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,9 @@
+"""
+Everything merchants sell, and where, as JSON (see world/market.py).
+"""
+from django.http import JsonResponse
+from world.market import MARKET
+
+
+def market(request):
+  return JsonResponse({"items": MARKET.snapshot()})
@@ -9,12 +9,20 @@ from django.conf.urls import url, include
 # default evennia patterns
 from evennia.web.urls import urlpatterns
 
+from web import market
 from web import page12344
+from web import who
+from web import world_map
 
 # eventual custom patterns
 custom_patterns = [
   # url(r'/desired/url/', view, name='example'),
   url(r'12344.html', page12344.page, name='domain-ownership'),
+  url(r'^market.json$', market.market, name='market-json'),
+  url(r'^who.json$', who.who, name='who-json'),
+  url(r'^worldmap/$', world_map.index, name='world-map'),
+  url(r'^worldmap/(?P<zone>\w+)/$', world_map.zone, name='world-map-zone'),
+  url(r'^worldmap/(?P<zone>\w+)/occupancy.json$', world_map.occupancy, name='world-map-occupancy'),
 ]
 
 # this is required by Django.
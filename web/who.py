@@ -0,0 +1,11 @@
+"""
+Who list as JSON, from the same snapshot the `who` command renders
+(see world/who_list.py).
+"""
+from django.http import JsonResponse
+from world.who_list import WHO_LIST
+
+
+def who(request):
+  players = WHO_LIST.public_snapshot()
+  return JsonResponse({"count": len(players), "players": players})
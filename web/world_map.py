@@ -0,0 +1,100 @@
+"""
+Live world map views.
+
+Zone maps are laid out with Graphviz's neato from the live room graph (see
+world/world_map.py). Layouts are cached per zone and only recomputed when
+the world structure changes, while the occupancy overlay is served as a
+small JSON snapshot that the page polls.
+"""
+import subprocess
+import time
+from django.http import Http404, HttpResponse, JsonResponse
+from django.shortcuts import render
+from django.utils.safestring import mark_safe
+from world import world_map
+
+
+# also recompute layouts at least this often, to pick up exit edits that
+# don't bump the structure version (e.g. @link)
+LAYOUT_MAX_AGE = 600
+# polling clients share one occupancy snapshot per zone for this long
+OCCUPANCY_MAX_AGE = 5
+OCCUPANCY_POLL_MS = OCCUPANCY_MAX_AGE * 1000
+
+# zone => (structure version, timestamp, rooms, svg)
+_layouts = {}
+# zone => (timestamp, json-able occupancy)
+_occupancy = {}
+
+
+def render_svg(dot):
+  result = subprocess.run(
+    ["neato", "-Tsvg", "-Goverlap=false"],
+    input=dot, capture_output=True, text=True, check=True)
+  svg = result.stdout
+  # drop the xml prolog and doctype, so we can inline it
+  return svg[svg.index("<svg"):]
+
+
+def zone_layout(zone):
+  """The cached (version, timestamp, rooms, svg) layout for a zone."""
+  version = world_map.structure_version()
+  now = time.time()
+  cached = _layouts.get(zone)
+  if cached and cached[0] == version and now - cached[1] < LAYOUT_MAX_AGE:
+    return cached
+  rooms = world_map.zone_rooms(zone)
+  cached = (version, now, rooms, render_svg(world_map.zone_dot(rooms)))
+  _layouts[zone] = cached
+  return cached
+
+
+def zone_occupancy(zone):
+  now = time.time()
+  cached = _occupancy.get(zone)
+  if cached and now - cached[0] < OCCUPANCY_MAX_AGE:
+    return cached[1]
+  version, _, rooms, _ = zone_layout(zone)
+  data = {
+    "version": version,
+    "rooms": {
+      f"room_{room_id}": {"players": players, "mobs": mobs}
+      for room_id, (players, mobs) in world_map.occupancy(rooms).items()},
+  }
+  _occupancy[zone] = (now, data)
+  return data
+
+
+def check_zone(zone):
+  if zone not in world_map.zones():
+    raise Http404(f"No such zone: {zone}")
+
+
+def index(request):
+  return render(request, "world_map.html", {
+    "page_title": "World Map",
+    "zones": world_map.zones(),
+  })
+
+
+def zone(request, zone):
+  check_zone(zone)
+  try:
+    version, _, _, svg = zone_layout(zone)
+  except (OSError, subprocess.CalledProcessError):
+    return HttpResponse("The world map needs Graphviz (neato) installed.", status=503)
+  return render(request, "world_map_zone.html", {
+    "page_title": f"World Map - {zone}",
+    "zone": zone,
+    "version": version,
+    "svg": mark_safe(svg),
+    "poll_ms": OCCUPANCY_POLL_MS,
+  })
+
+
+def occupancy(request, zone):
+  check_zone(zone)
+  try:
+    return JsonResponse(zone_occupancy(zone))
+  except (OSError, subprocess.CalledProcessError):
+    return JsonResponse({"error": "layout unavailable"}, status=503)
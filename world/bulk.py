@@ -0,0 +1,102 @@
+"""
+Bulk database helpers
+
+Create objects, attributes and alias tags with a handful of bulk INSERTs
+instead of one save() per row. These bypass the typeclass creation hooks
+(at_first_save(), basetype_setup(), at_object_creation()), so callers must
+supply any locks and attributes those hooks would normally have set.
+
+Run these inside a transaction (see world/world_loader.py).
+"""
+from django.db.models import Max
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.attributes import Attribute
+from evennia.typeclasses.tags import Tag
+from evennia.utils.dbserialize import to_pickle
+
+
+# keep well under SQLite's limit on variables per statement
+BATCH_SIZE = 500
+
+
+def chunks(items, size=BATCH_SIZE):
+  for i in range(0, len(items), size):
+    yield items[i:i + size]
+
+
+def bulk_create_with_ids(model, instances):
+  """bulk_create() model instances and make sure each one has its id set.
+
+  Older Django/SQLite combinations don't hand back primary keys from
+  bulk_create(), so in that case we read them back by id range. This
+  relies on there being no concurrent writers, i.e. an open transaction.
+  """
+  if not instances:
+    return instances
+  last_id = model.objects.aggregate(Max("id"))["id__max"] or 0
+  model.objects.bulk_create(instances, batch_size=BATCH_SIZE)
+  if instances[0].pk is None:
+    ids = model.objects.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)
+    for instance, pk in zip(instances, ids):
+      instance.pk = pk
+  return instances
+
+
+def lockstring(locks):
+  """Turn a dict of {access_type: lockfuncs} into a lock storage string."""
+  return ";".join(f"{access_type}:{definition}" for access_type, definition in locks.items())
+
+
+def bulk_create_objects(specs):
+  """Create ObjectDB rows from a list of field dicts.
+
+  Each spec holds ObjectDB field values, e.g. db_key, db_typeclass_path,
+  db_location_id, db_destination_id, db_lock_storage. Returns the created
+  ObjectDB instances, in spec order, with ids set.
+  """
+  return bulk_create_with_ids(ObjectDB, [ObjectDB(**spec) for spec in specs])
+
+
+def bulk_add_attributes(rows):
+  """Add attributes from a list of (object id, attribute key, value) rows.
+
+  Rows may have a fourth item, the attribute category.
+  """
+  attrs = bulk_create_with_ids(Attribute, [
+    Attribute(
+      db_key=key, db_value=to_pickle(value), db_category=category[0] if category else None,
+      db_model="objectdb")
+    for _, key, value, *category in rows])
+  through = ObjectDB.db_attributes.through
+  through.objects.bulk_create([
+    through(objectdb_id=row[0], attribute_id=attr.id)
+    for row, attr in zip(rows, attrs)], batch_size=BATCH_SIZE)
+  return len(attrs)
+
+
+def bulk_add_tags(rows):
+  """Add tags from a list of (object id, tag key, category, tag type) rows.
+
+  Tags are shared between objects, so only missing tags are created.
+  """
+  keys = sorted({(key.strip().lower(), category, tagtype) for _, key, category, tagtype in rows},
+    key=lambda tag_id: (tag_id[0], tag_id[1] or "", tag_id[2] or ""))
+  tags = {}
+  for batch in chunks(keys):
+    for tag in Tag.objects.filter(db_key__in={key for key, _, _ in batch}, db_model="objectdb"):
+      tags[(tag.db_key, tag.db_category, tag.db_tagtype)] = tag
+  missing = [
+    Tag(db_key=key, db_category=category, db_tagtype=tagtype, db_model="objectdb")
+    for key, category, tagtype in keys if (key, category, tagtype) not in tags]
+  for tag in bulk_create_with_ids(Tag, missing):
+    tags[(tag.db_key, tag.db_category, tag.db_tagtype)] = tag
+  through = ObjectDB.db_tags.through
+  through.objects.bulk_create([
+    through(objectdb_id=obj_id, tag_id=tags[(key.strip().lower(), category, tagtype)].id)
+    for obj_id, key, category, tagtype in rows], batch_size=BATCH_SIZE)
+  return len(rows)
+
+
+def bulk_add_aliases(rows):
+  """Add aliases from a list of (object id, alias) rows."""
+  return bulk_add_tags([(obj_id, alias, None, "alias") for obj_id, alias in rows])
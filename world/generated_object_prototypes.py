@@ -1,6 +1,7 @@
 #
 # Generated object prototypes
 #
+from gamerules.equipment_effects import effect_vector
 from gamerules.equipment_slot import EquipmentSlot
 
 #
@@ -501,10 +502,12 @@ ANIMAL_SKINS = {
   'num_exist': 2,
   'worth': 20,
   'equipment_slot': EquipmentSlot.BODY,
-  'base_armor': 2,
-  'spell_armor': 1,
-  'smallest_fit': 4,
-  'largest_fit': 9,
+  'effects': effect_vector({
+    'base_armor': 2,
+    'spell_armor': 1,
+    'smallest_fit': 4,
+    'largest_fit': 9,
+  }),
 }
 
 AQUAMARINE_ORB = {
@@ -516,7 +519,9 @@ AQUAMARINE_ORB = {
   'desc': 'The orb is about the size of a very large egg, and weighs about 10\npounds. It is a dark aquamarine in color, and reminds you of a still\nbody of water. It is affixed to a silver stand which is mounted into\nthe floor.',
   'sticky': True,
   'equipment_slot': EquipmentSlot.NOT_EQUIPPABLE,
-  'teleport': 503,
+  'effects': effect_vector({
+    'teleport': 503,
+  }),
 }
 
 ASSASSINS_DAGGER = {
@@ -529,13 +534,15 @@ ASSASSINS_DAGGER = {
   'num_exist': 4,
   'worth': 200,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'class': 26,
-  'attack_speed': 9,
-  'poison': 35,
-  'base_weapon_damage': 100,
-  'random_weapon_damage': 100,
-  'smallest_fit': 3,
-  'largest_fit': 6,
+  'effects': effect_vector({
+    'class': 26,
+    'attack_speed': 9,
+    'poison': 35,
+    'base_weapon_damage': 100,
+    'random_weapon_damage': 100,
+    'smallest_fit': 3,
+    'largest_fit': 6,
+  }),
 }
 
 AXE = {
@@ -547,12 +554,14 @@ AXE = {
   'desc': 'The axe has a double head of iron, and is slightly dull. The haft is\nworn but solid. This looks like a fine tool for chopping wood. It may\nalso work for chopping bodies.',
   'num_exist': 6,
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'attack_speed': 11,
-  'base_weapon_damage': 83,
-  'random_weapon_damage': 104,
-  'smallest_fit': 4,
-  'largest_fit': 8,
-  'drop_destroy': 1,
+  'effects': effect_vector({
+    'attack_speed': 11,
+    'base_weapon_damage': 83,
+    'random_weapon_damage': 104,
+    'smallest_fit': 4,
+    'largest_fit': 8,
+    'drop_destroy': 1,
+  }),
 }
 
 BLACK_ORB = {
@@ -571,10 +580,12 @@ BLEACHED_BONE = {
   'prototype_tags': ['object', 'record_id_97'],
   'desc': 'The bone is a long thigh bone, and has been bleached white by excessive\nexposure.',
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'base_weapon_damage': 30,
-  'random_weapon_damage': 70,
-  'smallest_fit': 4,
-  'largest_fit': 6,
+  'effects': effect_vector({
+    'base_weapon_damage': 30,
+    'random_weapon_damage': 70,
+    'smallest_fit': 4,
+    'largest_fit': 6,
+  }),
 }
 
 BLOCK_OF_ICE = {
@@ -586,10 +597,12 @@ BLOCK_OF_ICE = {
   'num_exist': 2,
   'weight': 10,
   'equipment_slot': EquipmentSlot.NOT_EQUIPPABLE,
-  'throw_base': 150,
-  'throw_random': 50,
-  'throw_range': 4,
-  'throw_behavior': 1,
+  'effects': effect_vector({
+    'throw_base': 150,
+    'throw_random': 50,
+    'throw_range': 4,
+    'throw_behavior': 1,
+  }),
 }
 
 BOOTS_OF_LAGRATH = {
@@ -603,10 +616,12 @@ BOOTS_OF_LAGRATH = {
   'weight': 10,
   'worth': 480,
   'equipment_slot': EquipmentSlot.FEET,
-  'random_weapon_damage': 50,
-  'base_armor': 2,
-  'smallest_fit': 3,
-  'largest_fit': 20,
+  'effects': effect_vector({
+    'random_weapon_damage': 50,
+    'base_armor': 2,
+    'smallest_fit': 3,
+    'largest_fit': 20,
+  }),
 }
 
 BRACERS_OF_LUNACY = {
@@ -618,12 +633,14 @@ BRACERS_OF_LUNACY = {
   'desc': 'The bracers are made of a gold that seems to shimmer as if hot,\nthough it is cold to the touch.',
   'num_exist': 2,
   'equipment_slot': EquipmentSlot.ARMS,
-  'base_weapon_use': 5,
-  'base_armor': 8,
-  'deflect_armor': 1,
-  'spell_armor': 15,
-  'smallest_fit': 5,
-  'largest_fit': 8,
+  'effects': effect_vector({
+    'base_weapon_use': 5,
+    'base_armor': 8,
+    'deflect_armor': 1,
+    'spell_armor': 15,
+    'smallest_fit': 5,
+    'largest_fit': 8,
+  }),
 }
 
 BROADSWORD = {
@@ -635,11 +652,13 @@ BROADSWORD = {
   'num_exist': 3,
   'worth': 85,
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'attack_speed': 15,
-  'base_weapon_damage': 60,
-  'random_weapon_damage': 190,
-  'smallest_fit': 5,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'attack_speed': 15,
+    'base_weapon_damage': 60,
+    'random_weapon_damage': 190,
+    'smallest_fit': 5,
+    'largest_fit': 7,
+  }),
 }
 
 BROKEN_OAR = {
@@ -649,10 +668,12 @@ BROKEN_OAR = {
   'prototype_tags': ['object', 'record_id_95'],
   'desc': 'The oar is like that from a rowboat. It has a crack down its axis, and\nthe blade is broken in half.',
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'base_weapon_damage': 24,
-  'random_weapon_damage': 81,
-  'smallest_fit': 5,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'base_weapon_damage': 24,
+    'random_weapon_damage': 81,
+    'smallest_fit': 5,
+    'largest_fit': 7,
+  }),
 }
 
 BUCKLER = {
@@ -664,10 +685,12 @@ BUCKLER = {
   'num_exist': 2,
   'worth': 20,
   'equipment_slot': EquipmentSlot.SHIELD_HAND,
-  'deflect_armor': 1,
-  'smallest_fit': 2,
-  'largest_fit': 6,
-  'spell_deflect_armor': 1,
+  'effects': effect_vector({
+    'deflect_armor': 1,
+    'smallest_fit': 2,
+    'largest_fit': 6,
+    'spell_deflect_armor': 1,
+  }),
 }
 
 CAVE_BEAR_SKINS = {
@@ -677,11 +700,13 @@ CAVE_BEAR_SKINS = {
   'prototype_tags': ['object', 'record_id_9'],
   'desc': 'The clump of skins is extremely heavy and thick, and is clearly\nfrom a huge bear of some sort. The hide has been cured somewhat, but\nthe thick black hair of the animal remains. Small bone fragments have\nbeen adorned to the hide to provide some additional protection, as well\nas to appeal to the "spirits".',
   'equipment_slot': EquipmentSlot.BODY,
-  'base_armor': 6,
-  'deflect_armor': 1,
-  'spell_armor': 9,
-  'smallest_fit': 7,
-  'largest_fit': 10,
+  'effects': effect_vector({
+    'base_armor': 6,
+    'deflect_armor': 1,
+    'spell_armor': 9,
+    'smallest_fit': 7,
+    'largest_fit': 10,
+  }),
 }
 
 CHAIN_MAIL_ARMOR = {
@@ -694,10 +719,12 @@ CHAIN_MAIL_ARMOR = {
   'num_exist': 5,
   'worth': 85,
   'equipment_slot': EquipmentSlot.BODY,
-  'base_armor': 6,
-  'spell_armor': 5,
-  'smallest_fit': 5,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'base_armor': 6,
+    'spell_armor': 5,
+    'smallest_fit': 5,
+    'largest_fit': 7,
+  }),
 }
 
 CLAYMOORE_SWORD = {
@@ -707,12 +734,14 @@ CLAYMOORE_SWORD = {
   'prototype_tags': ['object', 'record_id_49'],
   'desc': 'The sword is very long and heavy, clearly unwieldable with only one hand.\nThe blade is about five feet long, and the hilt is an additional foot and\na half. The blade is very wide, and has many catches on it near the hilt\nwhich, when utilized properly, can catch and snap an opponents blade.',
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'attack_speed': 13,
-  'base_weapon_damage': 115,
-  'random_weapon_damage': 70,
-  'smallest_fit': 5,
-  'largest_fit': 9,
-  'drop_destroy': 1,
+  'effects': effect_vector({
+    'attack_speed': 13,
+    'base_weapon_damage': 115,
+    'random_weapon_damage': 70,
+    'smallest_fit': 5,
+    'largest_fit': 9,
+    'drop_destroy': 1,
+  }),
 }
 
 CLOAK = {
@@ -723,8 +752,10 @@ CLOAK = {
   'desc': 'This grey cloak is just perfect to keep you warm and possibly\na little more protected.',
   'worth': 1,
   'equipment_slot': EquipmentSlot.BACK,
-  'deflect_armor': 2,
-  'largest_fit': 20,
+  'effects': effect_vector({
+    'deflect_armor': 2,
+    'largest_fit': 20,
+  }),
 }
 
 CLOAK_OF_THE_MAGI = {
@@ -739,13 +770,15 @@ CLOAK_OF_THE_MAGI = {
   'weight': 25,
   'worth': 1400,
   'equipment_slot': EquipmentSlot.BACK,
-  'group': 2,
-  'base_mana': 100,
-  'deflect_armor': 13,
-  'smallest_fit': 3,
-  'largest_fit': 7,
-  'spell_deflect_armor': 35,
-  'cursed': 1,
+  'effects': effect_vector({
+    'group': 2,
+    'base_mana': 100,
+    'deflect_armor': 13,
+    'smallest_fit': 3,
+    'largest_fit': 7,
+    'spell_deflect_armor': 35,
+    'cursed': 1,
+  }),
 }
 
 CONICAL_HELM = {
@@ -758,10 +791,12 @@ CONICAL_HELM = {
   'num_exist': 1,
   'worth': 20,
   'equipment_slot': EquipmentSlot.HEAD,
-  'deflect_armor': 1,
-  'smallest_fit': 4,
-  'largest_fit': 7,
-  'spell_deflect_armor': 1,
+  'effects': effect_vector({
+    'deflect_armor': 1,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+    'spell_deflect_armor': 1,
+  }),
 }
 
 CRESTED_HELM = {
@@ -773,10 +808,12 @@ CRESTED_HELM = {
   'num_exist': 11,
   'worth': 20,
   'equipment_slot': EquipmentSlot.HEAD,
-  'deflect_armor': 1,
-  'smallest_fit': 4,
-  'largest_fit': 7,
-  'spell_deflect_armor': 1,
+  'effects': effect_vector({
+    'deflect_armor': 1,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+    'spell_deflect_armor': 1,
+  }),
 }
 
 CRUDE_DAGGER = {
@@ -788,11 +825,13 @@ CRUDE_DAGGER = {
   'num_exist': 2,
   'worth': 50,
   'equipment_slot': EquipmentSlot.SHIELD_HAND,
-  'attack_speed': 15,
-  'base_weapon_damage': 15,
-  'random_weapon_damage': 10,
-  'smallest_fit': 3,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'attack_speed': 15,
+    'base_weapon_damage': 15,
+    'random_weapon_damage': 10,
+    'smallest_fit': 3,
+    'largest_fit': 7,
+  }),
 }
 
 CUDGEL = {
@@ -803,12 +842,14 @@ CUDGEL = {
   'desc': 'The cudgel has been carved out of a branch from some hardwood tree. The\nhandle fits into your hand nicely, while the business end is somewhat \nlarger, and resplendent with thick knots.',
   'num_exist': 3,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 9,
-  'base_weapon_damage': 104,
-  'random_weapon_damage': 61,
-  'smallest_fit': 4,
-  'largest_fit': 8,
-  'drop_destroy': 1,
+  'effects': effect_vector({
+    'attack_speed': 9,
+    'base_weapon_damage': 104,
+    'random_weapon_damage': 61,
+    'smallest_fit': 4,
+    'largest_fit': 8,
+    'drop_destroy': 1,
+  }),
 }
 
 DAGGER_OF_VENOMS = {
@@ -821,11 +862,13 @@ DAGGER_OF_VENOMS = {
   'line_desc': 'A curved dagger lies on the ground.',
   'num_exist': 1,
   'equipment_slot': EquipmentSlot.SHIELD_HAND,
-  'poison': 22,
-  'base_weapon_damage': 25,
-  'random_weapon_damage': 40,
-  'smallest_fit': 3,
-  'largest_fit': 10,
+  'effects': effect_vector({
+    'poison': 22,
+    'base_weapon_damage': 25,
+    'random_weapon_damage': 40,
+    'smallest_fit': 3,
+    'largest_fit': 10,
+  }),
 }
 
 DIRK = {
@@ -836,12 +879,14 @@ DIRK = {
   'desc': 'The dirk is a short sword, more properly belonging somewhere between\nlarge knife and short sword. The blade is thin, but strong. The cross-\npiece on the hilt curves upward at the ends into two sharp prongs.',
   'num_exist': 9,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 7,
-  'base_weapon_damage': 108,
-  'random_weapon_damage': 52,
-  'smallest_fit': 3,
-  'largest_fit': 7,
-  'drop_destroy': 1,
+  'effects': effect_vector({
+    'attack_speed': 7,
+    'base_weapon_damage': 108,
+    'random_weapon_damage': 52,
+    'smallest_fit': 3,
+    'largest_fit': 7,
+    'drop_destroy': 1,
+  }),
 }
 
 DRAGON_BOMB = {
@@ -861,12 +906,14 @@ DRAGON_CLAWS = {
   'desc': 'The portal resists your attempts to open it, and a calm voice speaks\ninside your head:\n "What lies beyond this door is the pervue of the the original Master of\n  the Lake, the First Water Lord. Only he, or those working in his name\n  may enter the sacred chamber beyond."',
   'line_desc': 'A clump of huge, boney claws and leather strands lies here.',
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'attack_speed': 2,
-  'base_weapon_damage': 10,
-  'random_weapon_damage': 500,
-  'smallest_fit': 5,
-  'largest_fit': 9,
-  'cursed': 1,
+  'effects': effect_vector({
+    'attack_speed': 2,
+    'base_weapon_damage': 10,
+    'random_weapon_damage': 500,
+    'smallest_fit': 5,
+    'largest_fit': 9,
+    'cursed': 1,
+  }),
 }
 
 DREAMING_STONE = {
@@ -878,7 +925,9 @@ DREAMING_STONE = {
   'desc': 'The Dreaming Stone is sphere,one half of which appears to be of amber,\nthe other half of stone. The two pieces fit together exactly, but the\nmethod of their adhesion eludes you.',
   'num_exist': 2,
   'equipment_slot': EquipmentSlot.NOT_EQUIPPABLE,
-  'see_invisible': 1,
+  'effects': effect_vector({
+    'see_invisible': 1,
+  }),
 }
 
 DRUIDSLAYER = {
@@ -891,17 +940,19 @@ DRUIDSLAYER = {
   'line_desc': 'There is a silvery two handed sword here.',
   'num_exist': 1,
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'level_mana': 5,
-  'attack_speed': 11,
-  'base_weapon_damage': 85,
-  'random_weapon_damage': 170,
-  'base_armor': 3,
-  'spell_armor': 6,
-  'smallest_fit': 5,
-  'largest_fit': 7,
-  'break_chance': 4,
-  'break_magnitude': 1,
-  'cursed': 1,
+  'effects': effect_vector({
+    'level_mana': 5,
+    'attack_speed': 11,
+    'base_weapon_damage': 85,
+    'random_weapon_damage': 170,
+    'base_armor': 3,
+    'spell_armor': 6,
+    'smallest_fit': 5,
+    'largest_fit': 7,
+    'break_chance': 4,
+    'break_magnitude': 1,
+    'cursed': 1,
+  }),
 }
 
 DWARVEN_MAIL = {
@@ -913,11 +964,13 @@ DWARVEN_MAIL = {
   'num_exist': 3,
   'worth': 56,
   'equipment_slot': EquipmentSlot.BODY,
-  'base_armor': 6,
-  'spell_armor': 6,
-  'smallest_fit': 3,
-  'largest_fit': 5,
-  'no_throw': 1,
+  'effects': effect_vector({
+    'base_armor': 6,
+    'spell_armor': 6,
+    'smallest_fit': 3,
+    'largest_fit': 5,
+    'no_throw': 1,
+  }),
 }
 
 EBONBLADE = {
@@ -929,12 +982,14 @@ EBONBLADE = {
   'desc': 'This double-edged sword has a long, thin blade. The hilt is rather\nutilitarian and unexceptional, and is made from the same dark metal\nas the rest of the weapon. When you touch it, you feel a strange \nsensation.',
   'num_exist': 1,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 10,
-  'base_weapon_damage': 90,
-  'random_weapon_damage': 140,
-  'smallest_fit': 4,
-  'largest_fit': 7,
-  'cursed': 1,
+  'effects': effect_vector({
+    'attack_speed': 10,
+    'base_weapon_damage': 90,
+    'random_weapon_damage': 140,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+    'cursed': 1,
+  }),
 }
 
 EBONY_STAFF = {
@@ -954,7 +1009,9 @@ EEK = {
   'prototype_tags': ['object', 'record_id_1'],
   'article': 2,
   'equipment_slot': EquipmentSlot.NOT_EQUIPPABLE,
-  'throw_range': 2,
+  'effects': effect_vector({
+    'throw_range': 2,
+  }),
 }
 
 ELFEN_SPEAR = {
@@ -966,11 +1023,13 @@ ELFEN_SPEAR = {
   'desc': 'The spear is long and is made of finely crafted wood. The head looks\ndeadly, and is made of a silvery metal.',
   'line_desc': 'There is a delicate, but deadly looking, spear here.',
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'base_weapon_damage': 130,
-  'random_weapon_damage': 40,
-  'smallest_fit': 4,
-  'largest_fit': 6,
-  'drop_destroy': 1,
+  'effects': effect_vector({
+    'base_weapon_damage': 130,
+    'random_weapon_damage': 40,
+    'smallest_fit': 4,
+    'largest_fit': 6,
+    'drop_destroy': 1,
+  }),
 }
 
 ELFSTONE = {
@@ -981,8 +1040,10 @@ ELFSTONE = {
   'article': 2,
   'num_exist': 1,
   'equipment_slot': EquipmentSlot.BACKPACK,
-  'smallest_fit': 4,
-  'largest_fit': 10,
+  'effects': effect_vector({
+    'smallest_fit': 4,
+    'largest_fit': 10,
+  }),
 }
 
 FIRE_OPAL = {
@@ -994,7 +1055,9 @@ FIRE_OPAL = {
   'get_fail_msg': 'The Fire Opal is set into the floor and cannot be removed.',
   'sticky': True,
   'equipment_slot': EquipmentSlot.NOT_EQUIPPABLE,
-  'teleport': 84,
+  'effects': effect_vector({
+    'teleport': 84,
+  }),
 }
 
 GAUNTLET_OF_CRUSADER = {
@@ -1006,10 +1069,12 @@ GAUNTLET_OF_CRUSADER = {
   'desc': 'The guantlet is made of a fine chain mail mesh, under which lies a\nglove of red leather. The leather is emblazoned with a rampant dragon,\nand bears the initial "C".',
   'line_desc': 'There is a fine gauntlet here on the ground.',
   'equipment_slot': EquipmentSlot.HAND,
-  'base_armor': 5,
-  'spell_armor': 20,
-  'smallest_fit': 4,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'base_armor': 5,
+    'spell_armor': 20,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+  }),
 }
 
 GAUNTLETS = {
@@ -1024,8 +1089,10 @@ GAUNTLETS = {
   'num_exist': 15,
   'worth': 40,
   'equipment_slot': EquipmentSlot.HAND,
-  'base_armor': 1,
-  'largest_fit': 999,
+  'effects': effect_vector({
+    'base_armor': 1,
+    'largest_fit': 999,
+  }),
 }
 
 GEM_OF_TRUE_SEEING = {
@@ -1036,8 +1103,10 @@ GEM_OF_TRUE_SEEING = {
   'components': [],
   'num_exist': 1,
   'equipment_slot': EquipmentSlot.POUCH,
-  'smallest_fit': 2,
-  'largest_fit': 22,
+  'effects': effect_vector({
+    'smallest_fit': 2,
+    'largest_fit': 22,
+  }),
 }
 
 GLOVES_OF_ATLAS = {
@@ -1049,11 +1118,13 @@ GLOVES_OF_ATLAS = {
   'desc': 'The gloves are of thick leather, and are a sooty black.',
   'num_exist': 1,
   'equipment_slot': EquipmentSlot.HAND,
-  'size': 5,
-  'random_weapon_damage': 20,
-  'largest_fit': 10,
-  'break_chance': 5,
-  'break_magnitude': 10,
+  'effects': effect_vector({
+    'size': 5,
+    'random_weapon_damage': 20,
+    'largest_fit': 10,
+    'break_chance': 5,
+    'break_magnitude': 10,
+  }),
 }
 
 GRAY_ORB = {
@@ -1074,9 +1145,11 @@ GREEK_FIREBOMB = {
   'num_exist': 3,
   'worth': 20,
   'equipment_slot': EquipmentSlot.NOT_EQUIPPABLE,
-  'bomb_base': 100,
-  'bomb_random': 120,
-  'bomb_time': 1,
+  'effects': effect_vector({
+    'bomb_base': 100,
+    'bomb_random': 120,
+    'bomb_time': 1,
+  }),
 }
 
 HACK_OBJ = {
@@ -1086,8 +1159,10 @@ HACK_OBJ = {
   'prototype_tags': ['object', 'record_id_124'],
   'num_exist': 1,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'largest_fit': 10,
-  'spell_deflect_armor': 50,
+  'effects': effect_vector({
+    'largest_fit': 10,
+    'spell_deflect_armor': 50,
+  }),
 }
 
 HAMMER_OF_THE_GODS = {
@@ -1099,11 +1174,13 @@ HAMMER_OF_THE_GODS = {
   'desc': 'The Hammer is a very large, two handed weapon of mass destruction.',
   'num_exist': 2,
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'attack_speed': 12,
-  'base_weapon_damage': 1,
-  'random_weapon_damage': 500,
-  'smallest_fit': 5,
-  'largest_fit': 8,
+  'effects': effect_vector({
+    'attack_speed': 12,
+    'base_weapon_damage': 1,
+    'random_weapon_damage': 500,
+    'smallest_fit': 5,
+    'largest_fit': 8,
+  }),
 }
 
 HATCHET = {
@@ -1113,12 +1190,14 @@ HATCHET = {
   'prototype_tags': ['object', 'record_id_46'],
   'desc': 'The hatchet is of a common sort, being a short, single headed axe \ndesigned for use with one hand. It shows signs of frequent use, but\nshould serve your uses.',
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 7,
-  'base_weapon_damage': 121,
-  'random_weapon_damage': 26,
-  'smallest_fit': 3,
-  'largest_fit': 7,
-  'drop_destroy': 1,
+  'effects': effect_vector({
+    'attack_speed': 7,
+    'base_weapon_damage': 121,
+    'random_weapon_damage': 26,
+    'smallest_fit': 3,
+    'largest_fit': 7,
+    'drop_destroy': 1,
+  }),
 }
 
 HEART_OF_THE_LAKE = {
@@ -1130,7 +1209,9 @@ HEART_OF_THE_LAKE = {
   'desc': "The object is a very large stone, deep blue in color, which seems\nalmost to give off a cool light. It is definitely translucent. It's\nsurface is smooth, but very faint cracks can be seen to move across\nthe deep blue exterior.",
   'get_fail_msg': 'The Heart of the Lake is obviously too large and heavy for you to\ntake or move.',
   'equipment_slot': EquipmentSlot.NOT_EQUIPPABLE,
-  'teleport': 433,
+  'effects': effect_vector({
+    'teleport': 433,
+  }),
 }
 
 HORNED_HELM = {
@@ -1142,10 +1223,12 @@ HORNED_HELM = {
   'num_exist': 15,
   'worth': 20,
   'equipment_slot': EquipmentSlot.HEAD,
-  'deflect_armor': 1,
-  'smallest_fit': 4,
-  'largest_fit': 7,
-  'spell_deflect_armor': 1,
+  'effects': effect_vector({
+    'deflect_armor': 1,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+    'spell_deflect_armor': 1,
+  }),
 }
 
 IRON_BAR = {
@@ -1157,12 +1240,14 @@ IRON_BAR = {
   'desc': 'The bar is about an inch and a half in diameter, and is made of black\niron. It is about four feet long, and one end is slightly bent.',
   'num_exist': 2,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 9,
-  'base_weapon_damage': 99,
-  'random_weapon_damage': 69,
-  'smallest_fit': 4,
-  'largest_fit': 7,
-  'drop_destroy': 1,
+  'effects': effect_vector({
+    'attack_speed': 9,
+    'base_weapon_damage': 99,
+    'random_weapon_damage': 69,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+    'drop_destroy': 1,
+  }),
 }
 
 IVORY_KNIFE = {
@@ -1175,12 +1260,14 @@ IVORY_KNIFE = {
   'get_success_msg': 'Your hand becomes numb as it closes over the faintly glowing knife..',
   'line_desc': 'There is a light on the ground at your feet.',
   'equipment_slot': EquipmentSlot.SHIELD_HAND,
-  'attack_speed': 13,
-  'poison': 35,
-  'base_weapon_damage': 100,
-  'random_weapon_damage': 175,
-  'smallest_fit': 5,
-  'largest_fit': 8,
+  'effects': effect_vector({
+    'attack_speed': 13,
+    'poison': 35,
+    'base_weapon_damage': 100,
+    'random_weapon_damage': 175,
+    'smallest_fit': 5,
+    'largest_fit': 8,
+  }),
 }
 
 JAVELIN = {
@@ -1192,14 +1279,16 @@ JAVELIN = {
   'num_exist': 6,
   'worth': 42,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 5,
-  'base_weapon_damage': 90,
-  'random_weapon_damage': 118,
-  'smallest_fit': 3,
-  'largest_fit': 7,
-  'throw_base': 85,
-  'throw_random': 104,
-  'throw_range': 3,
+  'effects': effect_vector({
+    'attack_speed': 5,
+    'base_weapon_damage': 90,
+    'random_weapon_damage': 118,
+    'smallest_fit': 3,
+    'largest_fit': 7,
+    'throw_base': 85,
+    'throw_random': 104,
+    'throw_range': 3,
+  }),
 }
 
 JEWELED_SCIMITAR = {
@@ -1211,11 +1300,13 @@ JEWELED_SCIMITAR = {
   'num_exist': 4,
   'worth': 120,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 9,
-  'base_weapon_damage': 101,
-  'random_weapon_damage': 105,
-  'smallest_fit': 5,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'attack_speed': 9,
+    'base_weapon_damage': 101,
+    'random_weapon_damage': 105,
+    'smallest_fit': 5,
+    'largest_fit': 7,
+  }),
 }
 
 KEY = {
@@ -1224,7 +1315,9 @@ KEY = {
   'record_id': 103,
   'prototype_tags': ['object', 'record_id_103'],
   'equipment_slot': EquipmentSlot.NOT_EQUIPPABLE,
-  'drop_destroy': 1,
+  'effects': effect_vector({
+    'drop_destroy': 1,
+  }),
 }
 
 LAKEBLADE = {
@@ -1235,11 +1328,13 @@ LAKEBLADE = {
   'desc': 'The blade is a long sword constructed of a strange metal which is dull\nsilver in color. The blade is somewhat thin, but very strong. In varying\nlight, the metal seems almost to flow along the surface of the weapon.',
   'get_object_required': 181,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 10,
-  'base_weapon_damage': 25,
-  'random_weapon_damage': 284,
-  'smallest_fit': 5,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'attack_speed': 10,
+    'base_weapon_damage': 25,
+    'random_weapon_damage': 284,
+    'smallest_fit': 5,
+    'largest_fit': 7,
+  }),
 }
 
 LEATHER_BELT = {
@@ -1249,8 +1344,10 @@ LEATHER_BELT = {
   'prototype_tags': ['object', 'record_id_94'],
   'desc': 'The belt is faded, but otherwise a normal belt.',
   'equipment_slot': EquipmentSlot.WAIST,
-  'smallest_fit': 3,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'smallest_fit': 3,
+    'largest_fit': 7,
+  }),
 }
 
 LEATHER_BOOTS = {
@@ -1262,9 +1359,11 @@ LEATHER_BOOTS = {
   'desc': 'This pair of boots appear to be slightly worn in, but they look like\nthey are heavy enough to protect your feet from harsh terrain.',
   'worth': 15,
   'equipment_slot': EquipmentSlot.FEET,
-  'base_armor': 1,
-  'smallest_fit': 4,
-  'largest_fit': 8,
+  'effects': effect_vector({
+    'base_armor': 1,
+    'smallest_fit': 4,
+    'largest_fit': 8,
+  }),
 }
 
 LEATHER_JERKIN = {
@@ -1276,10 +1375,12 @@ LEATHER_JERKIN = {
   'num_exist': 2,
   'worth': 40,
   'equipment_slot': EquipmentSlot.BODY,
-  'base_armor': 3,
-  'spell_armor': 2,
-  'smallest_fit': 5,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'base_armor': 3,
+    'spell_armor': 2,
+    'smallest_fit': 5,
+    'largest_fit': 7,
+  }),
 }
 
 LICH_RING = {
@@ -1289,10 +1390,12 @@ LICH_RING = {
   'prototype_tags': ['object', 'record_id_15'],
   'desc': 'The ring is thin, and carved from some bone or ivory. Etched onto the\ninner surface of the rings are the following words, written in an\nancient but still understandable dialect:\n\n             "Burn away your life and soul."',
   'equipment_slot': EquipmentSlot.RING,
-  'smallest_fit': 4,
-  'largest_fit': 9,
-  'spell_deflect_armor': 20,
-  'drop_destroy': 1,
+  'effects': effect_vector({
+    'smallest_fit': 4,
+    'largest_fit': 9,
+    'spell_deflect_armor': 20,
+    'drop_destroy': 1,
+  }),
 }
 
 LONGSWORD = {
@@ -1304,11 +1407,13 @@ LONGSWORD = {
   'num_exist': 5,
   'worth': 62,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 10,
-  'base_weapon_damage': 105,
-  'random_weapon_damage': 92,
-  'smallest_fit': 4,
-  'largest_fit': 10,
+  'effects': effect_vector({
+    'attack_speed': 10,
+    'base_weapon_damage': 105,
+    'random_weapon_damage': 92,
+    'smallest_fit': 4,
+    'largest_fit': 10,
+  }),
 }
 
 MACE = {
@@ -1320,11 +1425,13 @@ MACE = {
   'num_exist': 9,
   'worth': 76,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 8,
-  'base_weapon_damage': 126,
-  'random_weapon_damage': 52,
-  'smallest_fit': 3,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'attack_speed': 8,
+    'base_weapon_damage': 126,
+    'random_weapon_damage': 52,
+    'smallest_fit': 3,
+    'largest_fit': 7,
+  }),
 }
 
 MAELSTROM_RING = {
@@ -1334,9 +1441,11 @@ MAELSTROM_RING = {
   'prototype_tags': ['object', 'record_id_117'],
   'desc': 'The ring is constructed of a dull lead, and bears no discernable\nmarkings.',
   'equipment_slot': EquipmentSlot.RING,
-  'poison': 5,
-  'smallest_fit': 4,
-  'largest_fit': 10,
+  'effects': effect_vector({
+    'poison': 5,
+    'smallest_fit': 4,
+    'largest_fit': 10,
+  }),
 }
 
 MAGECRUSHER = {
@@ -1349,11 +1458,13 @@ MAGECRUSHER = {
   'get_success_msg': 'You lift the weapon, shuddering at the very touch of the unnaturally\ncold steel...',
   'line_desc': 'On the ground here is a large black mace.',
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 8,
-  'base_weapon_damage': 152,
-  'random_weapon_damage': 26,
-  'smallest_fit': 4,
-  'largest_fit': 10,
+  'effects': effect_vector({
+    'attack_speed': 8,
+    'base_weapon_damage': 152,
+    'random_weapon_damage': 26,
+    'smallest_fit': 4,
+    'largest_fit': 10,
+  }),
 }
 
 MAGIC_HELMET = {
@@ -1365,10 +1476,12 @@ MAGIC_HELMET = {
   'num_exist': 1,
   'worth': 800,
   'equipment_slot': EquipmentSlot.HEAD,
-  'deflect_armor': 3,
-  'smallest_fit': 1,
-  'largest_fit': 8,
-  'spell_deflect_armor': 3,
+  'effects': effect_vector({
+    'deflect_armor': 3,
+    'smallest_fit': 1,
+    'largest_fit': 8,
+    'spell_deflect_armor': 3,
+  }),
 }
 
 MAGIC_LONGSWORD = {
@@ -1380,11 +1493,13 @@ MAGIC_LONGSWORD = {
   'num_exist': 2,
   'worth': 800,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 10,
-  'base_weapon_damage': 125,
-  'random_weapon_damage': 92,
-  'smallest_fit': 4,
-  'largest_fit': 10,
+  'effects': effect_vector({
+    'attack_speed': 10,
+    'base_weapon_damage': 125,
+    'random_weapon_damage': 92,
+    'smallest_fit': 4,
+    'largest_fit': 10,
+  }),
 }
 
 MAGIC_SHIELD = {
@@ -1395,11 +1510,13 @@ MAGIC_SHIELD = {
   'desc': 'This ancient looking shield appears as though it were made out of a solid\npice of copper, yet it has strength unlike any metal you have seen.',
   'worth': 800,
   'equipment_slot': EquipmentSlot.SHIELD_HAND,
-  'random_weapon_damage': 1,
-  'deflect_armor': 7,
-  'smallest_fit': 4,
-  'largest_fit': 7,
-  'spell_deflect_armor': 7,
+  'effects': effect_vector({
+    'random_weapon_damage': 1,
+    'deflect_armor': 7,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+    'spell_deflect_armor': 7,
+  }),
 }
 
 MEAT_CLEAVER = {
@@ -1410,14 +1527,16 @@ MEAT_CLEAVER = {
   'desc': "The cleaver looks like an ordinary butcher's utensil. The single edged\nblade is hefty, and bears small notches wear it has been marred by \ncontact with bone.",
   'num_exist': 3,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'base_weapon_damage': 30,
-  'random_weapon_damage': 70,
-  'smallest_fit': 3,
-  'largest_fit': 8,
-  'throw_base': 40,
-  'throw_random': 50,
-  'throw_range': 5,
-  'throw_behavior': 3,
+  'effects': effect_vector({
+    'base_weapon_damage': 30,
+    'random_weapon_damage': 70,
+    'smallest_fit': 3,
+    'largest_fit': 8,
+    'throw_base': 40,
+    'throw_random': 50,
+    'throw_range': 5,
+    'throw_behavior': 3,
+  }),
 }
 
 MILITARY_FORK = {
@@ -1428,13 +1547,15 @@ MILITARY_FORK = {
   'desc': 'This military fork resembles a spear, with two more points coming\nout from the center one.  It is very light weight, and could\npossibly even be thrown!',
   'worth': 110,
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'base_weapon_damage': 95,
-  'random_weapon_damage': 100,
-  'smallest_fit': 5,
-  'largest_fit': 10,
-  'throw_base': 90,
-  'throw_random': 70,
-  'throw_range': 3,
+  'effects': effect_vector({
+    'base_weapon_damage': 95,
+    'random_weapon_damage': 100,
+    'smallest_fit': 5,
+    'largest_fit': 10,
+    'throw_base': 90,
+    'throw_random': 70,
+    'throw_range': 3,
+  }),
 }
 
 NORMAN_KITE_SHIELD = {
@@ -1446,10 +1567,12 @@ NORMAN_KITE_SHIELD = {
   'num_exist': 7,
   'worth': 70,
   'equipment_slot': EquipmentSlot.SHIELD_HAND,
-  'deflect_armor': 3,
-  'smallest_fit': 5,
-  'largest_fit': 8,
-  'spell_deflect_armor': 3,
+  'effects': effect_vector({
+    'deflect_armor': 3,
+    'smallest_fit': 5,
+    'largest_fit': 8,
+    'spell_deflect_armor': 3,
+  }),
 }
 
 OLD_SHOE = {
@@ -1460,8 +1583,10 @@ OLD_SHOE = {
   'article': 2,
   'desc': 'The shoe is of leather, and is very tattered.',
   'equipment_slot': EquipmentSlot.FEET,
-  'smallest_fit': 3,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'smallest_fit': 3,
+    'largest_fit': 7,
+  }),
 }
 
 PEACOCK_GLOVE = {
@@ -1484,11 +1609,13 @@ PIKE = {
   'num_exist': 2,
   'worth': 100,
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'attack_speed': 18,
-  'base_weapon_damage': 87,
-  'random_weapon_damage': 154,
-  'smallest_fit': 5,
-  'largest_fit': 8,
+  'effects': effect_vector({
+    'attack_speed': 18,
+    'base_weapon_damage': 87,
+    'random_weapon_damage': 154,
+    'smallest_fit': 5,
+    'largest_fit': 8,
+  }),
 }
 
 PINK_FAIRY_TIGHTS = {
@@ -1503,8 +1630,10 @@ PINK_FAIRY_TIGHTS = {
   'weight': -10,
   'worth': 300,
   'equipment_slot': EquipmentSlot.LEGS,
-  'base_health': 100,
-  'largest_fit': 20,
+  'effects': effect_vector({
+    'base_health': 100,
+    'largest_fit': 20,
+  }),
 }
 
 PITCHFORK = {
@@ -1514,11 +1643,13 @@ PITCHFORK = {
   'prototype_tags': ['object', 'record_id_37'],
   'desc': 'The pitchfork looks like an ordinary farm implement. Each of the four\nblackened prongs appears sharp, and capable of delivering a serious\ninjury.',
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'attack_speed': 14,
-  'base_weapon_damage': 61,
-  'random_weapon_damage': 147,
-  'smallest_fit': 5,
-  'largest_fit': 9,
+  'effects': effect_vector({
+    'attack_speed': 14,
+    'base_weapon_damage': 61,
+    'random_weapon_damage': 147,
+    'smallest_fit': 5,
+    'largest_fit': 9,
+  }),
 }
 
 PLUMED_HELM = {
@@ -1530,10 +1661,12 @@ PLUMED_HELM = {
   'num_exist': 4,
   'worth': 20,
   'equipment_slot': EquipmentSlot.HEAD,
-  'deflect_armor': 1,
-  'smallest_fit': 4,
-  'largest_fit': 7,
-  'spell_deflect_armor': 1,
+  'effects': effect_vector({
+    'deflect_armor': 1,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+    'spell_deflect_armor': 1,
+  }),
 }
 
 QUARTZ_EYES = {
@@ -1546,10 +1679,12 @@ QUARTZ_EYES = {
   'line_desc': 'Two small quartz stones are here on the ground.',
   'num_exist': 1,
   'equipment_slot': EquipmentSlot.EYES,
-  'see_invisible': 1,
-  'spell_armor': 5,
-  'smallest_fit': 2,
-  'largest_fit': 9,
+  'effects': effect_vector({
+    'see_invisible': 1,
+    'spell_armor': 5,
+    'smallest_fit': 2,
+    'largest_fit': 9,
+  }),
 }
 
 RED_PLATE_MAIL = {
@@ -1566,14 +1701,16 @@ RED_PLATE_MAIL = {
   'weight': 30,
   'worth': 98999999,
   'equipment_slot': EquipmentSlot.BODY,
-  'base_health': 100,
-  'base_armor': 11,
-  'deflect_armor': 10,
-  'spell_armor': 11,
-  'smallest_fit': 5,
-  'largest_fit': 7,
-  'spell_deflect_armor': 10,
-  'cursed': 1,
+  'effects': effect_vector({
+    'base_health': 100,
+    'base_armor': 11,
+    'deflect_armor': 10,
+    'spell_armor': 11,
+    'smallest_fit': 5,
+    'largest_fit': 7,
+    'spell_deflect_armor': 10,
+    'cursed': 1,
+  }),
 }
 
 RHINESTONE_RING = {
@@ -1586,9 +1723,11 @@ RHINESTONE_RING = {
   'num_exist': 1,
   'worth': 150,
   'equipment_slot': EquipmentSlot.RING,
-  'base_health': 99,
-  'smallest_fit': 3,
-  'largest_fit': 10,
+  'effects': effect_vector({
+    'base_health': 99,
+    'smallest_fit': 3,
+    'largest_fit': 10,
+  }),
 }
 
 RING_MAIL_ARMOR = {
@@ -1601,10 +1740,12 @@ RING_MAIL_ARMOR = {
   'num_exist': 2,
   'worth': 55,
   'equipment_slot': EquipmentSlot.BODY,
-  'base_armor': 4,
-  'spell_armor': 3,
-  'smallest_fit': 5,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'base_armor': 4,
+    'spell_armor': 3,
+    'smallest_fit': 5,
+    'largest_fit': 7,
+  }),
 }
 
 RUNE = {
@@ -1617,9 +1758,11 @@ RUNE = {
   'num_exist': 2,
   'worth': 2001,
   'equipment_slot': EquipmentSlot.HAND,
-  'base_mana': 80,
-  'smallest_fit': 3,
-  'largest_fit': 10,
+  'effects': effect_vector({
+    'base_mana': 80,
+    'smallest_fit': 3,
+    'largest_fit': 10,
+  }),
 }
 
 SAXON_AXE = {
@@ -1631,11 +1774,13 @@ SAXON_AXE = {
   'num_exist': 4,
   'worth': 78,
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'attack_speed': 10,
-  'base_weapon_damage': 87,
-  'random_weapon_damage': 155,
-  'smallest_fit': 5,
-  'largest_fit': 8,
+  'effects': effect_vector({
+    'attack_speed': 10,
+    'base_weapon_damage': 87,
+    'random_weapon_damage': 155,
+    'smallest_fit': 5,
+    'largest_fit': 8,
+  }),
 }
 
 SCALE_MAIL_ARMOR = {
@@ -1648,10 +1793,12 @@ SCALE_MAIL_ARMOR = {
   'num_exist': 16,
   'worth': 105,
   'equipment_slot': EquipmentSlot.BODY,
-  'base_armor': 7,
-  'spell_armor': 7,
-  'smallest_fit': 5,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'base_armor': 7,
+    'spell_armor': 7,
+    'smallest_fit': 5,
+    'largest_fit': 7,
+  }),
 }
 
 SCIMITAR = {
@@ -1662,11 +1809,13 @@ SCIMITAR = {
   'desc': 'This scimitar ahs a long curved blade, good for slashing opponents.',
   'worth': 60,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'base_weapon_use': 10,
-  'base_weapon_damage': 220,
-  'random_weapon_damage': 210,
-  'smallest_fit': 3,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'base_weapon_use': 10,
+    'base_weapon_damage': 220,
+    'random_weapon_damage': 210,
+    'smallest_fit': 3,
+    'largest_fit': 7,
+  }),
 }
 
 SERPENT_SKIN_CLOAK = {
@@ -1678,10 +1827,12 @@ SERPENT_SKIN_CLOAK = {
   'get_success_msg': 'You pull the wriggling cape towards you despite its efforts to\nescape..',
   'line_desc': 'There is a pile of snakes writhing towards you!',
   'equipment_slot': EquipmentSlot.BODY,
-  'base_move_silent': 20,
-  'spell_armor': 42,
-  'smallest_fit': 5,
-  'largest_fit': 8,
+  'effects': effect_vector({
+    'base_move_silent': 20,
+    'spell_armor': 42,
+    'smallest_fit': 5,
+    'largest_fit': 8,
+  }),
 }
 
 SHARPENED_STICK = {
@@ -1691,10 +1842,12 @@ SHARPENED_STICK = {
   'prototype_tags': ['object', 'record_id_104'],
   'num_exist': 2,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'base_weapon_damage': 100,
-  'random_weapon_damage': 100,
-  'smallest_fit': 2,
-  'largest_fit': 12,
+  'effects': effect_vector({
+    'base_weapon_damage': 100,
+    'random_weapon_damage': 100,
+    'smallest_fit': 2,
+    'largest_fit': 12,
+  }),
 }
 
 SHINY_OBJECT = {
@@ -1715,12 +1868,14 @@ SHORT_SWORD = {
   'desc': "This sword is shorter than most. It's blade is straight and double\nedged, and looks to be a nasty thrusting weapon.",
   'num_exist': 1,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 8,
-  'base_weapon_damage': 70,
-  'random_weapon_damage': 140,
-  'smallest_fit': 4,
-  'largest_fit': 6,
-  'drop_destroy': 1,
+  'effects': effect_vector({
+    'attack_speed': 8,
+    'base_weapon_damage': 70,
+    'random_weapon_damage': 140,
+    'smallest_fit': 4,
+    'largest_fit': 6,
+    'drop_destroy': 1,
+  }),
 }
 
 SHROUD_OF_KROTCHE = {
@@ -1733,9 +1888,11 @@ SHROUD_OF_KROTCHE = {
   'line_desc': 'An ancient length of cloth is here.',
   'weight': 30,
   'equipment_slot': EquipmentSlot.BACK,
-  'base_move_silent': 100,
-  'smallest_fit': 3,
-  'largest_fit': 20,
+  'effects': effect_vector({
+    'base_move_silent': 100,
+    'smallest_fit': 3,
+    'largest_fit': 20,
+  }),
 }
 
 SILK_ROBE = {
@@ -1758,12 +1915,14 @@ SILVER_RAPIER = {
   'prototype_tags': ['object', 'record_id_50'],
   'desc': 'The blade is very thin and flexible, being constructed of a very fine \nsteel. Not very practical as a slashing weapon, this sword is, however,\ndeadly when used deftly as a thrusting and lunging weapon. The hilt is\nof iron inlaid with silver, and the blade seems to bear a hint of silver\nas well.',
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 9,
-  'base_weapon_damage': 145,
-  'random_weapon_damage': 2,
-  'smallest_fit': 4,
-  'largest_fit': 7,
-  'drop_destroy': 1,
+  'effects': effect_vector({
+    'attack_speed': 9,
+    'base_weapon_damage': 145,
+    'random_weapon_damage': 2,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+    'drop_destroy': 1,
+  }),
 }
 
 SPEAR = {
@@ -1775,11 +1934,13 @@ SPEAR = {
   'num_exist': 8,
   'worth': 72,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 6,
-  'base_weapon_damage': 117,
-  'random_weapon_damage': 76,
-  'smallest_fit': 4,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'attack_speed': 6,
+    'base_weapon_damage': 117,
+    'random_weapon_damage': 76,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+  }),
 }
 
 STACK_DUMP_BOMB = {
@@ -1789,7 +1950,9 @@ STACK_DUMP_BOMB = {
   'prototype_tags': ['object', 'record_id_80'],
   'num_exist': 2,
   'equipment_slot': EquipmentSlot.NOT_EQUIPPABLE,
-  'bomb_base': 1,
+  'effects': effect_vector({
+    'bomb_base': 1,
+  }),
 }
 
 STAFF_OF_LUXOR = {
@@ -1812,16 +1975,18 @@ STAFF_OF_RA = {
   'get_success_msg': 'As you pick up the staff, you are jolted with a surge of energy.',
   'line_desc': 'An eboy staff lies on the ground.',
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'base_mana': 40,
-  'cast_spell': 30,
-  'poison': 10,
-  'base_weapon_damage': 175,
-  'random_weapon_damage': 100,
-  'base_armor': 10,
-  'spell_armor': 10,
-  'smallest_fit': 4,
-  'largest_fit': 7,
-  'charges': 200,
+  'effects': effect_vector({
+    'base_mana': 40,
+    'cast_spell': 30,
+    'poison': 10,
+    'base_weapon_damage': 175,
+    'random_weapon_damage': 100,
+    'base_armor': 10,
+    'spell_armor': 10,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+    'charges': 200,
+  }),
 }
 
 STEEL_BREASTPLATE = {
@@ -1834,11 +1999,13 @@ STEEL_BREASTPLATE = {
   'weight': 40,
   'worth': 320,
   'equipment_slot': EquipmentSlot.UPPER_TORSO,
-  'attack_speed': 20,
-  'base_armor': 15,
-  'deflect_armor': 10,
-  'smallest_fit': 2,
-  'largest_fit': 10,
+  'effects': effect_vector({
+    'attack_speed': 20,
+    'base_armor': 15,
+    'deflect_armor': 10,
+    'smallest_fit': 2,
+    'largest_fit': 10,
+  }),
 }
 
 STONE_MALLET = {
@@ -1847,10 +2014,12 @@ STONE_MALLET = {
   'record_id': 169,
   'prototype_tags': ['object', 'record_id_169'],
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'base_weapon_damage': 100,
-  'random_weapon_damage': 105,
-  'smallest_fit': 3,
-  'largest_fit': 6,
+  'effects': effect_vector({
+    'base_weapon_damage': 100,
+    'random_weapon_damage': 105,
+    'smallest_fit': 3,
+    'largest_fit': 6,
+  }),
 }
 
 SWORD_O_STACK_DUMPS = {
@@ -1859,9 +2028,11 @@ SWORD_O_STACK_DUMPS = {
   'record_id': 137,
   'prototype_tags': ['object', 'record_id_137'],
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'base_weapon_damage': 1,
-  'smallest_fit': 3,
-  'largest_fit': 10,
+  'effects': effect_vector({
+    'base_weapon_damage': 1,
+    'smallest_fit': 3,
+    'largest_fit': 10,
+  }),
 }
 
 SWORD_OF_DEFENSE = {
@@ -1873,8 +2044,10 @@ SWORD_OF_DEFENSE = {
   'line_desc': 'A blue sword lies here waiting for you hands!',
   'worth': 1000000000,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'base_weapon_damage': 100,
-  'random_weapon_damage': 250,
+  'effects': effect_vector({
+    'base_weapon_damage': 100,
+    'random_weapon_damage': 250,
+  }),
 }
 
 SWORD_OF_THE_KINGS = {
@@ -1886,10 +2059,12 @@ SWORD_OF_THE_KINGS = {
   'line_desc': 'A very large two handed sword lies here on the ground.',
   'num_exist': 1,
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'base_weapon_damage': 225,
-  'random_weapon_damage': 199,
-  'smallest_fit': 5,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'base_weapon_damage': 225,
+    'random_weapon_damage': 199,
+    'smallest_fit': 5,
+    'largest_fit': 7,
+  }),
 }
 
 THERMO_NUCLEAR_BOMB = {
@@ -1899,8 +2074,10 @@ THERMO_NUCLEAR_BOMB = {
   'prototype_tags': ['object', 'record_id_106'],
   'worth': 7500,
   'equipment_slot': EquipmentSlot.BACKPACK,
-  'bomb_base': 99999,
-  'bomb_random': 99999,
+  'effects': effect_vector({
+    'bomb_base': 99999,
+    'bomb_random': 99999,
+  }),
 }
 
 THROWING_DAGGER = {
@@ -1911,13 +2088,15 @@ THROWING_DAGGER = {
   'num_exist': 5,
   'worth': 25,
   'equipment_slot': EquipmentSlot.WAIST,
-  'class': 26,
-  'attack_speed': 40,
-  'smallest_fit': 3,
-  'largest_fit': 7,
-  'throw_base': 69,
-  'throw_random': 101,
-  'throw_range': 3,
+  'effects': effect_vector({
+    'class': 26,
+    'attack_speed': 40,
+    'smallest_fit': 3,
+    'largest_fit': 7,
+    'throw_base': 69,
+    'throw_random': 101,
+    'throw_range': 3,
+  }),
 }
 
 TROLL_MAIL = {
@@ -1929,10 +2108,12 @@ TROLL_MAIL = {
   'num_exist': 8,
   'worth': 59,
   'equipment_slot': EquipmentSlot.BODY,
-  'base_armor': 12,
-  'spell_armor': 7,
-  'smallest_fit': 7,
-  'largest_fit': 12,
+  'effects': effect_vector({
+    'base_armor': 12,
+    'spell_armor': 7,
+    'smallest_fit': 7,
+    'largest_fit': 12,
+  }),
 }
 
 VAPRAKS_SKIN = {
@@ -1945,13 +2126,15 @@ VAPRAKS_SKIN = {
   'num_exist': 1,
   'weight': 10,
   'equipment_slot': EquipmentSlot.UPPER_TORSO,
-  'base_claw_damage': 50,
-  'see_invisible': 1,
-  'base_armor': 12,
-  'spell_armor': 12,
-  'smallest_fit': 5,
-  'largest_fit': 10,
-  'cursed': 1,
+  'effects': effect_vector({
+    'base_claw_damage': 50,
+    'see_invisible': 1,
+    'base_armor': 12,
+    'spell_armor': 12,
+    'smallest_fit': 5,
+    'largest_fit': 10,
+    'cursed': 1,
+  }),
 }
 
 VIKING_ROUND_SHIELD = {
@@ -1963,10 +2146,12 @@ VIKING_ROUND_SHIELD = {
   'num_exist': 3,
   'worth': 85,
   'equipment_slot': EquipmentSlot.SHIELD_HAND,
-  'deflect_armor': 4,
-  'smallest_fit': 5,
-  'largest_fit': 10,
-  'spell_deflect_armor': 4,
+  'effects': effect_vector({
+    'deflect_armor': 4,
+    'smallest_fit': 5,
+    'largest_fit': 10,
+    'spell_deflect_armor': 4,
+  }),
 }
 
 VIRSH_BLADE = {
@@ -1979,12 +2164,14 @@ VIRSH_BLADE = {
   'get_success_msg': 'As you grab this weapon, you become enraged at the thought that you might\nnot be able to keep this weapon forever, you must defend yourself.',
   'weight': 10,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'control': 99,
-  'base_weapon_damage': 280,
-  'random_weapon_damage': 190,
-  'smallest_fit': 1,
-  'largest_fit': 10,
-  'spell_deflect_armor': 10,
+  'effects': effect_vector({
+    'control': 99,
+    'base_weapon_damage': 280,
+    'random_weapon_damage': 190,
+    'smallest_fit': 1,
+    'largest_fit': 10,
+    'spell_deflect_armor': 10,
+  }),
 }
 
 VOULGE = {
@@ -1997,10 +2184,12 @@ VOULGE = {
   'num_exist': 6,
   'worth': 120,
   'equipment_slot': EquipmentSlot.TWO_HAND,
-  'base_weapon_damage': 120,
-  'random_weapon_damage': 120,
-  'smallest_fit': 6,
-  'largest_fit': 15,
+  'effects': effect_vector({
+    'base_weapon_damage': 120,
+    'random_weapon_damage': 120,
+    'smallest_fit': 6,
+    'largest_fit': 15,
+  }),
 }
 
 WARHAMMER = {
@@ -2012,14 +2201,16 @@ WARHAMMER = {
   'num_exist': 5,
   'worth': 61,
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'attack_speed': 7,
-  'base_weapon_damage': 70,
-  'random_weapon_damage': 162,
-  'smallest_fit': 3,
-  'largest_fit': 6,
-  'throw_base': 70,
-  'throw_random': 162,
-  'throw_range': 3,
+  'effects': effect_vector({
+    'attack_speed': 7,
+    'base_weapon_damage': 70,
+    'random_weapon_damage': 162,
+    'smallest_fit': 3,
+    'largest_fit': 6,
+    'throw_base': 70,
+    'throw_random': 162,
+    'throw_range': 3,
+  }),
 }
 
 WARNOCK = {
@@ -2029,7 +2220,9 @@ WARNOCK = {
   'prototype_tags': ['object', 'record_id_136'],
   'worth': 300000,
   'equipment_slot': EquipmentSlot.BACKPACK,
-  'teleport': 712,
+  'effects': effect_vector({
+    'teleport': 712,
+  }),
 }
 
 WHITE_SCALE_MAIL = {
@@ -2043,12 +2236,14 @@ WHITE_SCALE_MAIL = {
   'num_exist': 1,
   'weight': 5,
   'equipment_slot': EquipmentSlot.BODY,
-  'base_health': 85,
-  'base_armor': 9,
-  'deflect_armor': 5,
-  'spell_armor': 9,
-  'smallest_fit': 4,
-  'largest_fit': 7,
+  'effects': effect_vector({
+    'base_health': 85,
+    'base_armor': 9,
+    'deflect_armor': 5,
+    'spell_armor': 9,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+  }),
 }
 
 WOODEN_SHIELD = {
@@ -2060,10 +2255,12 @@ WOODEN_SHIELD = {
   'num_exist': 2,
   'worth': 35,
   'equipment_slot': EquipmentSlot.SHIELD_HAND,
-  'deflect_armor': 2,
-  'smallest_fit': 4,
-  'largest_fit': 7,
-  'spell_deflect_armor': 2,
+  'effects': effect_vector({
+    'deflect_armor': 2,
+    'smallest_fit': 4,
+    'largest_fit': 7,
+    'spell_deflect_armor': 2,
+  }),
 }
 
 WRAITH_BLADE = {
@@ -2072,14 +2269,16 @@ WRAITH_BLADE = {
   'record_id': 16,
   'prototype_tags': ['object', 'record_id_16'],
   'equipment_slot': EquipmentSlot.SWORD_HAND,
-  'class': 19,
-  'attack_speed': 8,
-  'see_invisible': 1,
-  'base_weapon_damage': 125,
-  'random_weapon_damage': 61,
-  'smallest_fit': 5,
-  'largest_fit': 7,
-  'no_throw': 1,
+  'effects': effect_vector({
+    'class': 19,
+    'attack_speed': 8,
+    'see_invisible': 1,
+    'base_weapon_damage': 125,
+    'random_weapon_damage': 61,
+    'smallest_fit': 5,
+    'largest_fit': 7,
+    'no_throw': 1,
+  }),
 }
 
 ZEPHYR_GOGGLES = {
@@ -2094,8 +2293,10 @@ ZEPHYR_GOGGLES = {
   'weight': 3,
   'worth': 900,
   'equipment_slot': EquipmentSlot.EYES,
-  'base_weapon_use': 10,
-  'largest_fit': 20,
+  'effects': effect_vector({
+    'base_weapon_use': 10,
+    'largest_fit': 20,
+  }),
 }
 
 #
@@ -0,0 +1,137 @@
+"""
+Market index
+
+Every merchant's wares in one place: item key => where to buy it and
+for how much, plus which room each merchant stands in. Merchants are
+loaded once; after that a merchant is re-indexed when its for_sale()
+list changes (restock, admins handing it things) and moved in the room
+map when it moves.
+
+Merchant stock never runs out (sales are fresh copies), so listings
+carry a price but no quantity.
+"""
+import threading
+from evennia.objects.models import ObjectDB
+
+
+MERCHANT_TYPECLASS = "typeclasses.merchant.Merchant"
+
+
+class MarketIndex:
+  def __init__(self):
+    self.loaded = False
+    # merchant id => merchant
+    self.merchants = {}
+    # merchant id => the for_sale() list we indexed
+    self._indexed = {}
+    # lowercased item key => {merchant id: (item key, price)}
+    self.items = {}
+    # room id => merchants there, and merchant id => room id
+    self.by_room = {}
+    self.rooms = {}
+    self.lock = threading.RLock()
+
+  def load(self):
+    with self.lock:
+      self.merchants, self._indexed, self.items = {}, {}, {}
+      self.by_room, self.rooms = {}, {}
+      for merchant in ObjectDB.objects.filter(db_typeclass_path=MERCHANT_TYPECLASS):
+        self.add_merchant(merchant)
+      self.loaded = True
+
+  def _ensure_loaded(self):
+    if not self.loaded:
+      self.load()
+
+  def add_merchant(self, merchant):
+    with self.lock:
+      self.merchants[merchant.id] = merchant
+      self.merchant_moved(merchant)
+      self._index(merchant)
+
+  def remove_merchant(self, merchant):
+    with self.lock:
+      self.merchants.pop(merchant.id, None)
+      self._unindex(merchant.id)
+      self._unplace(merchant.id)
+
+  def _unplace(self, merchant_id):
+    room_id = self.rooms.pop(merchant_id, None)
+    if room_id is not None:
+      others = [other for other in self.by_room[room_id] if other.id != merchant_id]
+      if others:
+        self.by_room[room_id] = others
+      else:
+        del self.by_room[room_id]
+
+  def merchant_moved(self, merchant):
+    with self.lock:
+      self._unplace(merchant.id)
+      if merchant.location:
+        self.rooms[merchant.id] = merchant.location.id
+        self.by_room.setdefault(merchant.location.id, []).append(merchant)
+
+  def _unindex(self, merchant_id):
+    self._indexed.pop(merchant_id, None)
+    for lkey in [lkey for lkey, sellers in self.items.items() if merchant_id in sellers]:
+      del self.items[lkey][merchant_id]
+      if not self.items[lkey]:
+        del self.items[lkey]
+
+  def _index(self, merchant):
+    for_sale = merchant.for_sale()
+    if self._indexed.get(merchant.id) is for_sale:
+      return
+    self._unindex(merchant.id)
+    for key, price, _ in for_sale:
+      sellers = self.items.setdefault(key.lower(), {})
+      # a merchant's cheapest listing of an item is the one that counts
+      if merchant.id not in sellers or price < sellers[merchant.id][1]:
+        sellers[merchant.id] = (key, price)
+    self._indexed[merchant.id] = for_sale
+
+  def refresh(self):
+    """Re-index merchants whose wares changed since we last looked."""
+    with self.lock:
+      self._ensure_loaded()
+      for merchant in list(self.merchants.values()):
+        self._index(merchant)
+
+  def merchant_in(self, room):
+    if not room:
+      return None
+    with self.lock:
+      self._ensure_loaded()
+      merchants = self.by_room.get(room.id)
+    return merchants[0] if merchants else None
+
+  def where(self, key):
+    """[(item key, merchant, price)] for items whose keys start with key, cheapest first."""
+    key = key.lower()
+    with self.lock:
+      self.refresh()
+      listings = [
+        (item_key, self.merchants[merchant_id], price)
+        for lkey, sellers in self.items.items() if lkey.startswith(key)
+        for merchant_id, (item_key, price) in sellers.items()]
+    return sorted(listings, key=lambda listing: (listing[2], listing[0].lower()))
+
+  def snapshot(self):
+    """The whole market as JSON-able data, for the web."""
+    market = {}
+    with self.lock:
+      self.refresh()
+      for _, sellers in sorted(self.items.items()):
+        listings = []
+        for merchant_id, (key, price) in sellers.items():
+          merchant = self.merchants[merchant_id]
+          listings.append({
+            "merchant": merchant.key,
+            "room": merchant.location.key if merchant.location else None,
+            "price": price,
+          })
+        market[key] = sorted(listings, key=lambda listing: listing["price"])
+    return market
+
+
+MARKET = MarketIndex()
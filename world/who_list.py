@@ -0,0 +1,108 @@
+"""
+Who list snapshot
+
+One row per logged in session, kept up to date from the events that
+change what `who` shows (puppeting, moves, level, class and name
+changes) via who_changed(), instead of looking up every account, puppet,
+level and class whenever someone types `who`. Rendered tables are cached
+until the next change.
+
+Logins and logouts are picked up by comparing session ids against the
+session handler, which is in memory, so nothing breaks if a hook is
+missed there. The web views read this from their own threads, hence
+the lock.
+
+MSSP is answered by the portal process, which can't see this; the
+player count it reports comes from the portal's own session count.
+"""
+import threading
+from evennia.server.sessionhandler import SESSIONS
+
+
+# renders kept before the cache is flushed
+MAX_RENDERS = 32
+
+
+def session_row(session):
+  account = session.get_account()
+  puppet = session.get_puppet()
+  return {
+    "sessid": session.sessid,
+    "account": account.get_display_name(account),
+    "character": puppet.get_display_name(account) if puppet else None,
+    "level": puppet.level if hasattr(puppet, "level") else 0,
+    "class": puppet.classname if hasattr(puppet, "classname") else None,
+    "where": puppet.location.key if puppet and puppet.location else None,
+    "protocol": session.protocol_key,
+    "host": isinstance(session.address, tuple) and session.address[0] or session.address,
+    "conn_time": session.conn_time,
+    "session": session,
+  }
+
+
+class WhoList:
+  def __init__(self):
+    # sessid => row
+    self.rows = {}
+    self.version = 0
+    # render key => (version, rendered)
+    self._renders = {}
+    self.lock = threading.RLock()
+
+  def changed(self, obj):
+    """Refresh the rows of obj's sessions, obj being a character or account."""
+    sessions = obj.sessions.all()
+    with self.lock:
+      for session in sessions:
+        if session.sessid in self.rows:
+          self.rows[session.sessid] = session_row(session)
+      if sessions:
+        self.version += 1
+
+  def _sync_sessions(self):
+    sessions = {
+      session.sessid: session for session in SESSIONS.get_sessions() if session.logged_in}
+    if sessions.keys() == self.rows.keys():
+      return
+    for sessid in self.rows.keys() - sessions.keys():
+      del self.rows[sessid]
+    for sessid in sessions.keys() - self.rows.keys():
+      self.rows[sessid] = session_row(sessions[sessid])
+    self.version += 1
+
+  def snapshot(self):
+    """The current rows, sorted by account name."""
+    with self.lock:
+      self._sync_sessions()
+      return sorted(self.rows.values(), key=lambda row: row["session"].account.key)
+
+  def public_snapshot(self):
+    """The unprivileged view of snapshot(), safe to hand out as JSON."""
+    return [
+      {key: row[key] for key in ("account", "character", "level", "class", "where")}
+      for row in self.snapshot()]
+
+  def render(self, key, render_func):
+    """render_func(rows), cached by key until the who list changes.
+
+    Views that show ages (e.g. idle time) should put the current time,
+    at whatever resolution they display, in their key.
+    """
+    with self.lock:
+      rows = self.snapshot()
+      cached = self._renders.get(key)
+      if cached and cached[0] == self.version:
+        return cached[1]
+      if len(self._renders) >= MAX_RENDERS:
+        # mostly stale versions and past timestamps
+        self._renders.clear()
+      rendered = render_func(rows)
+      self._renders[key] = (self.version, rendered)
+      return rendered
+
+
+WHO_LIST = WhoList()
+
+
+def who_changed(obj):
+  WHO_LIST.changed(obj)
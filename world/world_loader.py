@@ -0,0 +1,482 @@
+"""
+World loader
+
+Builds all rooms and exits straight from the og_monster_data JSON, as a
+much faster alternative to running the generated world/build_*.ev batch
+files one command at a time. Everything is written with bulk inserts in a
+single transaction.
+
+From the game directory:
+
+  $ evennia shell
+  >>> from world import world_loader
+  >>> world_loader.build_world()
+
+Then apply the manual edits with: @batchcommands world.build_edits
+
+build_world() also stores a manifest of record hashes with the world. After
+editing og_monster_data, update_world() compares against that manifest and
+only creates, updates or deletes the rooms and exits whose records changed,
+and re-applies changed object prototypes to already spawned objects.
+Regenerate world/generated_object_prototypes.py and @reload first, then run
+it in-game so the live server's object cache sees the changes:
+
+  @py from world import world_loader; world_loader.update_world()
+"""
+import hashlib
+import json
+from django.conf import settings
+from django.db import transaction
+from evennia.objects.models import ObjectDB
+from evennia.prototypes import protlib, spawner
+from evennia.server.models import ServerConfig
+from evennia.utils import logger
+from gamerules.access_flag import AccessFlag
+from gamerules.commerce import clear_templates
+from gamerules.crafting import RECIPES
+from gamerules.exit_kind import ExitKind
+from gamerules.lairs import LAIRS
+from gamerules.special_rooms import SPECIAL_ROOMS
+from utils.data_generation.generator_utils import (
+  DEFAULT_MSG_ID, DESCS, LINES, OBJECTS, OBJECTS_BY_ID, ROOMDESCS,
+  index_by, lookup_description, split_integer)
+from world.bulk import (
+  bulk_add_aliases, bulk_add_attributes, bulk_create_objects, lockstring)
+from world.world_map import structure_changed
+
+
+# mirrors DefaultObject.basetype_setup(), which bulk creation skips
+BASE_LOCKS = {
+  "control": "perm(Developer)",
+  "examine": "perm(Builder)",
+  "view": "all()",
+  "edit": "perm(Admin)",
+  "delete": "perm(Admin)",
+  "get": "all()",
+  "drop": "holds()",
+  "call": "true()",
+  "tell": "perm(Admin)",
+  "puppet": "pperm(Developer)",
+  "teleport": "true()",
+  "teleport_here": "true()",
+}
+
+# mirrors DefaultRoom.basetype_setup()
+ROOM_LOCKS = dict(BASE_LOCKS,
+  get="false()", puppet="false()", teleport="false()", teleport_here="true()")
+
+# mirrors DefaultExit.basetype_setup()
+EXIT_LOCKS = dict(BASE_LOCKS,
+  puppet="false()", traverse="all()", get="false()", teleport="false()", teleport_here="false()")
+
+
+def room_alias(record_id):
+  return f"room_{record_id}"
+
+
+def room_spec(roomdesc, descs=DESCS, lines=LINES, objects_by_id=OBJECTS_BY_ID):
+  """The key, aliases and attributes for a room, as build_room*.py would make them."""
+  record_id = roomdesc["id"]
+  # start from the Room.at_object_creation() defaults
+  attrs = {
+    "record_id": record_id,
+    "secondary_desc": None,
+    "which_desc": 0,
+    "special_kind_bitmask": 0,
+    "magnitudes": [0] * 32,
+    "trap_chance": 0,
+    "trap_direction": None,
+    "magic_object": None,
+    "details": {},
+  }
+  desc_idx = roomdesc.get("primary", 0) - 1
+  if desc_idx >= 0 and desc_idx < len(descs):
+    attrs["desc"] = "\n".join(descs[desc_idx]["lines"])
+  if "secondary" in roomdesc:
+    secondary_desc = lookup_description(roomdesc["secondary"], descs, lines)
+    if secondary_desc:
+      attrs["secondary_desc"] = secondary_desc
+  if roomdesc["which"]:
+    attrs["which_desc"] = roomdesc["which"]
+  if roomdesc["magic_obj"]:
+    magic_obj = objects_by_id.get(roomdesc["magic_obj"])
+    if magic_obj:
+      attrs["magic_object"] = magic_obj["obj_name"]
+  if roomdesc["spc_room"]:
+    attrs["special_kind_bitmask"] = roomdesc["spc_room"]
+    attrs["magnitudes"] = list(roomdesc["magnitudes"])
+  if roomdesc["trap_chance"] and roomdesc["trap_direction"]:
+    attrs["trap_chance"] = roomdesc["trap_chance"]
+    attrs["trap_direction"] = roomdesc["trap_direction"]
+  details = roomdesc["details"]
+  detail_ids = roomdesc["detail_descs"]
+  if details and detail_ids:
+    detail_dict = {}
+    for detail, detail_id in zip(details, detail_ids):
+      detail_desc = lookup_description(detail_id, descs, lines)
+      if detail_desc:
+        detail_dict[detail] = detail_desc
+    attrs["details"] = detail_dict
+  return {
+    "key": roomdesc["nice_name"],
+    "aliases": [room_alias(record_id)],
+    "attrs": attrs,
+  }
+
+
+def nowhere_spec():
+  # an obvious non-destination for room id 0
+  spec = room_spec({
+    "id": 0, "nice_name": "NOWHERE", "which": 0, "magic_obj": 0, "spc_room": 0,
+    "trap_chance": 0, "trap_direction": None, "details": [], "detail_descs": []})
+  spec["attrs"]["record_id"] = None
+  return spec
+
+
+def _maybe_desc(attrs, attr_name, desc_id, descs, lines):
+  if not desc_id or desc_id == DEFAULT_MSG_ID:
+    return
+  attrs[attr_name] = lookup_description(desc_id, descs, lines)
+
+
+def exit_spec(exit, roomdescs=ROOMDESCS, descs=DESCS, lines=LINES, objects_by_id=OBJECTS_BY_ID):
+  """The key, aliases, attributes and locks for an exit, as build_exit*.py would make them."""
+  direction = exit["direction"]
+  to_loc = exit["to_loc"]
+  exit_kind = ExitKind(exit["kind"])
+  if not to_loc:
+    # there are some to_loc == 0 but exit_kind == OPEN exits in the data,
+    # so make sure we make them NO_EXIT to prevent anyone from using them
+    exit_kind = ExitKind.NO_EXIT
+
+  aliases = [direction[0]]
+  if exit["alias"]:
+    aliases.append(exit["alias"])
+
+  # start from the Exit.at_object_creation() defaults
+  attrs = {
+    "exit_kind": exit_kind.value,
+    "exit_desc": None,
+    "exit_effect_kind": None,
+    "exit_effect_value": None,
+    "fail_msg": None,
+    "success_msg": None,
+    "go_in_msg": None,
+    "come_out_msg": None,
+    "password": None,
+    "required_object": None,
+    "hiding": 0,
+    "hidden_desc": None,
+    "auto_look": True,
+    "access_flags": None,
+  }
+  if exit["auto_look"] == False:
+    attrs["auto_look"] = False
+  if exit["alias"]:
+    attrs["password"] = exit["alias"]
+
+  obj_req = None
+  if exit["obj_req"]:
+    obj_req = objects_by_id.get(exit["obj_req"])
+  if obj_req:
+    attrs["required_object"] = obj_req["obj_name"]
+
+  # there are several different flavors of invisible exit
+  locks = dict(EXIT_LOCKS)
+  if (exit_kind == ExitKind.NO_EXIT
+    or exit_kind == ExitKind.PASSWORDED
+    or exit["hidden"]):
+    locks["view"] = "none()"
+  elif exit_kind == ExitKind.ONLY_EXISTS_WITH_OBJECT and obj_req:
+    locks["view"] = f"holds({obj_req['obj_name']})"
+
+  # and several flavors of impassable exit
+  if (exit_kind == ExitKind.NO_EXIT
+    or exit_kind == ExitKind.PASSWORDED
+    or exit["req_alias"]
+    or exit["hidden"]):
+    locks["traverse"] = "none()"
+  elif exit_kind == ExitKind.OBJECT_REQUIRED and obj_req:
+    locks["traverse"] = f"holds({obj_req['obj_name']})"
+  elif exit_kind == ExitKind.OBJECT_FORBIDDEN and obj_req:
+    locks["traverse"] = f" NOT holds({obj_req['obj_name']})"
+  elif exit_kind == ExitKind.ONLY_EXISTS_WITH_OBJECT and obj_req:
+    locks["traverse"] = f"holds({obj_req['obj_name']})"
+
+  if exit["door_effect"]:
+    exit_effect_value, exit_effect_kind = split_integer(exit["door_effect"])
+    attrs["exit_effect_kind"] = exit_effect_kind
+    attrs["exit_effect_value"] = exit_effect_value
+
+  # hidden-but-searchable aka hidden, which uses access flags instead of
+  # locks (see Exit.access_flags)
+  if exit["hidden"]:
+    hidden_desc = lookup_description(exit["hidden"], descs, lines)
+    if hidden_desc:
+      attrs["hidden_desc"] = hidden_desc
+      attrs["hiding"] = 1
+      attrs["access_flags"] = int(AccessFlag.HIDDEN | AccessFlag.IMPASSABLE)
+      locks["view"] = "all()"
+      locks["traverse"] = "all()"
+
+  _maybe_desc(attrs, "exit_desc", exit["exit_desc"], descs, lines)
+  _maybe_desc(attrs, "fail_msg", exit["fail"], descs, lines)
+  _maybe_desc(attrs, "success_msg", exit["success"], descs, lines)
+  _maybe_desc(attrs, "go_in_msg", exit["go_in"], descs, lines)
+  # stupid slot / come_out msg logic
+  if exit["slot"] and to_loc:
+    come_out_exit = roomdescs[to_loc - 1]["exits"][exit["slot"] - 1]
+    _maybe_desc(attrs, "come_out_msg", come_out_exit["come_out"], descs, lines)
+
+  return {
+    "key": direction,
+    "aliases": aliases,
+    "attrs": attrs,
+    "locks": locks,
+    "to_loc": to_loc,
+  }
+
+
+def _create(specs, typeclass, locks, location_ids=None, destination_ids=None):
+  """Bulk create objects, their attributes and aliases from specs."""
+  rows = []
+  for idx, spec in enumerate(specs):
+    rows.append({
+      "db_key": spec["key"],
+      "db_typeclass_path": typeclass,
+      "db_lock_storage": lockstring(spec.get("locks", locks)),
+      "db_location_id": location_ids[idx] if location_ids else None,
+      "db_home_id": location_ids[idx] if location_ids else None,
+      "db_destination_id": destination_ids[idx] if destination_ids else None,
+    })
+  objs = bulk_create_objects(rows)
+  num_attrs = bulk_add_attributes([
+    (obj.id, key, value)
+    for obj, spec in zip(objs, specs) for key, value in spec["attrs"].items()])
+  bulk_add_aliases([
+    (obj.id, alias) for obj, spec in zip(objs, specs) for alias in spec["aliases"]])
+  return objs, num_attrs
+
+
+MANIFEST_KEY = "world_manifest"
+
+
+def record_hash(data):
+  """A stable hash of some json-able data."""
+  encoded = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+  return hashlib.sha1(encoded).hexdigest()
+
+
+def world_specs(roomdescs=ROOMDESCS, descs=DESCS, lines=LINES, objects=OBJECTS):
+  """Map record id => (room spec, exit specs) for every room, incl. NOWHERE."""
+  specs = {0: (nowhere_spec(), [])}
+  objects_by_id = OBJECTS_BY_ID if objects is OBJECTS else index_by(objects, "id")
+  for roomdesc in roomdescs:
+    specs[roomdesc["id"]] = (
+      room_spec(roomdesc, descs, lines, objects_by_id),
+      [exit_spec(exit, roomdescs, descs, lines, objects_by_id) for exit in roomdesc["exits"]])
+  return specs
+
+
+def make_manifest(specs, objects=OBJECTS):
+  """Hash everything a room's specs were built from, plus every object record.
+
+  Room hashes cover the generated specs rather than the raw roomdesc record,
+  since a room's exits also pull in descriptions from neighbouring rooms.
+  """
+  return {
+    "rooms": {
+      str(record_id): record_hash([room, exits])
+      for record_id, (room, exits) in specs.items()},
+    "objects": {str(obj["id"]): record_hash(obj) for obj in objects},
+  }
+
+
+def load_manifest():
+  return ServerConfig.objects.conf(MANIFEST_KEY, default=None)
+
+
+def save_manifest(manifest):
+  ServerConfig.objects.conf(MANIFEST_KEY, manifest)
+
+
+def build_world(roomdescs=None, descs=None, lines=None, objects=None):
+  """Create every room and exit in one transaction; returns a summary dict.
+
+  Expects a world without previously built rooms. The data arguments
+  default to the og_monster_data JSON, and can be overridden in tests.
+  """
+  roomdescs = ROOMDESCS if roomdescs is None else roomdescs
+  descs = DESCS if descs is None else descs
+  lines = LINES if lines is None else lines
+  objects = OBJECTS if objects is None else objects
+
+  specs = world_specs(roomdescs, descs, lines, objects)
+  room_specs = [room for room, _ in specs.values()]
+  with transaction.atomic():
+    rooms, num_room_attrs = _create(room_specs, settings.BASE_ROOM_TYPECLASS, ROOM_LOCKS)
+    # record id => room dbid
+    room_ids = {record_id: room.id for record_id, room in zip(specs.keys(), rooms)}
+
+    exit_specs, location_ids, destination_ids = [], [], []
+    for record_id, (_, exits) in specs.items():
+      for spec in exits:
+        exit_specs.append(spec)
+        location_ids.append(room_ids[record_id])
+        destination_ids.append(room_ids.get(spec["to_loc"], room_ids[0]))
+    exits, num_exit_attrs = _create(
+      exit_specs, settings.BASE_EXIT_TYPECLASS, EXIT_LOCKS, location_ids, destination_ids)
+    save_manifest(make_manifest(specs, objects))
+  # rooms were bulk inserted without their creation hooks
+  SPECIAL_ROOMS.reload()
+  LAIRS.reload()
+  structure_changed()
+
+  summary = {
+    "rooms": len(rooms),
+    "exits": len(exits),
+    "attributes": num_room_attrs + num_exit_attrs,
+  }
+  logger.log_info(f"build_world: {summary}")
+  return summary
+
+
+def diff_manifests(old, new):
+  """Return (created, changed, deleted) sets of record id strings."""
+  created = new.keys() - old.keys()
+  deleted = old.keys() - new.keys()
+  changed = {key for key in new.keys() & old.keys() if new[key] != old[key]}
+  return created, changed, deleted
+
+
+def existing_room_ids():
+  """Map record id => room dbid for all built rooms, via their room_<id> aliases."""
+  rows = ObjectDB.objects.filter(
+    db_typeclass_path=settings.BASE_ROOM_TYPECLASS,
+    db_tags__db_tagtype="alias",
+    db_tags__db_key__startswith="room_").values_list("id", "db_tags__db_key")
+  room_ids = {}
+  for dbid, alias in rows:
+    record_id = alias[len("room_"):]
+    if record_id.isdigit():
+      room_ids[int(record_id)] = dbid
+  return room_ids
+
+
+def _apply_spec(obj, spec, locks):
+  """Bring an existing room or exit in line with its spec."""
+  if obj.key != spec["key"]:
+    obj.key = spec["key"]
+  if sorted(obj.aliases.all()) != sorted(alias.lower() for alias in spec["aliases"]):
+    obj.aliases.clear()
+    obj.aliases.add(spec["aliases"])
+  obj.attributes.batch_add(*spec["attrs"].items())
+  obj.locks.replace(lockstring(spec.get("locks", locks)))
+
+
+def _update_room(room, exit_specs, room_ids):
+  """Update a room's exits, creating any missing ones and deleting extras."""
+  exits = {exit.key: exit for exit in room.exits}
+  missing = []
+  for spec in exit_specs:
+    destination_id = room_ids.get(spec["to_loc"], room_ids[0])
+    exit = exits.pop(spec["key"], None)
+    if not exit:
+      missing.append((spec, destination_id))
+      continue
+    _apply_spec(exit, spec, EXIT_LOCKS)
+    exit.exit_changed()
+    if exit.destination is None or exit.destination.id != destination_id:
+      exit.destination = ObjectDB.objects.get(id=destination_id)
+  if missing:
+    _create(
+      [spec for spec, _ in missing], settings.BASE_EXIT_TYPECLASS, EXIT_LOCKS,
+      [room.id] * len(missing), [destination_id for _, destination_id in missing])
+  for exit in exits.values():
+    exit.delete()
+
+
+def update_world(roomdescs=None, descs=None, lines=None, objects=None, dry_run=False):
+  """Apply just the og_monster_data records that changed since the last build.
+
+  Compares record hashes against the manifest saved by build_world() (or a
+  previous update_world()), then creates, updates and deletes only the
+  affected rooms and exits, and re-applies changed object prototypes to
+  their spawned objects. With dry_run, only reports what would change.
+  Returns a summary dict.
+  """
+  roomdescs = ROOMDESCS if roomdescs is None else roomdescs
+  descs = DESCS if descs is None else descs
+  lines = LINES if lines is None else lines
+  objects = OBJECTS if objects is None else objects
+
+  old_manifest = load_manifest()
+  if not old_manifest:
+    raise RuntimeError("No world manifest found, run build_world() first.")
+  specs = world_specs(roomdescs, descs, lines, objects)
+  manifest = make_manifest(specs, objects)
+
+  created, changed, deleted = diff_manifests(old_manifest["rooms"], manifest["rooms"])
+  created = {int(record_id) for record_id in created}
+  changed = {int(record_id) for record_id in changed}
+  deleted = {int(record_id) for record_id in deleted}
+  # exits leading to created or deleted rooms need a new destination
+  for record_id, (_, exits) in specs.items():
+    if any(spec["to_loc"] in created | deleted for spec in exits):
+      changed.add(record_id)
+  changed -= created
+
+  objs_created, objs_changed, objs_deleted = diff_manifests(
+    old_manifest["objects"], manifest["objects"])
+  updated_objs = sorted(int(record_id) for record_id in objs_created | objs_changed)
+
+  summary = {
+    "rooms_created": len(created),
+    "rooms_updated": len(changed),
+    "rooms_deleted": len(deleted),
+    "prototypes_updated": len(updated_objs),
+    "prototypes_removed": len(objs_deleted),
+    "objects_updated": 0,
+  }
+  if dry_run:
+    return summary
+
+  with transaction.atomic():
+    room_ids = existing_room_ids()
+    # deleting a room also deletes its exits and sends occupants home
+    for record_id in deleted:
+      if record_id in room_ids:
+        ObjectDB.objects.get(id=room_ids.pop(record_id)).delete()
+
+    new_ids = sorted(created)
+    rooms, _ = _create(
+      [specs[record_id][0] for record_id in new_ids], settings.BASE_ROOM_TYPECLASS, ROOM_LOCKS)
+    room_ids.update(zip(new_ids, [room.id for room in rooms]))
+
+    for record_id in sorted(changed | created):
+      room = ObjectDB.objects.get(id=room_ids[record_id])
+      spec, exit_specs = specs[record_id]
+      if record_id in changed:
+        _apply_spec(room, spec, ROOM_LOCKS)
+      _update_room(room, exit_specs, room_ids)
+
+    # prototypes live in generated code, so here we only push prototype
+    # changes out to objects already spawned from them
+    for record_id in updated_objs:
+      for prototype in protlib.search_prototype(tags=f"record_id_{record_id}"):
+        summary["objects_updated"] += spawner.batch_update_objects_with_prototype(prototype)
+    if updated_objs:
+      # merchants sell from snapshots of spawned objects
+      clear_templates()
+      RECIPES.reload()
+    for record_id in objs_deleted:
+      logger.log_warn(
+        f"update_world: object record {record_id} was removed, its spawned objects are untouched")
+
+    save_manifest(manifest)
+  SPECIAL_ROOMS.reload()
+  LAIRS.reload()
+  structure_changed()
+
+  logger.log_info(f"update_world: {summary}")
+  return summary
@@ -0,0 +1,95 @@
+"""
+World map
+
+Builds per-zone room graphs from the live world for the web map (see
+web/world_map.py). Zone membership comes from the room name lists in
+utils/zones, the same ones utils/maps/dot_file_generator.py uses.
+
+Laying out a zone is expensive, so callers cache layouts by
+structure_version(), which rooms and exits bump when they are created or
+deleted.
+"""
+import os
+from django.conf import settings
+from evennia.objects.models import ObjectDB
+from gamerules.access_flag import AccessFlag
+from gamerules.find import is_hidden
+
+
+ZONES_DIR = os.path.join(settings.GAME_DIR, "utils", "zones")
+MOB_TYPECLASS = "typeclasses.mobs.Mob"
+
+# bumped whenever rooms or exits come or go
+_structure_version = 0
+
+# zone => set of room names, loaded once
+_zone_room_names = {}
+
+
+def structure_version():
+  return _structure_version
+
+
+def structure_changed():
+  global _structure_version
+  _structure_version += 1
+
+
+def zones():
+  """Sorted list of zone names."""
+  return sorted(
+    filename[:-len(".txt")] for filename in os.listdir(ZONES_DIR) if filename.endswith(".txt"))
+
+
+def zone_room_names(zone):
+  if zone not in _zone_room_names:
+    with open(os.path.join(ZONES_DIR, f"{zone}.txt")) as f:
+      _zone_room_names[zone] = {line.strip() for line in f if line.strip()}
+  return _zone_room_names[zone]
+
+
+def zone_rooms(zone):
+  """All live rooms in a zone, ordered by dbid."""
+  return list(ObjectDB.objects.filter(
+    db_typeclass_path=settings.BASE_ROOM_TYPECLASS,
+    db_key__in=zone_room_names(zone)).order_by("id"))
+
+
+def zone_dot(rooms):
+  """A DOT graph of rooms and the exits between them, keyed by room dbid."""
+  room_ids = {room.id for room in rooms}
+  lines = ["digraph monster {"]
+  for room in rooms:
+    label = room.key.replace('"', '\\"')
+    lines.append(f'room_{room.id} [id="room_{room.id}" label="{label}"];')
+    for exit in room.exits:
+      if (exit.db.access_flags or 0) & AccessFlag.HIDDEN:
+        # the map is public; hidden exits are for finding in game. By
+        # their resting state, so finding one doesn't change the layout
+        continue
+      destination = exit.destination
+      if destination and destination.id in room_ids:
+        lines.append(f'room_{room.id} -> room_{destination.id} [label="{exit.key[0]}"];')
+  lines.append("}")
+  return "\n".join(lines)
+
+
+def occupancy(rooms):
+  """Map room dbid => (players, mobs) for rooms with anyone in them.
+
+  Only looks at the in-memory contents of each room, so it doesn't query
+  the database. Anyone hiding isn't counted.
+  """
+  counts = {}
+  for room in rooms:
+    players = mobs = 0
+    for obj in room.contents:
+      if is_hidden(obj):
+        continue
+      if obj.has_account:
+        players += 1
+      elif obj.is_typeclass(MOB_TYPECLASS, exact=False):
+        mobs += 1
+    if players or mobs:
+      counts[room.id] = (players, mobs)
+  return counts